@@ -73,12 +73,16 @@ class InterpND(object):
         method.
     _interp_options : dict
         Dictionary of cached interpolator-specific options.
+    _precompute_coeffs : bool
+        If True, the polynomial coefficients of every grid cell are computed before the first
+        interpolation, and used for interpolation when derivatives with respect to the values
+        aren't needed.
     _xi : ndarray
         Cache of current evaluation point.
     """
 
     def __init__(self, method="slinear", points=None, values=None, x_interp=None, extrapolate=False,
-                 num_cp=None, **kwargs):
+                 num_cp=None, precompute_coeffs=False, **kwargs):
         """
         Initialize instance of interpolation class.
 
@@ -101,6 +105,10 @@ class InterpND(object):
         num_cp : None or int
             Optional. When specified, use a linear distribution of num_cp control points. If you
             are using 'bsplines' as the method, then num_cp must be set instead of points.
+        precompute_coeffs : bool
+            If True, precompute the polynomial coefficients of every grid cell, which needs more
+            memory but speeds up the interpolation. Supported by the 'slinear', 'cubic', and
+            'akima' methods.
         **kwargs : dict
             Interpolator-specific options to pass onward.
         """
@@ -176,9 +184,14 @@ class InterpND(object):
 
         table = interp(self.grid, values, interp, **kwargs)
         table.check_config()
+
+        if precompute_coeffs and table._num_coeffs is None:
+            raise ValueError("Method '%s' does not support precomputed coefficients." % method)
+
         self.table = table
         self._interp = interp
         self._interp_options = kwargs
+        self._precompute_coeffs = precompute_coeffs
 
     def interpolate(self, x, compute_derivative=False):
         """
@@ -289,9 +302,15 @@ class InterpND(object):
             self.table._compute_d_dvalues = True
 
         table = self.table
+        if self._precompute_coeffs and table._coeffs is None and not self._compute_d_dvalues:
+            table.compute_coefficients()
+
         if table._vectorized:
             result, derivs_x, derivs_val, derivs_grid = table.evaluate_vectorized(xi)
 
+        elif table._vectorized_points:
+            result, derivs_x, derivs_val, _ = table.evaluate_vectorized(np.atleast_2d(xi))
+
         else:
             xi = np.atleast_2d(xi)
             n_nodes, nx = xi.shape
@@ -383,6 +402,15 @@ class InterpND(object):
                 table._compute_d_dvalues = True
                 table._compute_d_dx = False
 
+                if table._vectorized_points:
+                    result[j, :], _, d_values, _ = table.evaluate_vectorized(xi.reshape((nx, 1)))
+                    if derivs_val is None:
+                        dv_shape = [n_nodes, nx]
+                        dv_shape.extend(values.shape[1:])
+                        derivs_val = np.zeros(dv_shape, dtype=values.dtype)
+                    derivs_val[j] = d_values
+                    continue
+
                 for k in range(nx):
                     x_pt = np.atleast_2d(xi[k])
                     val, _, d_values, _ = table.evaluate(x_pt)
@@ -423,12 +451,17 @@ class InterpND(object):
         Returns
         -------
         gradient : ndarray of shape (..., ndim)
-            Vector of gradients of the interpolated values with respect to each value in xi.
+            Vector of gradients of the interpolated values with respect to each value in xi. If
+            the values have more dimensions than the grid, the gradient has shape
+            (n_points, ..., ndim), with the trailing dimensions of the values in the middle.
         """
         if (self._xi is None) or (not np.array_equal(xi, self._xi)):
             # If inputs have changed since last computation, then re-interpolate.
             self.interpolate(xi)
 
+        if self.values.ndim > len(self.grid):
+            return self._d_dx
+
         return self._d_dx.reshape(np.asarray(xi).shape)
 
     def training_gradients(self, pt):
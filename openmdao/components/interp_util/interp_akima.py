@@ -98,6 +98,9 @@ class InterpAkima(InterpAlgorithm):
         super().__init__(grid, values, interp, **kwargs)
         self.k = 4
         self._name = 'akima'
+        self._vectorized_points = True
+        self._num_coeffs = 4
+        self._extrap_linear = True
 
     def initialize(self):
         """
@@ -724,3 +727,195 @@ class InterpAkima(InterpAlgorithm):
 
         # Evaluate dependent value and exit
         return a + dx * (b + dx * (c + dx * d)), deriv_dx, deriv_dv, None
+
+    def stencil_vectorized(self, x):
+        """
+        Compute the interval and the range of grid indices needed to interpolate each point.
+
+        Parameters
+        ----------
+        x : ndarray
+            The coordinates in this table dimension of all requested samples.
+
+        Returns
+        -------
+        ndarray of int
+            Interval index for each x.
+        ndarray of int
+            First grid index used to interpolate each x.
+        int
+            Number of consecutive grid indices used to interpolate each x.
+        """
+        idx, _ = self.bracket_vectorized(x)
+
+        # Extrapolate high
+        ngrid = len(self.grid)
+        idx[idx == ngrid - 1] = ngrid - 2
+
+        # Up to two points below and four points above the interval lower bracket.
+        width = min(6, ngrid)
+        low = np.clip(idx - 2, 0, ngrid - width)
+
+        return idx, low, width
+
+    def interpolate_vectorized(self, x, idx, low, values):
+        """
+        Compute the interpolated values over this grid dimension for all requested samples.
+
+        Parameters
+        ----------
+        x : ndarray
+            The coordinates in this table dimension of all requested samples.
+        idx : ndarray of int
+            Interval index for each x.
+        low : ndarray of int
+            First grid index used to interpolate each x.
+        values : ndarray
+            Table values at the grid indices used by each x, with shape (n_points, ..., width).
+
+        Returns
+        -------
+        ndarray
+            Interpolated values, with shape (n_points, ...).
+        ndarray
+            Derivative of interpolated values with respect to x.
+        ndarray
+            Derivative of interpolated values with respect to the values.
+        """
+        grid = self.grid
+        eps = self.options['eps']
+        delta_x = self.options['delta_x']
+        ngrid = len(grid)
+        n_nodes = len(x)
+        width = values.shape[-1]
+
+        def expand(arr):
+            # Reshape a per-point array so that it broadcasts against the values.
+            return arr.reshape((n_nodes, ) + (1, ) * (values.ndim - 2) + arr.shape[1:])
+
+        def take(arr, pos):
+            # Select the entry at a per-point position along the last axis.
+            return np.take_along_axis(arr, expand(pos)[..., np.newaxis], axis=-1)[..., 0]
+
+        def absolute(arr, d_arr):
+            # Absolute value of arr, and its derivative with respect to the values.
+            real = arr.real
+            if delta_x > 0:
+                val = np.where(real <= -delta_x, -arr,
+                               np.where(real >= delta_x, arr,
+                                        arr * arr / (2.0 * delta_x) + 0.5 * delta_x))
+                slope = np.where(real <= -delta_x, -1.0,
+                                 np.where(real >= delta_x, 1.0, arr / delta_x))
+            else:
+                slope = np.where(real < 0, -1.0, 1.0)
+                val = slope * arr
+            return val, slope[..., np.newaxis] * d_arr
+
+        # Slopes of all intervals in the stencil, and their derivatives with respect to the
+        # values. These derivatives carry an extra trailing axis for the stencil.
+        grid_pts = grid[low[:, np.newaxis] + np.arange(width)]
+        r_dgrid = 1.0 / np.diff(grid_pts, axis=-1)
+        slopes = np.diff(values, axis=-1) * expand(r_dgrid)
+
+        eye = np.eye(width)
+        d_slopes = (eye[1:] - eye[:-1]) * r_dgrid[..., np.newaxis]
+
+        # m1 through m5 are the slopes of intervals (xi-2, xi-1) through (xi+2, xi+3). Missing
+        # slopes are zero until they are extrapolated below.
+        pos = idx - low
+        rows = np.arange(n_nodes)
+        m = []
+        dm = []
+        for j in range(-2, 3):
+            pos_j = pos + j
+            valid = (pos_j >= 0) & (pos_j <= width - 2)
+            pos_j = np.clip(pos_j, 0, width - 2)
+            m.append(np.where(expand(valid), take(slopes, pos_j), 0.0))
+            dm.append(expand(np.where(valid[:, np.newaxis], d_slopes[rows, pos_j], 0.0)))
+
+        m1, m2, m3, m4, m5 = m
+        dm1, dm2, dm3, dm4, dm5 = dm
+
+        # Extrapolate the missing slopes at either end of the table, with the same precedence as
+        # the scalar interpolate method.
+        at_0 = idx == 0
+        at_1 = (idx == 1) & ~at_0
+        at_n3 = (idx == ngrid - 3) & ~at_0 & ~at_1
+        at_n2 = (idx == ngrid - 2) & ~at_0 & ~at_1 & ~at_n3
+
+        def where(cond, arr, other):
+            # Select per point, for either a value or its derivative with respect to the values.
+            cond = expand(cond)
+            if arr.ndim == values.ndim:
+                cond = cond[..., np.newaxis]
+            return np.where(cond, arr, other)
+
+        m2, dm2 = where(at_0, 2 * m3 - m4, m2), where(at_0, 2 * dm3 - dm4, dm2)
+        m1, dm1 = where(at_0 | at_1, 2 * m2 - m3, m1), where(at_0 | at_1, 2 * dm2 - dm3, dm1)
+        m4, dm4 = where(at_n2, 2 * m3 - m2, m4), where(at_n2, 2 * dm3 - dm2, dm4)
+        m5, dm5 = (where(at_n3 | at_n2, 2 * m4 - m3, m5),
+                   where(at_n3 | at_n2, 2 * dm4 - dm3, dm5))
+
+        # Calculate cubic fit coefficients
+        old_settings = np.seterr(invalid='ignore', divide='ignore')
+
+        w2, dw2 = absolute(m4 - m3, dm4 - dm3)
+        w31, dw31 = absolute(m2 - m1, dm2 - dm1)
+        sum1 = w2 + w31
+        jj1 = (sum1.real > eps)[..., np.newaxis]
+        bpos = (m2 * w2 + m3 * w31) / sum1
+        dbpos = (dm2 * w2[..., np.newaxis] + m2[..., np.newaxis] * dw2 +
+                 dm3 * w31[..., np.newaxis] + m3[..., np.newaxis] * dw31 -
+                 bpos[..., np.newaxis] * (dw2 + dw31)) / sum1[..., np.newaxis]
+        b = np.where(jj1[..., 0], bpos, 0.5 * (m2 + m3))
+        db = np.where(jj1, dbpos, 0.5 * (dm2 + dm3))
+
+        w32, dw32 = absolute(m5 - m4, dm5 - dm4)
+        w4, dw4 = absolute(m3 - m2, dm3 - dm2)
+        sum2 = w32 + w4
+        jj2 = (sum2.real > eps)[..., np.newaxis]
+        bp1pos = (m3 * w32 + m4 * w4) / sum2
+        dbp1pos = (dm3 * w32[..., np.newaxis] + m3[..., np.newaxis] * dw32 +
+                   dm4 * w4[..., np.newaxis] + m4[..., np.newaxis] * dw4 -
+                   bp1pos[..., np.newaxis] * (dw32 + dw4)) / sum2[..., np.newaxis]
+        bp1 = np.where(jj2[..., 0], bp1pos, 0.5 * (m3 + m4))
+        dbp1 = np.where(jj2, dbp1pos, 0.5 * (dm3 + dm4))
+
+        np.seterr(**old_settings)
+
+        val3 = take(values, pos)
+        val4 = take(values, pos + 1)
+        dval3 = expand(eye[pos])
+        dval4 = expand(eye[pos + 1])
+
+        h = expand(1.0 / (grid[idx + 1] - grid[idx]))
+        c = (3 * m3 - 2 * b - bp1) * h
+        d = (b + bp1 - 2 * m3) * h * h
+        dc = (3 * dm3 - 2 * db - dbp1) * h[..., np.newaxis]
+        dd = (db + dbp1 - 2 * dm3) * (h * h)[..., np.newaxis]
+
+        # Off either end of the table, extrapolate linearly from the end point.
+        x_real = x.real
+        extrap_high = expand(x_real > grid[-1])
+        extrap_low = expand((idx == 0) & (x_real < grid[0]))
+        extrap = extrap_high | extrap_low
+        extrap_n = extrap[..., np.newaxis]
+
+        a = np.where(extrap_high, val4, val3)
+        da = np.where(extrap_high[..., np.newaxis], dval4, dval3)
+        b = np.where(extrap_high, bp1, b)
+        db = np.where(extrap_high[..., np.newaxis], dbp1, db)
+        c = np.where(extrap, 0.0, c)
+        d = np.where(extrap, 0.0, d)
+        dc = np.where(extrap_n, 0.0, dc)
+        dd = np.where(extrap_n, 0.0, dd)
+
+        dx = expand(x) - np.where(extrap_high, expand(grid[idx + 1]),
+                                  np.where(extrap_low, grid[0], expand(grid[idx])))
+        dx_n = dx[..., np.newaxis]
+
+        val = a + dx * (b + dx * (c + dx * d))
+        d_dx = b + dx * (2.0 * c + 3.0 * d * dx)
+        d_dvalues = da + dx_n * (db + dx_n * (dc + dx_n * dd))
+
+        return val, d_dx, d_dvalues
@@ -1,8 +1,47 @@
 """
 Base class for interpolation methods.  New methods should inherit from this class.
 """
+import numpy as np
+
 from openmdao.utils.options_dictionary import OptionsDictionary
 
+# Maximum number of table values gathered at once by evaluate_vectorized.
+_MAX_GATHER_SIZE = 2 ** 20
+
+# Largest deviation of the grid points from uniform spacing, relative to the spacing, for which
+# the intervals are located arithmetically instead of by searching the grid.
+_UNIFORM_GRID_TOL = 1e-6
+
+
+def _uniform_step(grid):
+    """
+    Return the spacing of the grid points if they are uniformly spaced.
+
+    Parameters
+    ----------
+    grid : ndarray
+        Grid locations in one dimension.
+
+    Returns
+    -------
+    float or None
+        Spacing between the grid points, or None if they are not uniformly spaced.
+    """
+    grid = np.asarray(grid)
+    n_p = len(grid)
+    if grid.ndim != 1 or n_p < 2:
+        return None
+
+    step = (grid[-1] - grid[0]) / (n_p - 1)
+    if step <= 0.0:
+        return None
+
+    deviation = np.max(np.abs(grid - (grid[0] + step * np.arange(n_p))))
+    if deviation > _UNIFORM_GRID_TOL * step:
+        return None
+
+    return step
+
 
 class InterpAlgorithm(object):
     """
@@ -28,10 +67,28 @@ class InterpAlgorithm(object):
         When set to True, compute gradients with respect to the interpolated point location.
     _full_slice : tuple of <Slice>
         Used to cache the full slice if training derivatives are computed.
+    _coeff_dim : int
+        First table dimension spanned by the precomputed coefficients.
+    _coeffs : ndarray or None
+        Precomputed polynomial coefficients of the interpolant in every grid cell.
+    _extrap_linear : bool
+        If True, this method extrapolates linearly from the end points of the table instead of
+        continuing the polynomials of the end cells.
+    _linear_in_values : bool
+        If True, the interpolated values are a linear function of the table values.
     _name : str
         Algorithm name for error messages.
+    _num_coeffs : int or None
+        Number of polynomial coefficients in each grid cell, if this method supports a table of
+        precomputed coefficients.
+    _uniform_step : float or None
+        Spacing of the grid points if they are uniformly spaced, so that the intervals can be
+        located arithmetically.
     _vectorized :bool
         If True, this method is vectorized and can simultaneously solve multiple interpolations.
+    _vectorized_points : bool
+        If True, this method implements stencil_vectorized and interpolate_vectorized, so
+        evaluate_vectorized can interpolate all requested points at once.
     """
 
     def __init__(self, grid, values, interp, **kwargs):
@@ -65,9 +122,16 @@ class InterpAlgorithm(object):
         self.k = None
         self._name = None
         self._vectorized = False
+        self._vectorized_points = False
         self._compute_d_dvalues = False
         self._compute_d_dx = True
         self._full_slice = None
+        self._uniform_step = _uniform_step(self.grid)
+        self._num_coeffs = None
+        self._linear_in_values = False
+        self._extrap_linear = False
+        self._coeffs = None
+        self._coeff_dim = None
 
     def initialize(self):
         """
@@ -101,6 +165,9 @@ class InterpAlgorithm(object):
               inc has an increasing value of 1,2,4,8, etc.
            3. Once the value is bracketed, use bisection method within that bracket.
 
+        If the grid is uniformly spaced, a value inside the table is located directly from the
+        spacing instead.
+
         The grid is assumed to increase in a monotonic fashion.
 
         Parameters
@@ -117,9 +184,23 @@ class InterpAlgorithm(object):
             bracket is above the last table element, 0 for normal interpolation.
         """
         grid = self.grid
+        highbound = len(grid) - 1
+
+        step = self._uniform_step
+        if step is not None and grid[0] <= x <= grid[highbound]:
+            idx = min(int((x.real - grid[0]) / step), highbound - 1)
+
+            # Correct for roundoff in the grid locations. Points that lie on an interior grid point
+            # are placed in the interval below it, as in bracket_vectorized.
+            if idx > 0 and x <= grid[idx]:
+                idx -= 1
+            elif idx < highbound - 1 and x > grid[idx + 1]:
+                idx += 1
+
+            return idx, 0
+
         last_index = self.last_index
         high = last_index + 1
-        highbound = len(grid) - 1
         inc = 1
 
         while x < grid[last_index]:
@@ -234,3 +315,416 @@ class InterpAlgorithm(object):
             dimensions.
         """
         pass
+
+    def bracket_vectorized(self, x):
+        """
+        Locate the intervals of an array of new independents.
+
+        Points that lie on an interior grid point are placed in the interval below it. If the grid
+        is uniformly spaced, the intervals are computed from the spacing instead of searching the
+        grid.
+
+        Parameters
+        ----------
+        x : ndarray
+            Values of new independents to interpolate.
+
+        Returns
+        -------
+        ndarray of int
+            Grid interval index that contains each x. This is the last grid index for points above
+            the table.
+        ndarray of int
+            Extrapolation flag for each x, -1 if the bracket is below the first table element, 1 if
+            the bracket is above the last table element, 0 for normal interpolation.
+        """
+        grid = self.grid
+        x = x.real
+
+        step = self._uniform_step
+        if step is None:
+            idx = np.searchsorted(grid, x, side='left') - 1
+            idx[idx < 0] = 0
+
+        else:
+            high = len(grid) - 1
+            with np.errstate(invalid='ignore'):
+                idx = np.floor((x - grid[0]) / step)
+
+            # NaNs are placed at the top of the table, as they are by searchsorted.
+            idx = np.fmax(np.fmin(idx, high), 0).astype(int)
+
+            # Correct for roundoff in the grid locations.
+            idx -= (idx > 0) & (x <= grid[idx])
+            idx += (idx < high) & (x > grid[np.minimum(idx + 1, high)])
+
+        extrap = np.zeros(idx.shape, dtype=int)
+        extrap[x < grid[0]] = -1
+        extrap[x > grid[-1]] = 1
+
+        return idx, extrap
+
+    def evaluate_vectorized(self, x):
+        """
+        Interpolate across all table dimensions for all requested samples.
+
+        The table values needed by each point are gathered, and then each dimension is
+        interpolated in turn, starting with the last one. If the values have more dimensions than
+        the grid, the trailing dimensions are interpolated together (e.g., several outputs that
+        share a grid), and the interpolated values and their derivatives with respect to the
+        independents gain those dimensions after the first one. Derivatives with respect to the
+        values are only computed when the values have the same shape as the grid.
+
+        If the polynomial coefficients of the grid cells have been precomputed, the coefficients
+        of the cell containing each point are gathered instead of the table values for the
+        dimensions that they span, unless derivatives with respect to the values are requested.
+
+        Parameters
+        ----------
+        x : ndarray of shape (n_points, n_dims)
+            The coordinates to sample the gridded data at.
+
+        Returns
+        -------
+        ndarray
+            Interpolated values.
+        ndarray
+            Derivative of interpolated values with respect to the independents.
+        ndarray or None
+            Derivative of interpolated values with respect to values, if requested.
+        ndarray
+            Derivative of interpolated values with respect to grid.
+        """
+        x = np.atleast_2d(x)
+        n_nodes = x.shape[0]
+
+        tables = [self]
+        while tables[-1].subtable is not None:
+            tables.append(tables[-1].subtable)
+
+        stencils = [table.stencil_vectorized(x[:, i]) for i, table in enumerate(tables)]
+
+        start = len(tables)
+        if self._coeffs is not None and not self._compute_d_dvalues:
+            # Each point needs the coefficients of one cell in each of these dimensions.
+            start = self._coeff_dim
+            for i in range(start, len(tables)):
+                idx = stencils[i][0]
+                num_coeffs = tables[i]._num_coeffs
+                stencils[i] = (idx, idx * num_coeffs, num_coeffs)
+
+        # Limit the size of the gathered values for methods like cubic, which need the whole table.
+        n_gather = np.prod([width for _, _, width in stencils]) * \
+            np.prod(self.values.shape[len(tables):], dtype=int)
+        chunk = max(1, _MAX_GATHER_SIZE // n_gather)
+        if n_nodes <= chunk:
+            return self._evaluate_stencils(x, tables, stencils, start)
+
+        result = []
+        d_dx = []
+        d_values = []
+        for j in range(0, n_nodes, chunk):
+            sub = slice(j, j + chunk)
+            sub_stencils = [(idx[sub], low[sub], width) for idx, low, width in stencils]
+            val, dx, dv, _ = self._evaluate_stencils(x[sub], tables, sub_stencils, start)
+            result.append(val)
+            d_dx.append(dx)
+            d_values.append(dv)
+
+        d_dx = np.concatenate(d_dx)
+        d_values = np.concatenate(d_values) if d_values[0] is not None else None
+
+        return np.concatenate(result), d_dx, d_values, None
+
+    def _evaluate_stencils(self, x, tables, stencils, start):
+        """
+        Interpolate across all table dimensions using precomputed stencils.
+
+        Parameters
+        ----------
+        x : ndarray of shape (n_points, n_dims)
+            The coordinates to sample the gridded data at.
+        tables : list of <InterpAlgorithm>
+            This table and all of its subtables.
+        stencils : list of tuple
+            Interval index, first grid index, and number of grid indices needed for each point in
+            each table dimension.
+        start : int
+            First table dimension whose stencil indexes the precomputed coefficients instead of
+            the table values.
+
+        Returns
+        -------
+        ndarray
+            Interpolated values.
+        ndarray
+            Derivative of interpolated values with respect to the independents.
+        ndarray or None
+            Derivative of interpolated values with respect to values, if requested.
+        ndarray
+            Derivative of interpolated values with respect to grid.
+        """
+        n_nodes, nx = x.shape
+
+        # Index the values needed by each point as an array of shape (n_points, w1, ..., wn).
+        index = [np.arange(n_nodes).reshape((n_nodes, ) + (1, ) * nx)]
+        for i, (_, low, width) in enumerate(stencils):
+            shape = [n_nodes] + [1] * nx
+            shape[i + 1] = width
+            index.append((low[:, np.newaxis] + np.arange(width)).reshape(shape))
+
+        if start < nx:
+            values = self._coeffs[tuple(index[1:])]
+        else:
+            values = self.values[tuple(index[1:])]
+
+        # Any trailing dimensions of the values are interpolated together, so move them in front
+        # of the stencil dimensions.
+        n_extra = values.ndim - nx - 1
+        if n_extra > 0:
+            values = np.moveaxis(values, list(range(nx + 1, values.ndim)),
+                                 list(range(1, n_extra + 1)))
+
+        compute_d_dvalues = self._compute_d_dvalues and n_extra == 0
+
+        derivs = []
+        d_dvalues = []
+        for i in range(nx - 1, -1, -1):
+            idx, low, _ = stencils[i]
+            table = tables[i]
+            if i >= start:
+                values, dval_dx, dval_dv = table._interpolate_coefficients(x[:, i], idx, values)
+            else:
+                values, dval_dx, dval_dv = table.interpolate_vectorized(x[:, i], idx, low, values)
+
+            derivs = [np.sum(dval_dv * deriv, axis=-1) for deriv in derivs]
+            derivs.insert(0, dval_dx)
+
+            if compute_d_dvalues:
+                d_dvalues.insert(0, dval_dv)
+
+        d_dx = np.stack(derivs, axis=-1)
+
+        d_values = None
+        if compute_d_dvalues:
+            # Chain the derivatives from each dimension, then scatter them into the full table.
+            deriv = 1.0
+            for i, dval_dv in enumerate(d_dvalues):
+                deriv = deriv * dval_dv[(Ellipsis, ) + (np.newaxis, ) * (nx - i - 1)]
+
+            d_values = np.zeros((n_nodes, ) + self.values.shape, dtype=deriv.dtype)
+            d_values[tuple(index)] = deriv
+
+        return values, d_dx, d_values, None
+
+    def stencil_vectorized(self, x):
+        """
+        Compute the interval and the range of grid indices needed to interpolate each point.
+
+        This method must be defined by child classes that support evaluate_vectorized.
+
+        Parameters
+        ----------
+        x : ndarray
+            The coordinates in this table dimension of all requested samples.
+
+        Returns
+        -------
+        ndarray of int
+            Interval index for each x.
+        ndarray of int
+            First grid index used to interpolate each x.
+        int
+            Number of consecutive grid indices used to interpolate each x.
+        """
+        pass
+
+    def interpolate_vectorized(self, x, idx, low, values):
+        """
+        Compute the interpolated values over this grid dimension for all requested samples.
+
+        This method must be defined by child classes that support evaluate_vectorized.
+
+        Parameters
+        ----------
+        x : ndarray
+            The coordinates in this table dimension of all requested samples.
+        idx : ndarray of int
+            Interval index for each x.
+        low : ndarray of int
+            First grid index used to interpolate each x.
+        values : ndarray
+            Table values at the grid indices used by each x, with shape (n_points, ..., width).
+
+        Returns
+        -------
+        ndarray
+            Interpolated values, with shape (n_points, ...).
+        ndarray
+            Derivative of interpolated values with respect to x.
+        ndarray
+            Derivative of interpolated values with respect to the values, with a shape that
+            broadcasts to the shape of values.
+        """
+        pass
+
+    def compute_coefficients(self):
+        """
+        Precompute the polynomial coefficients of the interpolant in every grid cell.
+
+        The coefficients span the trailing table dimensions, starting from the last one, for as
+        long as the methods support them. Since the dimensions are interpolated in turn starting
+        with the last one, only the last dimension may be interpolated with a method that isn't
+        linear in the values.
+
+        The coefficient table needs more memory than the values, by a factor of about the product
+        of the number of coefficients in each dimension that it spans, but evaluation only needs
+        the coefficients of the cell that contains each point.
+        """
+        tables = [self]
+        while tables[-1].subtable is not None:
+            tables.append(tables[-1].subtable)
+        nx = len(tables)
+
+        start = nx
+        while start > 0:
+            table = tables[start - 1]
+            if table._num_coeffs is None or (start < nx and not table._linear_in_values):
+                break
+            start -= 1
+
+        if start == nx:
+            raise ValueError("Method '%s' does not support precomputed coefficients." %
+                             self._name)
+
+        coeffs = self.values
+        for i in range(nx - 1, start - 1, -1):
+            coeffs = tables[i]._cell_coefficients(coeffs, i)
+
+        self._coeffs = coeffs
+        self._coeff_dim = start
+
+    def _cell_coefficients(self, values, axis):
+        """
+        Compute the polynomial coefficients of the interpolant along one axis in every grid cell.
+
+        The polynomial in each cell is a function of the local coordinate that runs from 0 to 1
+        across the cell, and is fit through samples of the interpolant inside the cell.
+
+        Parameters
+        ----------
+        values : ndarray
+            Table values, or coefficients for the dimensions after this one.
+        axis : int
+            Axis of the values that corresponds to this table dimension.
+
+        Returns
+        -------
+        ndarray
+            Coefficients, with the axis replaced by one of length n_cells * num_coeffs that holds
+            the coefficients of each cell in order of increasing power.
+        """
+        grid = self.grid
+        ngrid = len(grid)
+        num_coeffs = self._num_coeffs
+
+        s = (np.arange(num_coeffs) + 0.5) / num_coeffs
+        x = (grid[:-1, np.newaxis] + np.diff(grid)[:, np.newaxis] * s).ravel()
+        n_pts = len(x)
+        idx, low, width = self.stencil_vectorized(x)
+        stencil = low[:, np.newaxis] + np.arange(width)
+
+        values = np.moveaxis(values, axis, -1)
+        shape = values.shape[:-1]
+
+        if self._linear_in_values:
+            # Sample every row at once with the interpolation weights.
+            _, _, weights = self.interpolate_vectorized(x, idx, low, np.zeros((n_pts, width)))
+            sample_mtx = np.zeros((n_pts, ngrid))
+            sample_mtx[np.arange(n_pts)[:, np.newaxis], stencil] = weights
+            samples = values.dot(sample_mtx.T)
+
+        else:
+            rows = values.reshape((-1, ngrid))
+            samples, _, _ = self.interpolate_vectorized(x, idx, low,
+                                                        np.moveaxis(rows[:, stencil], 0, 1))
+            samples = samples.T.reshape(shape + (n_pts, ))
+
+        samples = samples.reshape(shape + (ngrid - 1, num_coeffs))
+        vander_inv = np.linalg.inv(np.vander(s, num_coeffs, increasing=True))
+        coeffs = samples.dot(vander_inv.T).reshape(shape + (n_pts, ))
+
+        return np.moveaxis(coeffs, -1, axis)
+
+    def _interpolate_coefficients(self, x, idx, coeffs):
+        """
+        Evaluate the precomputed polynomials of the cells that contain the requested samples.
+
+        Parameters
+        ----------
+        x : ndarray
+            The coordinates in this table dimension of all requested samples.
+        idx : ndarray of int
+            Interval index for each x.
+        coeffs : ndarray
+            Coefficients of the cell that contains each x, with shape (n_points, ..., num_coeffs).
+
+        Returns
+        -------
+        ndarray
+            Interpolated values, with shape (n_points, ...).
+        ndarray
+            Derivative of interpolated values with respect to x.
+        ndarray
+            Derivative of interpolated values with respect to the coefficients.
+        """
+        grid = self.grid
+        power = np.arange(self._num_coeffs)
+
+        r_step = 1.0 / (grid[idx + 1] - grid[idx])
+        s = (x - grid[idx]) * r_step
+
+        weights = s[:, np.newaxis] ** power
+        d_weights = np.zeros(weights.shape, dtype=weights.dtype)
+        d_weights[:, 1:] = power[1:] * weights[:, :-1]
+
+        if self._extrap_linear:
+            # Off either end of the table, extrapolate linearly from the end point.
+            x_real = x.real
+            low = x_real < grid[0]
+            weights[low, 2:] = 0.0
+            d_weights[low, 2:] = 0.0
+
+            high = x_real > grid[-1]
+            weights[high] = 1.0 + (s[high, np.newaxis] - 1.0) * power
+            d_weights[high] = power
+
+        return self._apply_weights(weights, d_weights * r_step[:, np.newaxis], coeffs)
+
+    def _apply_weights(self, weights, d_weights, values):
+        """
+        Interpolate with weights that are linear in the table values.
+
+        Parameters
+        ----------
+        weights : ndarray of shape (n_points, width)
+            Weight of each table value used by each point.
+        d_weights : ndarray of shape (n_points, width)
+            Derivative of the weights with respect to x.
+        values : ndarray
+            Table values at the grid indices used by each x, with shape (n_points, ..., width).
+
+        Returns
+        -------
+        ndarray
+            Interpolated values, with shape (n_points, ...).
+        ndarray
+            Derivative of interpolated values with respect to x.
+        ndarray
+            Derivative of interpolated values with respect to the values.
+        """
+        shape = weights.shape[:1] + (1, ) * (values.ndim - 2) + weights.shape[1:]
+        weights = weights.reshape(shape)
+        d_weights = d_weights.reshape(shape)
+
+        return np.sum(weights * values, axis=-1), np.sum(d_weights * values, axis=-1), weights
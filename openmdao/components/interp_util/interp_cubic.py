@@ -20,6 +20,9 @@ class InterpCubic(InterpAlgorithm):
     ----------
     second_derivs : ndarray
         Cache of all second derivatives for the leaf table only.
+    _second_deriv_mtx : ndarray or None
+        Cache of the derivatives of the second derivatives with respect to the values along this
+        dimension, used by interpolate_vectorized.
     """
 
     def __init__(self, grid, values, interp, **kwargs):
@@ -41,6 +44,10 @@ class InterpCubic(InterpAlgorithm):
         self.second_derivs = None
         self.k = 4
         self._name = 'cubic'
+        self._vectorized_points = True
+        self._num_coeffs = 4
+        self._linear_in_values = True
+        self._second_deriv_mtx = None
 
     def compute_coeffs(self, grid, values, x):
         """
@@ -199,3 +206,87 @@ class InterpCubic(InterpAlgorithm):
              (3.0 * a * a - 1) * sec_deriv[..., idx]) * (step * fact)
 
         return val, deriv, None, None
+
+    def stencil_vectorized(self, x):
+        """
+        Compute the interval and the range of grid indices needed to interpolate each point.
+
+        The spline depends on all of the values along this dimension.
+
+        Parameters
+        ----------
+        x : ndarray
+            The coordinates in this table dimension of all requested samples.
+
+        Returns
+        -------
+        ndarray of int
+            Interval index for each x.
+        ndarray of int
+            First grid index used to interpolate each x.
+        int
+            Number of consecutive grid indices used to interpolate each x.
+        """
+        idx, _ = self.bracket_vectorized(x)
+
+        # Extrapolate high
+        ngrid = len(self.grid)
+        idx[idx == ngrid - 1] -= 1
+
+        return idx, np.zeros(idx.shape, dtype=int), ngrid
+
+    def interpolate_vectorized(self, x, idx, low, values):
+        """
+        Compute the interpolated values over this grid dimension for all requested samples.
+
+        Parameters
+        ----------
+        x : ndarray
+            The coordinates in this table dimension of all requested samples.
+        idx : ndarray of int
+            Interval index for each x.
+        low : ndarray of int
+            First grid index used to interpolate each x.
+        values : ndarray
+            Table values at the grid indices used by each x, with shape (n_points, ..., width).
+
+        Returns
+        -------
+        ndarray
+            Interpolated values, with shape (n_points, ...).
+        ndarray
+            Derivative of interpolated values with respect to x.
+        ndarray
+            Derivative of interpolated values with respect to the values.
+        """
+        grid = self.grid
+        ngrid = len(grid)
+        n_nodes = len(x)
+
+        # The second derivatives are linear in the values, so the spline is a weighted sum of the
+        # values.
+        if self._second_deriv_mtx is None:
+            self._second_deriv_mtx = self.compute_coeffs(grid, np.eye(ngrid), grid).T
+        sec_mtx = self._second_deriv_mtx
+
+        step = grid[idx + 1] - grid[idx]
+        r_step = 1.0 / step
+        a = (grid[idx + 1] - x) * r_step
+        b = (x - grid[idx]) * r_step
+        fact = 1.0 / 6.0
+
+        rows = np.arange(n_nodes)
+        weights = np.zeros((n_nodes, ngrid), dtype=x.dtype)
+        d_weights = np.zeros((n_nodes, ngrid), dtype=x.dtype)
+
+        weights[rows, idx] = a
+        weights[rows, idx + 1] = b
+        weights += (((a * a * a - a) * (step * step * fact))[:, np.newaxis] * sec_mtx[idx] +
+                    ((b * b * b - b) * (step * step * fact))[:, np.newaxis] * sec_mtx[idx + 1])
+
+        d_weights[rows, idx] = -r_step
+        d_weights[rows, idx + 1] = r_step
+        d_weights += ((-(3.0 * a * a - 1) * (step * fact))[:, np.newaxis] * sec_mtx[idx] +
+                      ((3.0 * b * b - 1) * (step * fact))[:, np.newaxis] * sec_mtx[idx + 1])
+
+        return self._apply_weights(weights, d_weights, values)
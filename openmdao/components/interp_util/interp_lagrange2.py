@@ -31,6 +31,7 @@ class InterpLagrange2(InterpAlgorithm):
         super().__init__(grid, values, interp, **kwargs)
         self.k = 3
         self._name = 'lagrange2'
+        self._vectorized_points = True
 
     def interpolate(self, x, idx, slice_idx):
         """
@@ -127,3 +128,72 @@ class InterpLagrange2(InterpAlgorithm):
             q3 * (2.0 * x[0] - grid[idx] - grid[idx + 1])
 
         return xx3 * (q1 * xx2 - q2 * xx1) + q3 * xx1 * xx2, derivs, None, None
+
+    def stencil_vectorized(self, x):
+        """
+        Compute the interval and the range of grid indices needed to interpolate each point.
+
+        Parameters
+        ----------
+        x : ndarray
+            The coordinates in this table dimension of all requested samples.
+
+        Returns
+        -------
+        ndarray of int
+            Interval index for each x.
+        ndarray of int
+            First grid index used to interpolate each x.
+        int
+            Number of consecutive grid indices used to interpolate each x.
+        """
+        idx, _ = self.bracket_vectorized(x)
+
+        # Extrapolate high
+        ngrid = len(self.grid)
+        idx[idx > ngrid - 3] = ngrid - 3
+
+        return idx, idx, 3
+
+    def interpolate_vectorized(self, x, idx, low, values):
+        """
+        Compute the interpolated values over this grid dimension for all requested samples.
+
+        Parameters
+        ----------
+        x : ndarray
+            The coordinates in this table dimension of all requested samples.
+        idx : ndarray of int
+            Interval index for each x.
+        low : ndarray of int
+            First grid index used to interpolate each x.
+        values : ndarray
+            Table values at the grid indices used by each x, with shape (n_points, ..., width).
+
+        Returns
+        -------
+        ndarray
+            Interpolated values, with shape (n_points, ...).
+        ndarray
+            Derivative of interpolated values with respect to x.
+        ndarray
+            Derivative of interpolated values with respect to the values.
+        """
+        grid = self.grid
+
+        xx1 = x - grid[idx]
+        xx2 = x - grid[idx + 1]
+        xx3 = x - grid[idx + 2]
+
+        c12 = grid[idx] - grid[idx + 1]
+        c13 = grid[idx] - grid[idx + 2]
+        c23 = grid[idx + 1] - grid[idx + 2]
+
+        weights = np.stack((xx2 * xx3 / (c12 * c13),
+                            -xx1 * xx3 / (c12 * c23),
+                            xx1 * xx2 / (c13 * c23)), axis=-1)
+        d_weights = np.stack(((xx2 + xx3) / (c12 * c13),
+                              -(xx1 + xx3) / (c12 * c23),
+                              (xx1 + xx2) / (c13 * c23)), axis=-1)
+
+        return self._apply_weights(weights, d_weights, values)
@@ -31,6 +31,7 @@ class InterpLagrange3(InterpAlgorithm):
         super().__init__(grid, values, interp, **kwargs)
         self.k = 4
         self._name = 'lagrange3'
+        self._vectorized_points = True
 
     def interpolate(self, x, idx, slice_idx):
         """
@@ -152,3 +153,84 @@ class InterpLagrange3(InterpAlgorithm):
 
         return xx4 * (xx3 * (q1 * xx2 - q2 * xx1) + q3 * xx1 * xx2) - q4 * xx1 * xx2 * xx3, \
             derivs, None, None
+
+    def stencil_vectorized(self, x):
+        """
+        Compute the interval and the range of grid indices needed to interpolate each point.
+
+        Parameters
+        ----------
+        x : ndarray
+            The coordinates in this table dimension of all requested samples.
+
+        Returns
+        -------
+        ndarray of int
+            Interval index for each x.
+        ndarray of int
+            First grid index used to interpolate each x.
+        int
+            Number of consecutive grid indices used to interpolate each x.
+        """
+        idx, _ = self.bracket_vectorized(x)
+
+        # Extrapolate high
+        ngrid = len(self.grid)
+        idx[idx > ngrid - 3] = ngrid - 3
+        idx[idx == 0] = 1
+
+        return idx, idx - 1, 4
+
+    def interpolate_vectorized(self, x, idx, low, values):
+        """
+        Compute the interpolated values over this grid dimension for all requested samples.
+
+        Parameters
+        ----------
+        x : ndarray
+            The coordinates in this table dimension of all requested samples.
+        idx : ndarray of int
+            Interval index for each x.
+        low : ndarray of int
+            First grid index used to interpolate each x.
+        values : ndarray
+            Table values at the grid indices used by each x, with shape (n_points, ..., width).
+
+        Returns
+        -------
+        ndarray
+            Interpolated values, with shape (n_points, ...).
+        ndarray
+            Derivative of interpolated values with respect to x.
+        ndarray
+            Derivative of interpolated values with respect to the values.
+        """
+        grid = self.grid
+
+        p1 = grid[idx - 1]
+        p2 = grid[idx]
+        p3 = grid[idx + 1]
+        p4 = grid[idx + 2]
+
+        xx1 = x - p1
+        xx2 = x - p2
+        xx3 = x - p3
+        xx4 = x - p4
+
+        c12 = p1 - p2
+        c13 = p1 - p3
+        c14 = p1 - p4
+        c23 = p2 - p3
+        c24 = p2 - p4
+        c34 = p3 - p4
+
+        weights = np.stack((xx2 * xx3 * xx4 / (c12 * c13 * c14),
+                            -xx1 * xx3 * xx4 / (c12 * c23 * c24),
+                            xx1 * xx2 * xx4 / (c13 * c23 * c34),
+                            -xx1 * xx2 * xx3 / (c14 * c24 * c34)), axis=-1)
+        d_weights = np.stack(((xx3 * xx4 + xx2 * (xx3 + xx4)) / (c12 * c13 * c14),
+                              -(xx3 * xx4 + xx1 * (xx3 + xx4)) / (c12 * c23 * c24),
+                              (xx2 * xx4 + xx1 * (xx2 + xx4)) / (c13 * c23 * c34),
+                              -(xx2 * xx3 + xx1 * (xx2 + xx3)) / (c14 * c24 * c34)), axis=-1)
+
+        return self._apply_weights(weights, d_weights, values)
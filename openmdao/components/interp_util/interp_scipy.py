@@ -63,6 +63,8 @@ class InterpScipy(InterpAlgorithm):
         self.options.update(kwargs)
 
         self._vectorized = True
+        self._vectorized_points = False
+        self._num_coeffs = None
 
         interp_method = self.options['interp_method']
         self._name = interp_method
@@ -31,6 +31,9 @@ class InterpLinear(InterpAlgorithm):
         super().__init__(grid, values, interp, **kwargs)
         self.k = 2
         self._name = 'slinear'
+        self._vectorized_points = True
+        self._num_coeffs = 2
+        self._linear_in_values = True
 
     def interpolate(self, x, idx, slice_idx):
         """
@@ -96,3 +99,62 @@ class InterpLinear(InterpAlgorithm):
 
             return values[..., idx] + (x - grid[idx]) * slope, np.expand_dims(slope, axis=-1), \
                 None, None
+
+    def stencil_vectorized(self, x):
+        """
+        Compute the interval and the range of grid indices needed to interpolate each point.
+
+        Parameters
+        ----------
+        x : ndarray
+            The coordinates in this table dimension of all requested samples.
+
+        Returns
+        -------
+        ndarray of int
+            Interval index for each x.
+        ndarray of int
+            First grid index used to interpolate each x.
+        int
+            Number of consecutive grid indices used to interpolate each x.
+        """
+        idx, _ = self.bracket_vectorized(x)
+
+        # Extrapolate high
+        idx[idx == len(self.grid) - 1] -= 1
+
+        return idx, idx, 2
+
+    def interpolate_vectorized(self, x, idx, low, values):
+        """
+        Compute the interpolated values over this grid dimension for all requested samples.
+
+        Parameters
+        ----------
+        x : ndarray
+            The coordinates in this table dimension of all requested samples.
+        idx : ndarray of int
+            Interval index for each x.
+        low : ndarray of int
+            First grid index used to interpolate each x.
+        values : ndarray
+            Table values at the grid indices used by each x, with shape (n_points, ..., width).
+
+        Returns
+        -------
+        ndarray
+            Interpolated values, with shape (n_points, ...).
+        ndarray
+            Derivative of interpolated values with respect to x.
+        ndarray
+            Derivative of interpolated values with respect to the values.
+        """
+        grid = self.grid
+
+        h = 1.0 / (grid[idx + 1] - grid[idx])
+        b = (x - grid[idx]) * h
+
+        weights = np.stack((1.0 - b, b), axis=-1)
+        d_weights = np.stack((-h, h), axis=-1)
+
+        return self._apply_weights(weights, d_weights, values)
@@ -459,6 +459,147 @@ class TestInterpNDPython(unittest.TestCase):
 
         assert_near_equal(deriv, dy_dycp, tolerance=1e-6)
 
+    def test_vectorized_points(self):
+        np.random.seed(11)
+        points = [np.array([0.0, 0.5, 1.2, 2.0, 2.5, 3.0, 4.0]),
+                  np.array([-1.0, 0.0, 1.0, 3.0]),
+                  np.array([10.0, 11.0, 11.5, 12.0, 14.0])]
+        values = np.random.rand(7, 4, 5)
+
+        # Include points outside of the table.
+        x = np.random.rand(30, 3) * np.array([4.4, 4.4, 4.4]) + np.array([-0.2, -1.2, 9.8])
+
+        for method in ['slinear', 'lagrange2', 'lagrange3', 'cubic', 'akima']:
+            with self.subTest(method=method):
+                interp = InterpND(method=method, points=points, values=values, extrapolate=True)
+                self.assertTrue(interp.table._vectorized_points)
+                computed, deriv = interp.interpolate(x, compute_derivative=True)
+
+                # Compare to the interpolation of one point at a time.
+                interp = InterpND(method=method, points=points, values=values, extrapolate=True)
+                table = interp.table
+                while table is not None:
+                    table._vectorized_points = False
+                    table = table.subtable
+
+                for j in range(len(x)):
+                    expected, expected_deriv = interp.interpolate(x[j], compute_derivative=True)
+                    assert_near_equal(computed[j], expected[0], tolerance=1e-12)
+                    assert_near_equal(deriv[j], expected_deriv[0], tolerance=1e-10)
+
+    def test_vectorized_points_training_derivs(self):
+        np.random.seed(11)
+        points = [np.array([0.0, 0.5, 1.2, 2.0, 2.5, 3.0, 4.0]),
+                  np.array([-1.0, 0.0, 1.0, 3.0])]
+        values = np.random.rand(7, 4)
+        x = np.random.rand(10, 2) * np.array([4.4, 4.4]) + np.array([-0.2, -1.2])
+
+        for method in ['slinear', 'lagrange2', 'lagrange3', 'cubic', 'akima']:
+            with self.subTest(method=method):
+                interp = InterpND(method=method, points=points, values=values, extrapolate=True)
+                interp._compute_d_dvalues = True
+                interp._interpolate(x)
+                deriv = interp._d_dvalues.reshape((len(x), values.size))
+
+                # Check against complex step.
+                for k in range(values.size):
+                    cs_values = values.astype(complex)
+                    cs_values.flat[k] += 1e-40j
+                    interp.values = cs_values
+
+                    expected = interp._interpolate(x).imag * 1e40
+                    assert_near_equal(deriv[:, k], expected, tolerance=1e-10)
+
+    def test_uniform_grid(self):
+        np.random.seed(11)
+        for grid in [np.linspace(0.0, 37.0, 20), np.linspace(1000.0, 50000.0, 49),
+                     np.arange(0.0, 1.05, 0.1), np.linspace(-3e-7, 5e-7, 2)]:
+            with self.subTest(grid=grid):
+                interp = InterpND(method='slinear', points=[grid], values=np.zeros(len(grid)))
+                table = interp.table
+                self.assertIsNotNone(table._uniform_step)
+
+                # Include the grid points, points just off of them, and points outside the table.
+                x = np.concatenate((grid, np.nextafter(grid, np.inf),
+                                    np.nextafter(grid, -np.inf), [np.nan, np.inf, -np.inf],
+                                    np.random.uniform(2 * grid[0] - grid[-1],
+                                                      2 * grid[-1] - grid[0], 100)))
+
+                idx, extrap = table.bracket_vectorized(x)
+
+                # Compare to searching the grid.
+                table._uniform_step = None
+                expected_idx, expected_extrap = table.bracket_vectorized(x)
+                assert_array_equal(idx, expected_idx)
+                assert_array_equal(extrap, expected_extrap)
+
+                # Points on the grid may be placed in the interval on either side of them by the
+                # search, so only compare the others.
+                off_grid = x[len(grid):]
+                expected = [table.bracket(xx) for xx in off_grid]
+                table._uniform_step = grid[1] - grid[0]
+                self.assertEqual([table.bracket(xx) for xx in off_grid], expected)
+
+                # Points on the grid are placed in the interval below them, as in
+                # bracket_vectorized.
+                for xx, j in zip(grid, idx):
+                    self.assertEqual(table.bracket(xx), (j, 0))
+
+        interp = InterpND(method='slinear', points=[np.array([0.0, 1.0, 1.5, 3.0])],
+                          values=np.zeros(4))
+        self.assertIsNone(interp.table._uniform_step)
+
+        # The derivative at an interior grid point depends on the interval that it is placed in.
+        values = np.array([0.3, 1.7, 0.2, 2.5])
+        for method in ['slinear', 'lagrange2']:
+            with self.subTest(method=method):
+                table = InterpND(method=method, points=[np.arange(4.0)], values=values).table
+                self.assertIsNotNone(table._uniform_step)
+
+                for xx in [1.0, 2.0]:
+                    val, deriv = table.evaluate(np.array([xx]))[:2]
+                    expected_val, expected_deriv = table.evaluate_vectorized(np.array([[xx]]))[:2]
+                    assert_near_equal(val, expected_val[0], 1e-12)
+                    assert_near_equal(deriv, expected_deriv[0], 1e-12)
+
+    def test_precompute_coeffs(self):
+        np.random.seed(11)
+        points = [np.array([0.0, 0.5, 1.2, 2.0, 2.5, 3.0, 4.0]),
+                  np.linspace(-1.0, 3.0, 5),
+                  np.array([10.0, 11.0, 11.5, 12.0, 14.0])]
+
+        # Include points outside of the table.
+        x = np.random.rand(30, 3) * np.array([4.4, 4.4, 4.4]) + np.array([-0.2, -1.2, 9.8])
+
+        for method, coeff_dim in [('slinear', 0), ('cubic', 0), ('akima', 2)]:
+            # Several sets of values that share a grid are interpolated together.
+            for values in [np.random.rand(7, 5, 5), np.random.rand(7, 5, 5, 2)]:
+                with self.subTest(method=method, shape=values.shape):
+                    interp = InterpND(method=method, points=points, values=values,
+                                      extrapolate=True)
+                    expected, expected_deriv = interp.interpolate(x, compute_derivative=True)
+
+                    interp = InterpND(method=method, points=points, values=values,
+                                      extrapolate=True, precompute_coeffs=True)
+                    computed, deriv = interp.interpolate(x, compute_derivative=True)
+
+                    self.assertEqual(interp.table._coeff_dim, coeff_dim)
+                    assert_near_equal(computed, expected, tolerance=1e-12)
+                    assert_near_equal(deriv, expected_deriv, tolerance=1e-12)
+
+                    # Check against complex step.
+                    for i in range(3):
+                        cs_x = x.astype(complex)
+                        cs_x[:, i] += 1e-40j
+                        cs_deriv = interp.interpolate(cs_x).imag * 1e40
+                        assert_near_equal(cs_deriv, deriv[..., i], tolerance=1e-10)
+
+        with self.assertRaises(ValueError) as cm:
+            InterpND(method='lagrange2', points=points, values=values, precompute_coeffs=True)
+
+        msg = "Method 'lagrange2' does not support precomputed coefficients."
+        self.assertEqual(str(cm.exception), msg)
+
     def test_scipy_auto_reduce_spline_order(self):
         # if a spline method is used and spline_dim_error=False and a dimension
         # does not have enough points, the spline order for that dimension
@@ -24,6 +24,9 @@ class MetaModelStructuredComp(ExplicitComponent):
     Extrapolation is supported, but disabled by default. It can be enabled via initialization
     option.
 
+    When there are several outputs and the interpolation method supports it, the training data
+    for all outputs are stacked into one table, so that a single pass over the grid evaluates
+    every output and its derivatives.
 
     Attributes
     ----------
@@ -37,6 +40,8 @@ class MetaModelStructuredComp(ExplicitComponent):
         Cached list of input names.
     training_outputs : dict
         Dictionary of training data each output.
+    _shared_interp : InterpND or None
+        Interpolation of the stacked training data of all outputs, if they can share one table.
     """
 
     def __init__(self, **kwargs):
@@ -55,6 +60,7 @@ class MetaModelStructuredComp(ExplicitComponent):
         self.training_outputs = {}
         self.interps = {}
         self.grad_shape = ()
+        self._shared_interp = None
 
     def initialize(self):
         """
@@ -70,6 +76,11 @@ class MetaModelStructuredComp(ExplicitComponent):
                              desc='Number of points to evaluate at once.')
         self.options.declare('method', values=TABLE_METHODS, default='scipy_cubic',
                              desc='Spline interpolation method to use for all outputs.')
+        self.options.declare('precompute_coeffs', types=bool, default=False,
+                             desc='If True, precompute the polynomial coefficients of every grid '
+                                  'cell, which needs more memory but speeds up the interpolation. '
+                                  "Only supported by the 'slinear', 'cubic', and 'akima' methods, "
+                                  'and not used when training_data_gradients is True.')
 
     def add_input(self, name, val=1.0, training_data=None, **kwargs):
         """
@@ -143,7 +154,19 @@ class MetaModelStructuredComp(ExplicitComponent):
         for name, train_data in self.training_outputs.items():
             self.interps[name] = InterpND(method=interp_method,
                                           points=self.inputs, values=train_data,
-                                          extrapolate=self.options['extrapolate'])
+                                          extrapolate=self.options['extrapolate'],
+                                          precompute_coeffs=self.options['precompute_coeffs'])
+
+        # Outputs share the grid, so when the training data are fixed they can be stacked into
+        # one table, and the brackets and weights are computed once for all of them.
+        self._shared_interp = None
+        if len(self.interps) > 1 and not self.options['training_data_gradients']:
+            if next(iter(self.interps.values())).table._vectorized_points:
+                values = np.stack([interp.values for interp in self.interps.values()], axis=-1)
+                self._shared_interp = InterpND(method=interp_method, points=self.inputs,
+                                               values=values,
+                                               extrapolate=self.options['extrapolate'],
+                                               precompute_coeffs=self.options['precompute_coeffs'])
 
         if self.options['training_data_gradients']:
             self.grad_shape = tuple([self.options['vec_size']] + [i.size for i in self.inputs])
@@ -186,27 +209,55 @@ class MetaModelStructuredComp(ExplicitComponent):
             unscaled, dimensional output variables read via outputs[key]
         """
         pt = np.array([inputs[pname].flatten() for pname in self.pnames]).T
+
+        if self._shared_interp is not None:
+            # The first output would be the first one to hit an out of bounds input.
+            out_name = next(iter(self.interps))
+            val = self._interpolate(self._shared_interp, pt, out_name)
+            for i, out_name in enumerate(self.interps):
+                outputs[out_name] = val[:, i]
+            return
+
         for out_name, interp in self.interps.items():
             if self.options['training_data_gradients']:
                 # Training point values may have changed every time we compute.
                 interp.values = inputs["%s_train" % out_name]
                 interp._compute_d_dvalues = True
 
-            try:
-                val = interp._interpolate(pt)
+            outputs[out_name] = self._interpolate(interp, pt, out_name)
 
-            except OutOfBoundsError as err:
-                varname_causing_error = '.'.join((self.pathname, self.pnames[err.idx]))
-                errmsg = (f"{self.msginfo}: Error interpolating output '{out_name}' "
-                          f"because input '{varname_causing_error}' was out of bounds "
-                          f"('{ err.lower}', '{err.upper}') with value '{err.value}'")
-                raise AnalysisError(errmsg, inspect.getframeinfo(inspect.currentframe()),
-                                    self.msginfo)
+    def _interpolate(self, interp, pt, out_name):
+        """
+        Interpolate at the given points, converting errors into messages about this component.
 
-            except ValueError as err:
-                raise ValueError(f"{self.msginfo}: Error interpolating output '{out_name}':\n"
-                                 f"{str(err)}")
-            outputs[out_name] = val
+        Parameters
+        ----------
+        interp : InterpND
+            Interpolation to evaluate.
+        pt : ndarray
+            Points to interpolate at, with one row per point.
+        out_name : str
+            Name of the output reported in error messages.
+
+        Returns
+        -------
+        ndarray
+            Interpolated values.
+        """
+        try:
+            return interp._interpolate(pt)
+
+        except OutOfBoundsError as err:
+            varname_causing_error = '.'.join((self.pathname, self.pnames[err.idx]))
+            errmsg = (f"{self.msginfo}: Error interpolating output '{out_name}' "
+                      f"because input '{varname_causing_error}' was out of bounds "
+                      f"('{ err.lower}', '{err.upper}') with value '{err.value}'")
+            raise AnalysisError(errmsg, inspect.getframeinfo(inspect.currentframe()),
+                                self.msginfo)
+
+        except ValueError as err:
+            raise ValueError(f"{self.msginfo}: Error interpolating output '{out_name}':\n"
+                             f"{str(err)}")
 
     def compute_partials(self, inputs, partials):
         """
@@ -225,6 +276,14 @@ class MetaModelStructuredComp(ExplicitComponent):
         """
         pt = np.array([inputs[pname].flatten() for pname in self.pnames]).T
 
+        if self._shared_interp is not None:
+            # Reuses the derivatives from compute when the inputs haven't changed.
+            dval = self._shared_interp.gradient(pt)
+            for i, out_name in enumerate(self.interps):
+                for j, p in enumerate(self.pnames):
+                    partials[out_name, p] = dval[:, i, j]
+            return
+
         for out_name, interp in self.interps.items():
             dval = interp.gradient(pt).T
             for i, p in enumerate(self.pnames):
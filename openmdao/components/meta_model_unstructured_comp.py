@@ -1,6 +1,8 @@
 """MetaModel provides basic meta modeling capability."""
 from copy import deepcopy
 from itertools import chain, product
+import os
+import pickle
 
 import numpy as np
 
@@ -107,6 +109,12 @@ class MetaModelUnStructuredComp(ExplicitComponent):
         self.options.declare('vec_size', types=int, default=1, lower=1,
                              desc='Number of points that will be simultaneously predicted by '
                                   'the surrogate.')
+        self.options.declare('cache_dir', types=str, default=None, allow_none=True,
+                             desc='Directory where trained surrogates are saved, keyed by a hash '
+                                  'of their type, settings and training data. A surrogate is '
+                                  'loaded from this directory instead of being retrained when '
+                                  'its key matches a saved one. If None, surrogates are always '
+                                  'retrained.')
 
     def add_input(self, name, val=1.0, training_data=None, **kwargs):
         """
@@ -358,6 +366,11 @@ class MetaModelUnStructuredComp(ExplicitComponent):
         for name, shape in self._surrogate_output_names:
             surrogate = self._metadata(name).get('surrogate')
 
+            if isinstance(shape, tuple):
+                output_shape = (vec_size, ) + shape
+            else:
+                output_shape = (vec_size, )
+
             if vec_size == 1:
                 # Non vectorized.
                 predicted = surrogate.predict(flat_inputs)
@@ -368,19 +381,14 @@ class MetaModelUnStructuredComp(ExplicitComponent):
 
             elif overrides_method('vectorized_predict', surrogate, SurrogateModel):
                 # Vectorized; surrogate provides vectorized computation.
-                # TODO: This code is untested because no surrogates provide this option.
-                predicted = surrogate.vectorized_predict(flat_inputs.flat)
+                predicted = surrogate.vectorized_predict(flat_inputs)
                 if isinstance(predicted, tuple):  # rmse option
                     self._metadata(name)['rmse'] = predicted[1]
                     predicted = predicted[0]
-                outputs[name] = np.reshape(predicted, shape)
+                outputs[name] = np.reshape(predicted, output_shape)
 
             else:
                 # Vectorized; must call surrogate multiple times.
-                if isinstance(shape, tuple):
-                    output_shape = (vec_size, ) + shape
-                else:
-                    output_shape = (vec_size, )
                 predicted = np.zeros(output_shape)
                 rmse = self._metadata(name)['rmse'] = []
                 for i in range(vec_size):
@@ -440,15 +448,14 @@ class MetaModelUnStructuredComp(ExplicitComponent):
 
         arr = np.zeros((vec_size, self._input_size))
 
-        for row in range(vec_size):
-            idx = 0
-            for name, sz in self._surrogate_input_names:
-                val = vec[name]
-                if array_real and np.issubdtype(val.dtype, np.complexfloating):
-                    array_real = False
-                    arr = arr.astype(np.complexfloating)
-                arr[row][idx:idx + sz] = val[row].flat
-                idx += sz
+        idx = 0
+        for name, sz in self._surrogate_input_names:
+            val = vec[name]
+            if array_real and np.issubdtype(val.dtype, np.complexfloating):
+                array_real = False
+                arr = arr.astype(np.complexfloating)
+            arr[:, idx:idx + sz] = val.reshape((vec_size, sz))
+            idx += sz
 
         return arr
 
@@ -522,7 +529,16 @@ class MetaModelUnStructuredComp(ExplicitComponent):
 
         for out_name, out_shape in self._surrogate_output_names:
             surrogate = self._metadata(out_name).get('surrogate')
-            if vec_size > 1:
+            if vec_size > 1 and overrides_method('vectorized_linearize', surrogate,
+                                                 SurrogateModel):
+                # Surrogate provides the jacobians at all points at once.
+                derivs = surrogate.vectorized_linearize(flat_inputs)
+                idx = 0
+                for in_name, sz in self._surrogate_input_names:
+                    partials[out_name, in_name] = derivs[:, :, idx:idx + sz].ravel()
+                    idx += sz
+
+            elif vec_size > 1:
                 out_size = np.prod(out_shape)
                 for j in range(vec_size):
                     flat_input = flat_inputs[j]
@@ -568,45 +584,211 @@ class MetaModelUnStructuredComp(ExplicitComponent):
             raise RuntimeError(f"{self.msginfo}: The following training data sets must be "
                                f"provided as options: {missing_training_data}")
 
-        inputs = np.zeros((num_sample, self._input_size))
-        self._training_input = inputs
-
-        # Assemble input data.
-        idx = 0
-        for name, sz in self._surrogate_input_names:
-            val = self.options['train:' + name]
-            if isinstance(val[0], float):
-                inputs[:, idx] = val
-                idx += 1
-            else:
-                for row_idx, v in enumerate(val):
-                    v = np.asarray(v)
-                    inputs[row_idx, idx:idx + sz] = v.flat
+        self._training_input = self._training_inputs_array(
+            {name: self.options['train:' + name] for name, _ in self._surrogate_input_names},
+            num_sample)
 
         # Assemble output data and train each output.
+        fits = []
         for name, shape in self._surrogate_output_names:
-            output_size = np.prod(shape)
+            self._training_output[name] = self._training_array(self.options['train:' + name],
+                                                               num_sample, np.prod(shape))
+
+            surrogate = self._metadata(name).get('surrogate')
+            if surrogate is None:
+                raise RuntimeError(f"{self.msginfo}: No surrogate specified for output '{name}'")
+            else:
+                fits.append((surrogate, 'train', self._training_input,
+                             self._training_output[name]))
+
+        self._train_surrogates(fits)
+
+        self.train = False
+
+    def _train_surrogates(self, fits):
+        """
+        Train the surrogates, loading them from the cache directory when possible.
+
+        Under MPI, the surrogates are only trained on the root proc of this component, and their
+        trained state is broadcast to the other procs.
+
+        Parameters
+        ----------
+        fits : list of tuple
+            The surrogate, the name of its training method, and its training inputs and outputs,
+            for each output.
+        """
+        comm = self.comm
+
+        if comm.size > 1 and comm.rank > 0:
+            states = comm.bcast(None, root=0)
+            if isinstance(states, Exception):
+                raise states
+            for (surrogate, _, _, _), state in zip(fits, states):
+                surrogate.__dict__.update(state)
+            return
+
+        try:
+            states = [self._train_surrogate(*fit) for fit in fits]
+        except Exception as err:
+            if comm.size > 1:
+                comm.bcast(err, root=0)
+            raise
+
+        if comm.size > 1:
+            comm.bcast(states, root=0)
+
+    def _train_surrogate(self, surrogate, train_method, x, y):
+        """
+        Train a surrogate, or load its trained state from the cache directory.
+
+        Parameters
+        ----------
+        surrogate : <SurrogateModel>
+            The surrogate.
+        train_method : str
+            Name of the method of the surrogate used for training.
+        x : ndarray or list of ndarray
+            Training input locations.
+        y : ndarray or list of ndarray
+            Model responses at given inputs.
+
+        Returns
+        -------
+        dict
+            Trained state of the surrogate, which is all of its attributes except its options.
+        """
+        cache_dir = self.options['cache_dir']
+
+        if cache_dir is not None:
+            fname = os.path.join(cache_dir, surrogate._cache_key(train_method, x, y) + '.pkl')
+            try:
+                with open(fname, 'rb') as f:
+                    state = pickle.load(f)
+            except Exception:
+                # The surrogate hasn't been cached or the file is unreadable, so it is trained
+                # and the file is (re)written below.
+                pass
+            else:
+                surrogate.__dict__.update(state)
+                return state
+
+        getattr(surrogate, train_method)(x, y)
+        state = {key: val for key, val in surrogate.__dict__.items() if key != 'options'}
 
-            outputs = np.zeros((num_sample, output_size))
-            self._training_output[name] = outputs
+        if cache_dir is not None:
+            # Write to a temporary file first so that other processes never read a partially
+            # written one.
+            os.makedirs(cache_dir, exist_ok=True)
+            tmp_name = f'{fname}.{os.getpid()}.tmp'
+            with open(tmp_name, 'wb') as f:
+                pickle.dump(state, f, pickle.HIGHEST_PROTOCOL)
+            os.replace(tmp_name, fname)
 
-            val = self.options['train:' + name]
+        return state
 
-            if isinstance(val[0], float):
-                outputs[:, 0] = val
+    def add_training_points(self, data):
+        """
+        Add training points for all inputs and outputs, and update the surrogates.
+
+        The new points are appended to the 'train:' options. If the surrogates have already been
+        trained, they are updated with just the new points if they support it (see
+        SurrogateModel.update), and retrained on all of the points otherwise. If training hasn't
+        happened yet, it happens on the next execution as usual.
+
+        Parameters
+        ----------
+        data : dict
+            Training data for the new points, keyed by input and output name. Each value has the
+            new points along its first dimension.
+        """
+        names = [name for name, _ in chain(self._surrogate_input_names,
+                                           self._surrogate_output_names)]
+
+        missing = [name for name in names if name not in data]
+        if missing:
+            raise RuntimeError(f"{self.msginfo}: Training data must be provided for all inputs "
+                               f"and outputs. Missing: {missing}")
+
+        num_new = None
+        for name in names:
+            if num_new is None:
+                num_new = len(data[name])
+            elif len(data[name]) != num_new:
+                raise RuntimeError(f"{self.msginfo}: Each variable must have the same number "
+                                   f"of training points. Expected {num_new} but found "
+                                   f"{len(data[name])} points for '{name}'.")
+
+        for name in names:
+            train_name = 'train:' + name
+            old = self.options[train_name]
+            if old is None:
+                self.options[train_name] = data[name]
             else:
-                for row_idx, v in enumerate(val):
-                    v = np.asarray(v)
-                    outputs[row_idx, :] = v.flat
+                self.options[train_name] = np.concatenate((np.asarray(old),
+                                                           np.asarray(data[name])))
+
+        if self.train:
+            return
+
+        new_input = self._training_inputs_array(data, num_new)
+        self._training_input = np.vstack((self._training_input, new_input))
+
+        for name, shape in self._surrogate_output_names:
+            new_output = self._training_array(data[name], num_new, np.prod(shape))
+            self._training_output[name] = np.vstack((self._training_output[name], new_output))
 
             surrogate = self._metadata(name).get('surrogate')
-            if surrogate is None:
-                raise RuntimeError(f"{self.msginfo}: No surrogate specified for output '{name}'")
+            if overrides_method('update', surrogate, SurrogateModel):
+                surrogate.update(new_input, new_output)
             else:
-                surrogate.train(self._training_input,
-                                self._training_output[name])
+                surrogate.train(self._training_input, self._training_output[name])
 
-        self.train = False
+    def _training_inputs_array(self, data, num_sample):
+        """
+        Assemble the training data for the inputs into a 2d array with one row per point.
+
+        Parameters
+        ----------
+        data : dict
+            Training data keyed by input name.
+        num_sample : int
+            Number of training points.
+
+        Returns
+        -------
+        ndarray
+            Flattened training data of all inputs, side by side.
+        """
+        inputs = np.zeros((num_sample, self._input_size))
+
+        idx = 0
+        for name, sz in self._surrogate_input_names:
+            inputs[:, idx:idx + sz] = self._training_array(data[name], num_sample, sz)
+            idx += sz
+
+        return inputs
+
+    @staticmethod
+    def _training_array(val, num_sample, size):
+        """
+        Flatten the training data of one variable into a 2d array with one row per point.
+
+        Parameters
+        ----------
+        val : list or ndarray
+            Training data of the variable.
+        num_sample : int
+            Number of training points.
+        size : int
+            Flattened size of the variable at one point.
+
+        Returns
+        -------
+        ndarray
+            Training data, with one row per point.
+        """
+        return np.asarray(val, dtype=float).reshape((num_sample, size))
 
     def _metadata(self, name):
         return self._var_rel2meta[name]
@@ -256,6 +256,24 @@ class MultiFiMetaModelUnStructuredComp(MetaModelUnStructuredComp):
                 self.options.declare(
                     name_with_fi, default=None, desc='Training data for %s' % name_with_fi)
 
+    def add_training_points(self, data):
+        """
+        Add highest fidelity training points for all inputs and outputs.
+
+        With more than one fidelity level, the surrogates are retrained on all of the training
+        data on the next execution instead of being updated.
+
+        Parameters
+        ----------
+        data : dict
+            Training data for the new points, keyed by input and output name. Each value has the
+            new points along its first dimension.
+        """
+        if self._nfi > 1:
+            self.train = True
+
+        super().add_training_points(data)
+
     def _train(self):
         """
         Override MetaModelUnStructured _train method to take into account multi-fidelity input data.
@@ -296,6 +314,7 @@ class MultiFiMetaModelUnStructuredComp(MetaModelUnStructuredComp):
                         inputs[fi][row_idx, idx[fi]:idx[fi] + sz] = v.flat
 
         # add training data for each output
+        fits = []
         outputs = self._nfi * [None]
         for name_root, shape in self._surrogate_output_names:
             output_size = np.prod(shape)
@@ -312,15 +331,18 @@ class MultiFiMetaModelUnStructuredComp(MetaModelUnStructuredComp):
                         v = np.asarray(v)
                         outputs[fi][row_idx, :] = v.flat
 
-            self._training_output[name] = []
-            self._training_output[name].extend(outputs)
+            self._training_output[name_root] = []
+            self._training_output[name_root].extend(outputs)
 
             surrogate = self._metadata(name_root).get('surrogate')
             if surrogate is None:
                 msg = f"{self.msginfo}: No surrogate specified for output '{name_root}'"
                 raise RuntimeError(msg)
             else:
-                surrogate.train_multifi(inputs, self._training_output[name])
+                fits.append((surrogate, 'train_multifi', inputs,
+                             self._training_output[name_root]))
+
+        self._train_surrogates(fits)
 
         self._training_input = inputs
         self.train = False
@@ -1,10 +1,15 @@
 """Define the SplineComp class."""
 import numpy as np
+from scipy.sparse import csr_matrix
 
 from openmdao.components.interp_util.interp import InterpND
 from openmdao.core.explicitcomponent import ExplicitComponent
 from openmdao.components.interp_util.interp import SPLINE_METHODS
 
+# The akima spline's slopes depend nonlinearly on the control point values, so it is the only
+# method that can't be written as a fixed matrix times the control point values.
+LINEAR_SPLINE_METHODS = [method for method in SPLINE_METHODS if method != 'akima']
+
 
 class SplineComp(ExplicitComponent):
     """
@@ -16,6 +21,9 @@ class SplineComp(ExplicitComponent):
         Dictionary of relationship between the interpolated data and its control points.
     interps : dict
         Dictionary of interpolations for each output.
+    _basis : csr_matrix or None
+        Sparse matrix that maps the control point values to the interpolated values. Only used
+        when the precompute_basis option is True.
     _n_cp = int
         Number of control points.
     _spline_cache : list
@@ -37,6 +45,7 @@ class SplineComp(ExplicitComponent):
         self.interps = {}
         self._spline_cache = []
         self._n_cp = None
+        self._basis = None
 
     def _declare_options(self):
         """
@@ -60,6 +69,12 @@ class SplineComp(ExplicitComponent):
         self.options.declare('interp_options', types=dict, default={},
                              desc='Dict contains the name and value of options specific to the '
                              'chosen interpolation method.')
+        self.options.declare('precompute_basis', types=bool, default=False,
+                             desc='If True, compute the sparse matrix that maps the control '
+                             'points to the interpolated points once during setup, so that each '
+                             'spline is evaluated with a sparse matrix-vector product and has a '
+                             'constant jacobian. Not available for akima, which is nonlinear in '
+                             'the control point values.')
 
     def add_spline(self, y_cp_name, y_interp_name, y_cp_val=None, y_units=None):
         """
@@ -116,6 +131,27 @@ class SplineComp(ExplicitComponent):
         vec_size = self.options['vec_size']
         n_interp = len(self.options['x_interp_val'])
 
+        if self.options['precompute_basis']:
+            if interp_method not in LINEAR_SPLINE_METHODS:
+                msg = "{}: Option 'precompute_basis' is not available for method '{}'. It can " \
+                      "be used with methods {}."
+                raise ValueError(msg.format(self.msginfo, interp_method, LINEAR_SPLINE_METHODS))
+
+            interp = InterpND(points=(grid, ), values=np.zeros(n_cp), method=interp_method,
+                              x_interp=self.options['x_interp_val'], extrapolate=True, **opts)
+
+            # The interpolated values are linear in the control point values, so interpolating
+            # each unit vector gives one column of the basis.
+            self._basis = basis = csr_matrix(interp._evaluate_spline(np.eye(n_cp)).T)
+
+            # Each row of the inputs and outputs is a separate spline with the same basis.
+            coo = basis.tocoo()
+            rows = np.tile(coo.row, vec_size) + np.repeat(n_interp * np.arange(vec_size), coo.nnz)
+            cols = np.tile(coo.col, vec_size) + np.repeat(n_cp * np.arange(vec_size), coo.nnz)
+            jac = np.tile(coo.data, vec_size)
+        else:
+            self._basis = None
+
         for y_cp_name, y_interp_name, y_cp_val, y_units in self._spline_cache:
 
             self.add_output(y_interp_name, np.ones((vec_size, n_interp)), units=y_units)
@@ -130,6 +166,10 @@ class SplineComp(ExplicitComponent):
 
             self.interp_to_cp[y_interp_name] = y_cp_name
 
+            if self._basis is not None:
+                self.declare_partials(y_interp_name, y_cp_name, rows=rows, cols=cols, val=jac)
+                continue
+
             row = np.repeat(np.arange(n_interp), n_cp)
             col = np.tile(np.arange(n_cp), n_interp)
             rows = np.tile(row, vec_size) + \
@@ -147,7 +187,7 @@ class SplineComp(ExplicitComponent):
                                                    extrapolate=True, **opts)
 
         # The scipy methods do not support complex step.
-        if self.options['method'].startswith('scipy'):
+        if self.options['method'].startswith('scipy') and self._basis is None:
             self.set_check_partial_options('*', method='fd')
 
     def compute(self, inputs, outputs):
@@ -161,6 +201,11 @@ class SplineComp(ExplicitComponent):
         outputs : Vector
             unscaled, dimensional output variables read via outputs[key]
         """
+        if self._basis is not None:
+            for out_name, cp_name in self.interp_to_cp.items():
+                outputs[out_name] = self._basis.dot(inputs[cp_name].T).T
+            return
+
         for out_name, interp in self.interps.items():
             values = inputs[self.interp_to_cp[out_name]]
             interp._compute_d_dvalues = True
@@ -189,6 +234,10 @@ class SplineComp(ExplicitComponent):
         partials : Jacobian
             sub-jac components written to partials[output_name, input_name]
         """
+        if self._basis is not None:
+            # The jacobian is constant, and was declared in setup.
+            return
+
         for out_name, interp in self.interps.items():
             cp_name = self.interp_to_cp[out_name]
 
@@ -993,6 +993,106 @@ class TestMetaModelStructuredPython(unittest.TestCase):
         # Derivs are large, so ignore atol.
         assert_check_partials(partials, atol=1e10, rtol=1e-10)
 
+    def test_shared_outputs(self):
+        mapdata = SampleMap()
+        params = mapdata.param_data
+        outs = mapdata.output_data
+
+        for method in ['slinear', 'lagrange2', 'lagrange3', 'cubic', 'akima']:
+            with self.subTest(method=method):
+                prob = om.Problem()
+                comp = om.MetaModelStructuredComp(method=method, extrapolate=True, vec_size=4)
+
+                for param in params:
+                    comp.add_input(param['name'], param['default'], param['values'])
+
+                for out in outs:
+                    comp.add_output(out['name'], out['default'], out['values'])
+
+                prob.model.add_subsystem('comp', comp, promotes=["*"])
+                prob.setup(force_alloc_complex=True)
+
+                prob['x'] = np.array([-0.3, 0.7, 1.2, 3.4])
+                prob['y'] = np.array([0.14, 0.313, 1.41, 0.05])
+                prob['z'] = np.array([-2.11, -1.2, 2.01, 0.5])
+                prob.run_model()
+
+                self.assertIsNotNone(comp._shared_interp)
+
+                # Matches interpolating each output separately.
+                pt = np.array([prob['x'], prob['y'], prob['z']]).T
+                for out in outs:
+                    expected = comp.interps[out['name']].interpolate(pt)
+                    assert_near_equal(prob[out['name']], expected, tolerance=1e-12)
+
+                # compute_partials reuses the derivatives from compute.
+                table = comp._shared_interp.table
+                evaluate = table.evaluate_vectorized
+                calls = []
+
+                def counted(x):
+                    calls.append(x)
+                    return evaluate(x)
+
+                table.evaluate_vectorized = counted
+                prob.model.run_linearize()
+                self.assertEqual(len(calls), 0)
+
+                partials = prob.check_partials(method='cs', out_stream=None)
+                assert_check_partials(partials, atol=1e-8, rtol=1e-8)
+
+    def test_precompute_coeffs(self):
+        mapdata = SampleMap()
+        params = mapdata.param_data
+        outs = mapdata.output_data
+
+        for method in ['slinear', 'cubic', 'akima']:
+            with self.subTest(method=method):
+                prob = om.Problem()
+                comp = om.MetaModelStructuredComp(method=method, extrapolate=True, vec_size=4,
+                                                  precompute_coeffs=True)
+
+                for param in params:
+                    comp.add_input(param['name'], param['default'], param['values'])
+
+                for out in outs:
+                    comp.add_output(out['name'], out['default'], out['values'])
+
+                prob.model.add_subsystem('comp', comp, promotes=["*"])
+                prob.setup(force_alloc_complex=True)
+
+                prob['x'] = np.array([-0.3, 0.7, 1.2, 3.4])
+                prob['y'] = np.array([0.14, 0.313, 1.41, 0.05])
+                prob['z'] = np.array([-2.11, -1.2, 2.01, 0.5])
+                prob.run_model()
+
+                self.assertIsNotNone(comp._shared_interp.table._coeffs)
+
+                # Matches interpolating each output without the coefficients.
+                pt = np.array([prob['x'], prob['y'], prob['z']]).T
+                for out in outs:
+                    interp = comp.interps[out['name']]
+                    interp._precompute_coeffs = False
+                    expected = interp.interpolate(pt)
+                    assert_near_equal(prob[out['name']], expected, tolerance=1e-12)
+
+                partials = prob.check_partials(method='cs', out_stream=None)
+                assert_check_partials(partials, atol=1e-8, rtol=1e-8)
+
+        comp = om.MetaModelStructuredComp(method='lagrange3', precompute_coeffs=True)
+        for param in params:
+            comp.add_input(param['name'], param['default'], param['values'])
+        comp.add_output(outs[0]['name'], outs[0]['default'], outs[0]['values'])
+
+        prob = om.Problem()
+        prob.model.add_subsystem('comp', comp)
+
+        with self.assertRaises(ValueError) as cm:
+            prob.setup()
+
+        msg = "Method 'lagrange3' does not support precomputed coefficients."
+        self.assertEqual(str(cm.exception), msg)
+
     def test_training_gradient_lagrange3(self):
         model = om.Group()
         ivc = om.IndepVarComp()
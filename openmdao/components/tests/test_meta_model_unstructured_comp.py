@@ -1,8 +1,10 @@
 """
 Unit tests for the unstructured metamodel component.
 """
+import os
 import sys
 import unittest
+from unittest import mock
 from math import sin
 from io import StringIO
 
@@ -11,6 +13,13 @@ import numpy as np
 import openmdao.api as om
 from openmdao.utils.assert_utils import assert_near_equal, assert_warning, assert_check_partials
 from openmdao.utils.logger_utils import TestLogger
+from openmdao.utils.mpi import MPI
+from openmdao.utils.testing_utils import use_tempdirs
+
+try:
+    from openmdao.vectors.petsc_vector import PETScVector
+except ImportError:
+    PETScVector = None
 
 
 class MetaModelTestCase(unittest.TestCase):
@@ -675,6 +684,99 @@ class MetaModelTestCase(unittest.TestCase):
         self.assertEqual(str(cm.exception),
                          "MetaModelUnStructuredComp: First dimension of output 'y' must be 3")
 
+    def test_add_training_points(self):
+        def build(x_train, x1_train):
+            mm = om.MetaModelUnStructuredComp()
+            mm.add_input('x', np.zeros(2), training_data=x_train)
+            mm.add_input('x1', 0., training_data=x1_train)
+            mm.add_output('y1', 0., training_data=self._y1(x_train, x1_train),
+                          surrogate=om.ResponseSurface())
+            mm.add_output('y2', np.zeros(2), training_data=self._y2(x_train, x1_train),
+                          surrogate=om.NearestNeighbor(interpolant_type='rbf'))
+            mm.add_output('y3', 0., training_data=self._y1(x_train, x1_train),
+                          surrogate=om.KrigingSurrogate(training_method='cholesky',
+                                                        drift_tol=None))
+
+            prob = om.Problem()
+            prob.model.add_subsystem('mm', mm)
+            prob.setup()
+            prob.set_val('mm.x', [0.35, 0.6])
+            prob.set_val('mm.x1', 0.45)
+            prob.run_model()
+
+            return prob, mm
+
+        rng = np.random.RandomState(0)
+        x_train = rng.rand(20, 2)
+        x1_train = list(rng.rand(20))
+
+        prob, mm = build(x_train[:12], x1_train[:12])
+        kriging = mm._metadata('y3')['surrogate']
+        thetas = kriging.thetas
+
+        mm.add_training_points({'x': x_train[12:], 'x1': x1_train[12:],
+                                'y1': self._y1(x_train[12:], x1_train[12:]),
+                                'y2': self._y2(x_train[12:], x1_train[12:]),
+                                'y3': self._y1(x_train[12:], x1_train[12:])})
+
+        self.assertFalse(mm.train)
+        self.assertEqual(len(mm.options['train:x1']), 20)
+        assert_near_equal(mm._training_input, np.column_stack((x_train, x1_train)), 1e-15)
+
+        # The Kriging hyperparameters are reused, and the other surrogates match ones trained
+        # on all of the points.
+        self.assertIs(kriging.thetas, thetas)
+        self.assertEqual(kriging.n_samples, 20)
+
+        prob.run_model()
+
+        expected, _ = build(x_train, x1_train)
+        for name in ['y1', 'y2']:
+            assert_near_equal(prob.get_val('mm.' + name), expected.get_val('mm.' + name), 1e-10)
+
+        x_new = np.array([[0.2, 0.3, 0.4]])
+        assert_near_equal(kriging.predict(x_new),
+                          expected.model.mm._metadata('y3')['surrogate'].predict(x_new), 1e-2)
+
+    def test_add_training_points_errors(self):
+        mm = om.MetaModelUnStructuredComp(default_surrogate=om.ResponseSurface())
+        mm.add_input('x', 0.)
+        mm.add_output('y', 0.)
+
+        prob = om.Problem()
+        prob.model.add_subsystem('mm', mm)
+        prob.setup()
+
+        with self.assertRaises(RuntimeError) as cm:
+            mm.add_training_points({'x': [1.]})
+        self.assertEqual(str(cm.exception),
+                         "MetaModelUnStructuredComp (mm): Training data must be provided for all "
+                         "inputs and outputs. Missing: ['y']")
+
+        with self.assertRaises(RuntimeError) as cm:
+            mm.add_training_points({'x': [1., 2.], 'y': [1.]})
+        self.assertEqual(str(cm.exception),
+                         "MetaModelUnStructuredComp (mm): Each variable must have the same number "
+                         "of training points. Expected 2 but found 1 points for 'y'.")
+
+        # Before the first training, the points are just appended to the training data.
+        mm.add_training_points({'x': [1., 2.], 'y': [1., 4.]})
+        mm.add_training_points({'x': [3.], 'y': [9.]})
+        self.assertTrue(mm.train)
+        assert_near_equal(mm.options['train:y'], [1., 4., 9.])
+
+        prob.set_val('mm.x', 2.5)
+        prob.run_model()
+        assert_near_equal(prob.get_val('mm.y'), 6.25, 1e-10)
+
+    @staticmethod
+    def _y1(x, x1):
+        return np.sin(3. * x[:, 0]) + x[:, 1] * np.asarray(x1)
+
+    @staticmethod
+    def _y2(x, x1):
+        return np.column_stack((x[:, 0] ** 2 + np.asarray(x1), x[:, 1] - x[:, 0]))
+
     def test_metamodel_subclass_optimize(self):
         class Trig(om.MetaModelUnStructuredComp):
             def setup(self):
@@ -1200,5 +1302,91 @@ class MetaModelUnstructuredSurrogatesFeatureTestCase(unittest.TestCase):
         assert_near_equal(prob.get_val('sin_mm.f_x'), .5*np.sin(prob.get_val('sin_mm.x')), 5e-3)
 
 
+def _cached_sin_problem(y_train, nugget=1e-10):
+    mm = om.MetaModelUnStructuredComp(cache_dir='surrogate_cache')
+    mm.add_input('x', 0., training_data=np.linspace(0., 3., 10))
+    mm.add_output('y', 0., training_data=y_train,
+                  surrogate=om.KrigingSurrogate(nugget=nugget, eval_rmse=True))
+    mm.add_output('z', 0., training_data=np.cos(np.linspace(0., 3., 10)),
+                  surrogate=om.NearestNeighbor(interpolant_type='rbf', num_neighbors=4))
+
+    prob = om.Problem()
+    prob.model.add_subsystem('mm', mm)
+    prob.setup()
+    prob.set_val('mm.x', 1.3)
+
+    return prob
+
+
+@use_tempdirs
+class MetaModelCacheTestCase(unittest.TestCase):
+
+    def test_cache(self):
+        y_train = np.sin(np.linspace(0., 3., 10))
+
+        prob = _cached_sin_problem(y_train)
+        prob.run_model()
+
+        self.assertEqual(len(os.listdir('surrogate_cache')), 2)
+
+        # The same surrogates and training data are loaded instead of being retrained.
+        cached = _cached_sin_problem(y_train)
+        with mock.patch.object(om.KrigingSurrogate, 'train', side_effect=RuntimeError), \
+                mock.patch.object(om.NearestNeighbor, 'train', side_effect=RuntimeError):
+            cached.run_model()
+
+        assert_near_equal(cached.get_val('mm.y'), prob.get_val('mm.y'), 1e-15)
+        assert_near_equal(cached.get_val('mm.z'), prob.get_val('mm.z'), 1e-15)
+        assert_near_equal(cached.model.mm._metadata('y')['rmse'],
+                          prob.model.mm._metadata('y')['rmse'], 1e-15)
+
+        # The options of the surrogate aren't part of its cached state.
+        self.assertIsNot(cached.model.mm._metadata('y')['surrogate'].options,
+                         prob.model.mm._metadata('y')['surrogate'].options)
+
+        # New training data or surrogate settings give a different key.
+        _cached_sin_problem(2. * y_train).run_model()
+        self.assertEqual(len(os.listdir('surrogate_cache')), 3)
+
+        _cached_sin_problem(y_train, nugget=1e-8).run_model()
+        self.assertEqual(len(os.listdir('surrogate_cache')), 4)
+
+    def test_unreadable_cache_file(self):
+        y_train = np.sin(np.linspace(0., 3., 10))
+
+        prob = _cached_sin_problem(y_train)
+        prob.run_model()
+
+        for fname in os.listdir('surrogate_cache'):
+            with open(os.path.join('surrogate_cache', fname), 'w') as f:
+                f.write('junk')
+
+        retrained = _cached_sin_problem(y_train)
+        retrained.run_model()
+
+        assert_near_equal(retrained.get_val('mm.y'), prob.get_val('mm.y'), 1e-15)
+        assert_near_equal(retrained.get_val('mm.z'), prob.get_val('mm.z'), 1e-15)
+
+
+@unittest.skipUnless(MPI and PETScVector, "MPI and PETSc are required.")
+@use_tempdirs
+class MetaModelMPITestCase(unittest.TestCase):
+
+    N_PROCS = 2
+
+    def test_train_on_root(self):
+        y_train = np.sin(np.linspace(0., 3., 10))
+        train = om.KrigingSurrogate.train
+
+        with mock.patch.object(om.KrigingSurrogate, 'train', autospec=True,
+                               side_effect=train) as mock_train:
+            prob = _cached_sin_problem(y_train)
+            prob.run_model()
+
+        self.assertEqual(prob.comm.size, 2)
+        self.assertEqual(mock_train.call_count, 1 if prob.comm.rank == 0 else 0)
+        assert_near_equal(prob.get_val('mm.y'), np.sin(1.3), 1e-4)
+
+
 if __name__ == "__main__":
     unittest.main()
@@ -6,7 +6,7 @@ import unittest
 import numpy as np
 
 import openmdao.api as om
-from openmdao.components.spline_comp import SPLINE_METHODS
+from openmdao.components.spline_comp import SPLINE_METHODS, LINEAR_SPLINE_METHODS
 from openmdao.utils.assert_utils import assert_check_partials, assert_near_equal
 from openmdao.utils.general_utils import printoptions
 from openmdao.utils.spline_distributions import cell_centered
@@ -185,6 +185,50 @@ class SplineCompTestCase(unittest.TestCase):
                 derivs = prob.check_partials(out_stream=None, method='cs')
                 assert_check_partials(derivs, atol=1e-12, rtol=1e-12)
 
+    def test_precompute_basis(self):
+
+        xcp = np.array([1.0, 2.0, 4.0, 6.0, 10.0, 12.0])
+        ycp = np.array([[5.0, 12.0, 14.0, 16.0, 21.0, 29.0],
+                        [7.0, 13.0, 9.0, 6.0, 12.0, 14.0]])
+        x = np.linspace(0.5, 12.5, 12)
+
+        for method in LINEAR_SPLINE_METHODS:
+
+            if method == 'bsplines':
+                opts = {'num_cp': 6}
+            else:
+                opts = {'x_cp_val': xcp}
+
+            prob = om.Problem()
+
+            for precompute_basis in (False, True):
+                comp = om.SplineComp(method=method, vec_size=2, x_interp_val=x,
+                                     precompute_basis=precompute_basis, **opts)
+
+                comp.add_spline(y_cp_name='ycp', y_interp_name='y_val', y_cp_val=ycp)
+                comp.add_spline(y_cp_name='ycp2', y_interp_name='y_val2', y_cp_val=ycp[::-1])
+                prob.model.add_subsystem(str(precompute_basis), comp)
+
+            prob.setup(force_alloc_complex=True)
+            prob.run_model()
+
+            for name in ('y_val', 'y_val2'):
+                assert_near_equal(prob.get_val('True.' + name), prob.get_val('False.' + name),
+                                  1e-14)
+
+            derivs = prob.check_partials(out_stream=None, method='cs', includes=['True'])
+            assert_check_partials(derivs, atol=1e-12, rtol=1e-12)
+
+            self.assertEqual(len(prob.model._get_subsystem('False').interps), 2)
+            self.assertEqual(len(prob.model._get_subsystem('True').interps), 0)
+
+            basis = prob.model._get_subsystem('True')._basis
+            self.assertEqual(basis.shape, (12, 6))
+
+            if method == 'slinear':
+                # Each interpolated point only depends on the two control points around it.
+                self.assertEqual(basis.nnz, 2 * 12)
+
     def test_bspline_interp_basic(self):
         prob = om.Problem()
         model = prob.model
@@ -344,6 +388,22 @@ class SplineCompTestCase(unittest.TestCase):
         msg = "SplineComp (interp): Either option 'x_cp_val' or 'num_cp' must be set."
         self.assertEqual(str(cm.exception), msg)
 
+        prob = om.Problem()
+
+        comp = om.SplineComp(method='akima', x_interp_val=tt, x_cp_val=t, precompute_basis=True)
+
+        prob.model.add_subsystem('interp', comp)
+
+        comp.add_spline(y_cp_name='h_cp', y_interp_name='h', y_cp_val=x, y_units='km')
+
+        with self.assertRaises(ValueError) as cm:
+            prob.setup()
+
+        msg = "SplineComp (interp): Option 'precompute_basis' is not available for method " \
+              "'akima'. It can be used with methods ['slinear', 'lagrange2', 'lagrange3', " \
+              "'cubic', 'bsplines', 'scipy_cubic', 'scipy_slinear', 'scipy_quintic']."
+        self.assertEqual(str(cm.exception), msg)
+
     def test_y_units(self):
         x_cp = np.array([1.0, 2.0, 4.0, 6.0, 10.0, 12.0])
         y_cp = np.array([5.0, 12.0, 14.0, 16.0, 21.0, 29.0])
@@ -181,6 +181,12 @@ class Problem(object):
         self.options.declare('coloring_dir', types=str,
                              default=os.path.join(os.getcwd(), 'coloring_files'),
                              desc='Directory containing coloring files (if any) for this Problem.')
+        self.options.declare('deriv_procs', types=int, default=1, lower=1,
+                             desc='Number of local processes used to solve the linear systems of '
+                                  'independent total derivative seeds (or colors) in parallel. '
+                                  'Each process is a forked copy of the linearized model. This '
+                                  'is ignored when running under MPI or on platforms without '
+                                  'fork.')
         self.options.update(options)
 
         # Case recording options
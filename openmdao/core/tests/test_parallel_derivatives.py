@@ -15,7 +15,9 @@ from openmdao.test_suite.components.sellar import SellarDerivatives, \
     SellarDis1withDerivatives, SellarDis2withDerivatives
 from openmdao.test_suite.groups.parallel_groups import FanOutGrouped, FanInGrouped
 from openmdao.utils.assert_utils import assert_near_equal
+from openmdao.utils.concurrent import fork_available
 from openmdao.utils.mpi import MPI
+from openmdao.utils.testing_utils import use_tempdirs
 
 
 if MPI:
@@ -784,6 +786,92 @@ class CleanupTestCase(unittest.TestCase):
                              ['inputs.x'], return_format='dict')
 
 
+@unittest.skipUnless(fork_available(), "Forked derivative processes require fork and no MPI.")
+@use_tempdirs
+class ForkedDerivsTestCase(unittest.TestCase):
+
+    def _build(self, mode, deriv_procs):
+        prob = om.Problem(deriv_procs=deriv_procs)
+        model = prob.model
+        model.add_subsystem('px', om.IndepVarComp('x', np.linspace(1.0, 2.0, 5)),
+                            promotes=['x'])
+        model.add_subsystem('pz', om.IndepVarComp('z', np.array([5.0, 2.0])), promotes=['z'])
+        model.add_subsystem('d1', om.ExecComp('y1 = z[0]**2 + z[1] + x - 0.2*y2',
+                                              x=np.ones(5), y1=np.ones(5), y2=np.ones(5),
+                                              z=np.ones(2)),
+                            promotes=['*'])
+        model.add_subsystem('d2', om.ExecComp('y2 = y1**.5 + z[0] + z[1]', y1=np.ones(5),
+                                              y2=np.ones(5), z=np.ones(2)),
+                            promotes=['*'])
+        model.add_subsystem('obj', om.ExecComp('f = sum(x**2) + sum(y1) + sum(y2)',
+                                               x=np.ones(5), y1=np.ones(5), y2=np.ones(5)),
+                            promotes=['*'])
+
+        model.nonlinear_solver = om.NonlinearBlockGS(atol=1e-12, rtol=1e-12)
+        model.linear_solver = om.LinearBlockGS(atol=1e-12, rtol=1e-12)
+
+        model.add_design_var('x')
+        model.add_design_var('z')
+        model.add_objective('f')
+        model.add_constraint('y1', upper=10.0)
+        model.add_constraint('y2', upper=10.0)
+
+        prob.setup(mode=mode)
+        prob.set_solver_print(level=0)
+        prob.run_model()
+        return prob
+
+    def test_fwd_rev(self):
+        for mode in ('fwd', 'rev'):
+            J_serial = self._build(mode, 1).compute_totals()
+            J_forked = self._build(mode, 3).compute_totals()
+
+            self.assertEqual(set(J_serial), set(J_forked))
+            for key in J_serial:
+                assert_near_equal(J_forked[key], J_serial[key], 1e-10)
+
+    def test_driver_totals(self):
+        prob_forked = self._build('rev', 2)
+        prob_serial = self._build('rev', 1)
+        J_forked = prob_forked.driver._compute_totals(return_format='array')
+        J_serial = prob_serial.driver._compute_totals(return_format='array')
+
+        assert_near_equal(J_forked, J_serial, 1e-10)
+
+    def test_large_jacobian(self):
+        A = np.random.RandomState(11).rand(800, 1600)
+
+        class LinearComp(om.ExplicitComponent):
+            def setup(self):
+                self.add_input('x', np.ones(A.shape[1]))
+                self.add_output('y', np.ones(A.shape[0]))
+                self.declare_partials('y', 'x', val=A)
+
+            def compute(self, inputs, outputs):
+                outputs['y'] = A.dot(inputs['x'])
+
+        def compute_totals(deriv_procs):
+            prob = om.Problem(deriv_procs=deriv_procs)
+            prob.model.add_subsystem('comp', LinearComp(), promotes=['*'])
+            prob.model.add_design_var('x')
+            prob.model.add_constraint('y', upper=0.0)
+            prob.setup(mode='fwd')
+            prob.run_model()
+
+            start = time.perf_counter()
+            J = prob.driver._compute_totals(return_format='array')
+            return J, time.perf_counter() - start
+
+        J_serial, serial_time = compute_totals(1)
+        J_forked, forked_time = compute_totals(4)
+
+        assert_near_equal(J_forked, A, 1e-12)
+        assert_near_equal(J_serial, A, 1e-12)
+
+        # Gathering the results must not cost more than the solves, even with a single core.
+        self.assertLess(forked_time, 1.5 * serial_time)
+
+
 @unittest.skipUnless(MPI and PETScVector, "MPI and PETSc are required.")
 class CheckParallelDerivColoringEfficiency(unittest.TestCase):
     # these tests check that redudant calls to compute_jacvec_product
@@ -3,6 +3,7 @@ Helper class for total jacobian computation.
 """
 from collections import OrderedDict, defaultdict
 from copy import deepcopy
+import multiprocessing
 import os
 import pprint
 import sys
@@ -12,6 +13,7 @@ import numpy as np
 
 from openmdao.core.constants import INT_DTYPE
 from openmdao.utils.general_utils import ContainsAll, simple_warning, prom2ivc_src_dict
+from openmdao.utils.concurrent import fork_available, fork_map
 
 from openmdao.utils.mpi import MPI
 from openmdao.utils.coloring import _initialize_model_approx, Coloring
@@ -63,6 +65,8 @@ class _TotalJacInfo(object):
         Dict of indices keyed to solution vectors.
     mode : str
         If 'fwd' compute deriv in forward mode, else if 'rev', reverse (adjoint) mode.
+    num_procs : int
+        Number of forked local processes used to solve the derivative seeds.
     model : <System>
         The top level System of the System tree.
     of_meta : dict
@@ -137,6 +141,11 @@ class _TotalJacInfo(object):
         self.par_deriv = {}
         self.par_deriv_printnames = {}
 
+        if fork_available():
+            self.num_procs = problem.options['deriv_procs']
+        else:
+            self.num_procs = 1
+
         if isinstance(wrt, str):
             wrt = [wrt]
 
@@ -1348,10 +1357,6 @@ class _TotalJacInfo(object):
             Derivatives in form requested by 'return_format'.
         """
         debug_print = self.debug_print
-        par_deriv = self.par_deriv
-        par_print = self.par_deriv_printnames
-
-        has_lin_cons = self.has_lin_cons
 
         model = self.model
         vec_dinput = model._vectors['input']
@@ -1373,51 +1378,16 @@ class _TotalJacInfo(object):
         self.J[:] = 0.0
 
         # Main loop over columns (fwd) or rows (rev) of the jacobian
-        for mode in self.idx_iter_dict:
-            for key, idx_info in self.idx_iter_dict[mode].items():
-                imeta, idx_iter = idx_info
-                for inds, input_setter, jac_setter, itermeta in idx_iter(imeta, mode):
-                    rel_systems, vec_names, cache_key = input_setter(inds, itermeta, mode)
-
-                    if debug_print:
-                        if par_deriv and key in par_deriv:
-                            varlist = '(' + ', '.join([name for name in par_print[key]]) + ')'
-                            print('Solving color:', key, varlist)
-                        else:
-                            print('In mode: %s, Solving variable(s) using simul coloring:' % mode)
-                            if key == '@simul_coloring':
-                                for local_ind in imeta['coloring']._local_indices(inds=inds,
-                                                                                  mode=self.mode):
-                                    print("   {}".format(local_ind))
-                            else:
-                                print_key = key
-                                if key in self.ivc_print_names:
-                                    print_key = self.ivc_print_names[key]
-                                print("('{0}', [{1}])".format(print_key, inds))
-
-                        sys.stdout.flush()
-                        t0 = time.time()
-
-                    # restore old linear solution if cache_linear_solution was set by the user for
-                    # any input variables involved in this linear solution.
-                    with model._scaled_context_all():
-                        if cache_key is not None and not has_lin_cons and self.mode == mode:
-                            self._restore_linear_solution(vec_names, cache_key, self.mode)
-                            model._solve_linear(model._lin_vec_names, self.mode, rel_systems)
-                            self._save_linear_solution(vec_names, cache_key, self.mode)
-                        else:
-                            if par_deriv and key in par_deriv:
-                                # parallel colored derivatives only need to solve
-                                # the vectors relevant to this color, not all of them
-                                vecnames_par_deriv = par_deriv[key].copy()
-                                model._solve_linear(vecnames_par_deriv, mode, rel_systems)
-                            else:
-                                model._solve_linear(model._lin_vec_names, mode, rel_systems)
-
-                    if debug_print:
-                        print('Elapsed Time:', time.time() - t0, '\n', flush=True)
+        seeds = [(mode, key, inds, input_setter, jac_setter, itermeta)
+                 for mode in self.idx_iter_dict
+                 for key, (imeta, idx_iter) in self.idx_iter_dict[mode].items()
+                 for inds, input_setter, jac_setter, itermeta in idx_iter(imeta, mode)]
 
-                    jac_setter(inds, mode)
+        if self.num_procs > 1 and len(seeds) > 1 and not debug_print:
+            self._compute_seeds_forked(seeds)
+        else:
+            for seed in seeds:
+                self._compute_seed(*seed)
 
         # Driver scaling.
         if self.has_scaling:
@@ -1431,6 +1401,107 @@ class _TotalJacInfo(object):
 
         return self.J_final
 
+    def _compute_seed(self, mode, key, inds, input_setter, jac_setter, itermeta):
+        """
+        Solve for a single seed and set the result into the total jacobian.
+
+        Parameters
+        ----------
+        mode : str
+            Direction of derivative solution.
+        key : str
+            Key of the outer iteration in idx_iter_dict that this seed came from.
+        inds : int or list or ndarray of int
+            Total jacobian row or column indices.
+        input_setter : method
+            Input setter method.
+        jac_setter : method
+            Jac setter method.
+        itermeta : dict or None
+            Iteration metadata.
+        """
+        model = self.model
+        debug_print = self.debug_print
+        par_deriv = self.par_deriv
+
+        rel_systems, vec_names, cache_key = input_setter(inds, itermeta, mode)
+
+        if debug_print:
+            if par_deriv and key in par_deriv:
+                varlist = '(' + ', '.join([name for name in self.par_deriv_printnames[key]]) + ')'
+                print('Solving color:', key, varlist)
+            else:
+                print('In mode: %s, Solving variable(s) using simul coloring:' % mode)
+                if key == '@simul_coloring':
+                    for local_ind in self.idx_iter_dict[mode][key][0]['coloring']._local_indices(
+                            inds=inds, mode=self.mode):
+                        print("   {}".format(local_ind))
+                else:
+                    print_key = key
+                    if key in self.ivc_print_names:
+                        print_key = self.ivc_print_names[key]
+                    print("('{0}', [{1}])".format(print_key, inds))
+
+            sys.stdout.flush()
+            t0 = time.time()
+
+        # restore old linear solution if cache_linear_solution was set by the user for
+        # any input variables involved in this linear solution.
+        with model._scaled_context_all():
+            if cache_key is not None and not self.has_lin_cons and self.mode == mode:
+                self._restore_linear_solution(vec_names, cache_key, self.mode)
+                model._solve_linear(model._lin_vec_names, self.mode, rel_systems)
+                self._save_linear_solution(vec_names, cache_key, self.mode)
+            else:
+                if par_deriv and key in par_deriv:
+                    # parallel colored derivatives only need to solve
+                    # the vectors relevant to this color, not all of them
+                    vecnames_par_deriv = par_deriv[key].copy()
+                    model._solve_linear(vecnames_par_deriv, mode, rel_systems)
+                else:
+                    model._solve_linear(model._lin_vec_names, mode, rel_systems)
+
+        if debug_print:
+            print('Elapsed Time:', time.time() - t0, '\n', flush=True)
+
+        jac_setter(inds, mode)
+
+    def _compute_seeds_forked(self, seeds):
+        """
+        Solve the given seeds using forked copies of the linearized model.
+
+        Each seed sets a distinct set of rows or columns of the total jacobian, so while the seeds
+        are solved the jacobian is replaced by an array in shared memory that the workers write
+        their results into directly.
+
+        Parameters
+        ----------
+        seeds : list of tuple
+            Arguments to _compute_seed for each seed.
+        """
+        J = self.J
+        shared = multiprocessing.get_context('fork').RawArray('d', J.size)
+        self.J = np.frombuffer(shared).reshape(J.shape)
+
+        def _solve(chunk):
+            for i in chunk:
+                self._compute_seed(*seeds[i])
+
+        # send the seeds in a few chunks per worker to keep the messages to the workers down
+        nprocs = min(self.num_procs, len(seeds))
+        nchunks = min(len(seeds), 4 * nprocs)
+        chunks = [range(i, len(seeds), nchunks) for i in range(nchunks)]
+
+        try:
+            results = fork_map(_solve, chunks, nprocs)
+            for _, err in results:
+                if err is not None:
+                    raise RuntimeError("A derivative process failed:\n%s" % err)
+
+            J[:] = self.J
+        finally:
+            self.J = J
+
     def compute_totals_approx(self, initialize=False):
         """
         Compute derivatives of desired quantities with respect to desired inputs.
@@ -15,12 +15,15 @@ John Wiley & Sons, Ltd.
 """
 import os
 import copy
+import traceback
 
 import numpy as np
 
 import openmdao
 from openmdao.core.driver import Driver, RecordingDebugging
-from openmdao.utils.concurrent import concurrent_eval
+from openmdao.drivers.surrogate_screen import SurrogateScreen
+from openmdao.surrogate_models.surrogate_model import SurrogateModel
+from openmdao.utils.concurrent import concurrent_eval, concurrent_eval_lb
 from openmdao.utils.mpi import MPI
 from openmdao.core.analysis_error import AnalysisError
 
@@ -97,6 +100,30 @@ class DifferentialEvolutionDriver(Driver):
                              desc='Set to True to execute the points in a generation in parallel.')
         self.options.declare('procs_per_model', default=1, lower=1,
                              desc='Number of processors to give each model under MPI.')
+        self.options.declare('load_balance', types=bool, default=False,
+                             desc='When running in parallel, set to True to have rank 0 send each '
+                             'point to the next model that is free instead of dividing the '
+                             'population evenly among the models. Rank 0 (and the rest of its '
+                             'model, if procs_per_model > 1) only schedules the points.')
+        self.options.declare('asynchronous', types=bool, default=False,
+                             desc='Set to True to use a steady-state algorithm after the initial '
+                             'population has been evaluated. A new point is created as soon as '
+                             'any point has been evaluated, and its parent is replaced right away '
+                             'if it is better, instead of waiting for the whole generation. '
+                             'When running in parallel, rank 0 schedules the points as with '
+                             'load_balance.')
+        self.options.declare('surrogate', types=SurrogateModel, default=None, allow_none=True,
+                             desc='Surrogate model of the fitness, which is trained on the points '
+                             'that have been evaluated. When given, the surrogate ranks the new '
+                             'points in each generation, and only the best ones are evaluated. '
+                             'The rest do not replace their parents. This can not be used with '
+                             'asynchronous.')
+        self.options.declare('screen_fraction', default=0.5, lower=0., upper=1.,
+                             desc='Fraction of the points in each generation that are evaluated '
+                             'when a surrogate is given.')
+        self.options.declare('surrogate_max_points', types=int, default=500, lower=2,
+                             desc='Maximum number of evaluated points that the surrogate is '
+                             'trained on. The most recently evaluated points are used.')
         self.options.declare('penalty_parameter', default=10., lower=0.,
                              desc='Penalty function parameter.')
         self.options.declare('penalty_exponent', default=1.,
@@ -133,7 +160,8 @@ class DifferentialEvolutionDriver(Driver):
         elif not self.options['run_parallel']:
             comm = None
 
-        self._ga = DifferentialEvolution(self.objective_callback, comm=comm, model_mpi=model_mpi)
+        self._ga = DifferentialEvolution(self.objective_callback, comm=comm, model_mpi=model_mpi,
+                                         batch_objfun=self.batch_objective_callback)
 
     def _setup_comm(self, comm):
         """
@@ -197,6 +225,18 @@ class DifferentialEvolutionDriver(Driver):
         """
         model = self._problem().model
         ga = self._ga
+        ga.load_balance = self.options['load_balance']
+        ga.asynchronous = self.options['asynchronous']
+
+        surrogate = self.options['surrogate']
+        if surrogate is not None:
+            if ga.asynchronous:
+                raise RuntimeError("{}: Option 'surrogate' cannot be used when 'asynchronous' is "
+                                   "True.".format(self.msginfo))
+            ga.screen = SurrogateScreen(surrogate, self.options['screen_fraction'],
+                                        self.options['surrogate_max_points'])
+        else:
+            ga.screen = None
 
         pop_size = self.options['pop_size']
         max_gen = self.options['max_gen']
@@ -409,6 +449,34 @@ class DifferentialEvolutionDriver(Driver):
 
         return fun, success, icase
 
+    def batch_objective_callback(self, population):
+        """
+        Evaluate problem objective at all points in a population.
+
+        This is used instead of objective_callback when not running in parallel. It evaluates the
+        points one at a time, but it can be overridden to evaluate the whole population at once,
+        e.g. with a vectorized model or an executor.
+
+        Parameters
+        ----------
+        population : ndarray
+            Values of the design variables, with one row per point.
+
+        Returns
+        -------
+        ndarray
+            Objective value of each point.
+        ndarray
+            Success flag of each point, True if successful.
+        """
+        fitness = np.empty(len(population))
+        success = np.empty(len(population), dtype=bool)
+
+        for ii, x in enumerate(population):
+            fitness[ii], success[ii], _ = self.objective_callback(x, ii)
+
+        return fitness, success
+
 
 class DifferentialEvolution(object):
     """
@@ -418,10 +486,17 @@ class DifferentialEvolution(object):
 
     Attributes
     ----------
+    asynchronous : bool
+        When True, use a steady-state algorithm after the initial population has been evaluated.
+    batch_objfun : function or None
+        Callback that evaluates a whole population in serial, returning arrays of objective values
+        and success flags. If None, objfun is called for each point.
     comm : MPI communicator or None
         The MPI communicator that will be used objective evaluation for each generation.
     lchrom : int
         Chromosome length.
+    load_balance : bool
+        When True, dynamically schedule the points in a generation when running in parallel.
     model_mpi : None or tuple
         If the model in objfun is also parallel, then this will contain a tuple with the the
         total number of population points to evaluate concurrently, and the color of the point
@@ -430,9 +505,11 @@ class DifferentialEvolution(object):
         Population size.
     objfun : function
         Objective function callback.
+    screen : <SurrogateScreen> or None
+        If not None, chooses the points in each generation that are evaluated.
     """
 
-    def __init__(self, objfun, comm=None, model_mpi=None):
+    def __init__(self, objfun, comm=None, model_mpi=None, batch_objfun=None):
         """
         Initialize genetic algorithm object.
 
@@ -446,12 +523,19 @@ class DifferentialEvolution(object):
             If the model in objfun is also parallel, then this will contain a tuple with the the
             total number of population points to evaluate concurrently, and the color of the point
             to evaluate on this rank.
+        batch_objfun : function or None
+            Callback that evaluates a whole population in serial, returning arrays of objective
+            values and success flags. If None, objfun is called for each point.
         """
         self.objfun = objfun
+        self.batch_objfun = batch_objfun
         self.comm = comm
 
         self.lchrom = 0
         self.npop = 0
+        self.load_balance = False
+        self.asynchronous = False
+        self.screen = None
         self.model_mpi = model_mpi
 
     def execute_ga(self, x0, vlb, vub, pop_size, max_gen, random_state, F=0.5, Pc=0.5):
@@ -506,23 +590,31 @@ class DifferentialEvolution(object):
         # Main Loop
         nfit = 0
         for generation in range(max_gen + 1):
-            # Evaluate fitness of points in this generation
-            if comm is not None:  # Parallel
+            if comm is not None:
                 # Since GA is random, ranks generate different new populations, so just take one
                 # and use it on all.
                 population = comm.bcast(population, root=0)
 
-                cases = [((item, ii), None) for ii, item in enumerate(population)]
+            eval_idx = list(range(self.npop))
 
-                # Pad the cases with some dummy cases to make the cases divisible amongst the procs.
-                # TODO: Add a load balancing option to this driver.
-                extra = len(cases) % comm.size
-                if extra > 0:
-                    for j in range(comm.size - extra):
-                        cases.append(cases[-1])
+            # Only evaluate the most promising points. The rest keep an infinite fitness.
+            if self.screen is not None:
+                # The surrogate is only trained on rank 0.
+                if comm is None or comm.rank == 0:
+                    eval_idx = self.screen.select(population, eval_idx)
+                if comm is not None:
+                    eval_idx = comm.bcast(eval_idx, root=0)
 
-                results = concurrent_eval(self.objfun, cases, comm,
-                                          allgather=True, model_mpi=self.model_mpi)
+            # Evaluate fitness of points in this generation
+            if comm is not None:  # Parallel
+                cases = [((population[ii], ii), None) for ii in eval_idx]
+
+                if self.load_balance:
+                    results = concurrent_eval_lb(self.objfun, cases, comm, broadcast=True,
+                                                 model_mpi=self.model_mpi)
+                else:
+                    results = concurrent_eval(self.objfun, cases, comm,
+                                              allgather=True, model_mpi=self.model_mpi)
 
                 fitness[:] = np.inf
                 for result in results:
@@ -537,11 +629,17 @@ class DifferentialEvolution(object):
                         # Print the traceback if it fails
                         print('A case failed:')
                         print(traceback)
+            elif self.batch_objfun is not None:  # Serial, whole population at once
+                fitness[eval_idx], _ = self.batch_objfun(population[eval_idx])
+                nfit += len(eval_idx)
             else:  # Serial
-                for ii in range(self.npop):
+                for ii in eval_idx:
                     fitness[ii], success, _ = self.objfun(population[ii], 0)
                     nfit += 1
 
+            if self.screen is not None:
+                self.screen.add_points(population, fitness)
+
             # Find best performing point in this generation.
             min_fit = np.min(fitness)
             min_index = np.argmin(fitness)
@@ -559,6 +657,10 @@ class DifferentialEvolution(object):
             if generation == 0:
                 parentPop = copy.deepcopy(population)
                 parentFitness = copy.deepcopy(fitness)
+
+                if self.asynchronous:
+                    return self._steady_state(parentPop, parentFitness, xopt, fopt, nfit,
+                                              max_gen, rng, F, Pc, vlb, vub)
             else:
                 for ii in range(self.npop):
                     if fitness[ii] < parentFitness[ii]:  # if child is better, else parent unchanged
@@ -566,30 +668,152 @@ class DifferentialEvolution(object):
                         parentFitness[ii] = fitness[ii]
 
             # Evolve new generation.
-            population = np.zeros(np.shape(parentPop))
+            population = self.evolve(parentPop, rng, F, Pc, vlb, vub)
             fitness = np.ones(self.npop) * np.inf
 
-            for ii in range(self.npop):
-                # randomly select 3 different population members other than the current choice
-                a, b, c = ii, ii, ii
-                while a == ii:
-                    a = rng.integers(0, self.npop)
-                while b == ii or b == a:
-                    b = rng.integers(0, self.npop)
-                while c == ii or c == a or c == b:
-                    c = rng.integers(0, self.npop)
-
-                # randomly select chromosome index for forced crossover
-                r = rng.integers(0, self.lchrom)
-
-                # crossover and mutation
-                population[ii] = parentPop[ii]  # start the same as parent
-                # clip mutant so that it cannot be outside the bounds
-                mutant = np.clip(parentPop[a] + F * (parentPop[b] - parentPop[c]), vlb, vub)
-                # sometimes replace parent's feature with mutant's
-                rr = rng.random(self.lchrom)
-                idx = np.where(rr < Pc)
-                population[ii][idx] = mutant[idx]
-                population[ii][r] = mutant[r]  # always replace at least one with mutant's
+        return xopt, fopt, nfit
+
+    def _steady_state(self, parentPop, parentFitness, xopt, fopt, nfit, max_gen, rng, F, Pc,
+                      vlb, vub):
+        """
+        Evolve the evaluated initial population with a steady-state algorithm.
+
+        The parents are visited in turn, and a child of the next parent is created as soon as a
+        model is free to evaluate it. When the evaluation of a child finishes, it replaces its
+        parent if it is better, so later children are created from the updated population.
+
+        Parameters
+        ----------
+        parentPop : ndarray
+            Evaluated initial population. This is updated in place.
+        parentFitness : ndarray
+            Objective value of each point in the population. This is updated in place.
+        xopt : ndarray
+            Best design point in the initial population.
+        fopt : float
+            Objective value at best design point in the initial population.
+        nfit : int
+            Number of successful function evaluations of the initial population.
+        max_gen : int
+            Number of generations to run the GA. Each generation is npop evaluations.
+        rng : np.random.Generator
+            Random number generator.
+        F : float
+            Differential rate
+        Pc : float
+            Crossover rate
+        vlb : ndarray
+            Lower bounds array.
+        vub : ndarray
+            Upper bounds array.
+
+        Returns
+        -------
+        ndarray
+            Best design point
+        float
+            Objective value at best design point.
+        int
+            Number of successful function evaluations.
+        """
+        comm = self.comm
+        npop = self.npop
+        children = {}
+
+        def cases():
+            for icase in range(max_gen * npop):
+                ii = icase % npop
+                child = self.evolve(parentPop, rng, F, Pc, vlb, vub, targets=[ii])[0]
+                children[icase] = (ii, child)
+                yield (child, icase), None
+
+        def evaluate(x, icase):
+            # Trap errors here rather than in concurrent_eval_lb, so that a failed case still
+            # reports which child it was.
+            try:
+                return self.objfun(x, icase) + (None, )
+            except Exception:
+                return None, False, icase, traceback.format_exc()
+
+        def update(returns, err):
+            nonlocal xopt, fopt, nfit
+
+            val, success, icase, err = returns
+            ii, child = children.pop(icase)
+            if success:
+                nfit += 1
+                if val < parentFitness[ii]:
+                    parentPop[ii] = child
+                    parentFitness[ii] = val
+
+                    if parentFitness[ii] < fopt:
+                        fopt = parentFitness[ii]
+                        xopt = child
+            elif err is not None:
+                # Print the traceback if it fails. The parent keeps its place in the population.
+                print('A case failed:')
+                print(err)
+
+        concurrent_eval_lb(evaluate, cases(), comm, model_mpi=self.model_mpi, callback=update)
+
+        if comm is not None:
+            xopt, fopt, nfit = comm.bcast((xopt, fopt, nfit), root=0)
 
         return xopt, fopt, nfit
+
+    @staticmethod
+    def evolve(parentPop, rng, F, Pc, vlb, vub, targets=None):
+        """
+        Create the next generation with mutation and crossover of the whole population at once.
+
+        Each new member is a copy of its parent in which each feature is replaced with probability
+        Pc, and at least one feature is always replaced, by the mutant a + F * (b - c), where a, b
+        and c are three different members other than the parent.
+
+        Parameters
+        ----------
+        parentPop : ndarray
+            Parent population, with one row per member.
+        rng : np.random.Generator
+            Random number generator.
+        F : float
+            Differential rate
+        Pc : float
+            Crossover rate
+        vlb : ndarray
+            Lower bounds array.
+        vub : ndarray
+            Upper bounds array.
+        targets : list of int or None
+            Indices of the parents to create new members for. If None, every parent has one.
+
+        Returns
+        -------
+        ndarray
+            The new population.
+        """
+        npop, lchrom = parentPop.shape
+        if targets is None:
+            targets = np.arange(npop)
+        n = len(targets)
+
+        # randomly select 3 different population members other than the current choice. Each
+        # one is drawn uniformly from the members that haven't been picked yet, by shifting the
+        # draw past the members that have been picked, in increasing order.
+        picked = np.asarray(targets)[:, np.newaxis]
+        for k in range(1, 4):
+            draw = rng.integers(0, npop - k, n)
+            for col in np.sort(picked, axis=1).T:
+                draw += draw >= col
+            picked = np.hstack((picked, draw[:, np.newaxis]))
+        a, b, c = picked[:, 1:].T
+
+        # clip mutants so that they cannot be outside the bounds
+        mutant = np.clip(parentPop[a] + F * (parentPop[b] - parentPop[c]), vlb, vub)
+
+        # sometimes replace parent's feature with mutant's, and always replace at least one,
+        # chosen at random
+        cross = rng.random((n, lchrom)) < Pc
+        cross[np.arange(n), rng.integers(0, lchrom, n)] = True
+
+        return np.where(cross, mutant, parentPop[targets])
@@ -4,13 +4,22 @@ Design-of-Experiments Driver.
 
 import traceback
 import inspect
+from collections import OrderedDict
+import time
+from contextlib import closing
+from copy import deepcopy
+from itertools import islice
+
+import numpy as np
 
 from openmdao.core.driver import Driver, RecordingDebugging
 from openmdao.core.analysis_error import AnalysisError
 from openmdao.drivers.doe_generators import DOEGenerator, ListGenerator
 
+from openmdao.utils.concurrent import concurrent_eval_lb, fork_available, fork_imap
 from openmdao.utils.mpi import MPI
 
+from openmdao.recorders.case_reader import CaseReader
 from openmdao.recorders.sqlite_recorder import SqliteRecorder
 
 
@@ -20,6 +29,9 @@ class DOEDriver(Driver):
 
     Attributes
     ----------
+    case_timing : list of tuple
+        Case index, model color and wall time in seconds of each case that was run, in the order
+        in which they finished. When load balancing, this includes the cases from all procs.
     _name : str
         The name used to identify this driver in recorded cases.
     _recorders : list
@@ -72,6 +84,7 @@ class DOEDriver(Driver):
         self._recorders = []
         self._problem_comm = None
         self._color = None
+        self.case_timing = []
 
     def _declare_options(self):
         """
@@ -83,6 +96,30 @@ class DOEDriver(Driver):
                              desc='Set to True to execute cases in parallel.')
         self.options.declare('procs_per_model', types=int, default=1, lower=1,
                              desc='Number of processors to give each model under MPI.')
+        self.options.declare('load_balance', types=bool, default=False,
+                             desc='When run_parallel is True, set to True to have rank 0 run '
+                             'the generator and send each case to the next model that is free, '
+                             'instead of every proc running the generator and assigning the '
+                             'cases to the models in turn. Rank 0 (and the rest of its model) '
+                             'only runs cases when there is a single model.')
+        self.options.declare('local_procs', types=int, default=1, lower=1,
+                             desc='Number of local processes to run cases in when not running '
+                             'under MPI. The set up model is forked into this many worker '
+                             'processes, which send the data to be recorded for each case back '
+                             'to this process. Ignored under MPI or where fork is not available.')
+        self.options.declare('batch_size', types=int, default=1, lower=1,
+                             desc='Number of cases to run in each evaluation of the model. When '
+                             'greater than 1, the model must be vectorized so that each design '
+                             'variable holds the values for batch_size cases, stacked along its '
+                             'first dimension. Recorded variables whose first dimension is '
+                             'batch_size are split among the cases.')
+        self.options.declare('resume_from', types=(str, list), default=None, allow_none=True,
+                             desc='Case recording file, or list of files when they were '
+                             'recorded in parallel, of an interrupted run of the same DOE. Cases '
+                             'that were recorded as successful are skipped, and all other cases '
+                             'are run. The recording must have '
+                             'been made by a serial or load balanced run, where the iteration '
+                             'counter is the index of the case in the generator.')
 
     def _setup_comm(self, comm):
         """
@@ -158,21 +195,373 @@ class DOEDriver(Driver):
             Failure flag; True if failed to converge, False is successful.
         """
         self.iter_count = 0
+        self.case_timing = []
 
         # set driver name with current generator
         self._set_name()
 
+        done = self._get_recorded_cases()
+
+        batch_size = self.options['batch_size']
+        if batch_size > 1 and (self.options['local_procs'] > 1 or
+                               (self.options['run_parallel'] and self.options['load_balance'])):
+            raise RuntimeError("{}: Option 'batch_size' cannot be combined with 'local_procs' or "
+                               "'load_balance'.".format(self.msginfo))
+
+        if self.options['run_parallel'] and self.options['load_balance']:
+            self._run_load_balanced(done)
+            return False
+
+        if self.options['local_procs'] > 1 and fork_available():
+            self._run_forked(done)
+            return False
+
         if MPI and self.options['run_parallel']:
-            case_gen = self._parallel_generator
+            # run the cases for this proc's color
+            size = self._problem_comm.size // self.options['procs_per_model']
+            case_gen = self._iter_cases(done, self._color, size)
         else:
-            case_gen = self.options['generator']
+            case_gen = self._iter_cases(done)
 
-        for case in case_gen(self._designvars, self._problem().model):
-            self._run_case(case)
+        if batch_size > 1:
+            while True:
+                batch = list(islice(case_gen, batch_size))
+                if not batch:
+                    break
+                self._run_batch(batch)
+
+            return False
+
+        for i, case in case_gen:
+            if not (MPI and self.options['run_parallel']):
+                self.iter_count = i
+
+            self._run_timed_case(i, case)
             self.iter_count += 1
 
         return False
 
+    def _get_case_design_vars(self):
+        """
+        Get the metadata of the design variables for a single case.
+
+        Returns
+        -------
+        dict
+            The design variables, with sizes and bounds for one case when running batches.
+        """
+        batch_size = self.options['batch_size']
+        if batch_size == 1:
+            return self._designvars
+
+        design_vars = OrderedDict()
+        for name, meta in self._designvars.items():
+            size = meta['global_size']
+            if size % batch_size:
+                raise RuntimeError("{}: The size of design variable '{}' ({}) is not a multiple "
+                                   "of the batch size ({}).".format(self.msginfo, name, size,
+                                                                    batch_size))
+
+            meta = meta.copy()
+            size = size // batch_size
+            meta['size'] = meta['global_size'] = size
+            for bound in ('lower', 'upper'):
+                if isinstance(meta[bound], np.ndarray):
+                    meta[bound] = meta[bound][:size]
+
+            design_vars[name] = meta
+
+        return design_vars
+
+    def _run_batch(self, batch):
+        """
+        Run a batch of cases in a single evaluation of the model, and record each of them.
+
+        If there are fewer cases than the batch size, the last case is repeated.
+
+        Parameters
+        ----------
+        batch : list of tuple
+            Index and list of name, value tuples for the design variables of each case.
+        """
+        batch_size = self.options['batch_size']
+        cases = [dict(case) for _, case in batch]
+        cases.extend([cases[-1]] * (batch_size - len(batch)))
+
+        stacked = []
+        for name in cases[0]:
+            try:
+                vals = [np.asarray(case[name]).ravel() for case in cases]
+            except KeyError:
+                raise RuntimeError("{}: All cases in a batch must have values for the same "
+                                   "design variables.".format(self.msginfo))
+            stacked.append((name, np.concatenate(vals)))
+
+        # collect the data that would be recorded for the whole batch, so it can be split up
+        rec_mgr = self._rec_mgr
+        collector = self._rec_mgr = _RecordingCollector(rec_mgr)
+
+        self.iter_count = batch[0][0]
+        start = time.perf_counter()
+        try:
+            self._run_case(stacked)
+        finally:
+            self._rec_mgr = rec_mgr
+        elapsed = (time.perf_counter() - start) / len(batch)
+
+        for k, (i, _) in enumerate(batch):
+            self.case_timing.append((i, self._color, elapsed))
+
+            if collector.data is not None:
+                data, metadata = collector.data
+                self._recording_iter.push((self._get_name(), i))
+                try:
+                    rec_mgr.record_iteration(self, self._split_batch_data(data, k),
+                                             metadata.copy())
+                finally:
+                    self._recording_iter.pop()
+
+        self.iter_count = batch[-1][0] + 1
+
+    def _split_batch_data(self, data, k):
+        """
+        Get the recorded data for one case of a batch.
+
+        Parameters
+        ----------
+        data : dict
+            Recorded data for the whole batch, keyed by kind and then by variable name.
+        k : int
+            Position of the case in the batch.
+
+        Returns
+        -------
+        dict
+            Recorded data for the case.
+        """
+        batch_size = self.options['batch_size']
+        case_data = {}
+
+        for kind, vals in data.items():
+            if not isinstance(vals, dict):
+                case_data[kind] = vals
+                continue
+
+            case_data[kind] = case_vals = {}
+            for name, val in vals.items():
+                if isinstance(val, np.ndarray) and val.ndim > 0 and val.shape[0] == batch_size:
+                    val = val[k] if val.ndim > 1 else val[k:k + 1]
+                case_vals[name] = val
+
+        return case_data
+
+    def _get_recorded_cases(self):
+        """
+        Get the indices of the cases that were successfully run by a previous run of this DOE.
+
+        Returns
+        -------
+        set of int
+            Indices of the cases in the generator that do not need to be run again.
+        """
+        files = self.options['resume_from']
+        if not files:
+            return set()
+
+        if isinstance(files, str):
+            files = [files]
+
+        done = set()
+        for filename in files:
+            cr = CaseReader(filename, pre_load=False)
+            for case in cr.get_cases('driver', recurse=False):
+                name, _, counter = case.name.rpartition('|')
+                if name.rpartition(':')[2] == self._name and case.success:
+                    done.add(int(counter))
+
+        return done
+
+    def _iter_cases(self, done, offset=0, step=1):
+        """
+        Generate the cases that have not been run yet, along with their indices.
+
+        Parameters
+        ----------
+        done : set of int
+            Indices of the cases that should be skipped.
+        offset : int
+            Index of the first case.
+        step : int
+            Difference between the indices of successive cases.
+
+        Yields
+        ------
+        int
+            Index of the case in the generator.
+        list
+            list of name, value tuples for the design variables.
+        """
+        # start from the first case that has not been run, which generators that can compute a
+        # case from its index do without generating the cases before it.
+        start = offset
+        while start in done:
+            start += step
+
+        generator = self.options['generator']
+        for i, case in generator.iter_cases(self._get_case_design_vars(), self._problem().model,
+                                            start=start, step=step):
+            if i not in done:
+                yield i, case
+
+    def _run_load_balanced(self, done):
+        """
+        Run the cases with rank 0 sending each case to the next model that is free.
+
+        Parameters
+        ----------
+        done : set of int
+            Indices of the cases that should be skipped.
+        """
+        comm = self._problem_comm
+        if MPI:
+            model_mpi = (comm.size // self.options['procs_per_model'], self._color)
+        else:
+            model_mpi = None
+
+        if comm.rank == 0:
+            cases = (((i, case), None) for i, case in self._iter_cases(done))
+        else:
+            cases = None
+
+        results = concurrent_eval_lb(self._run_lb_case, cases, comm, broadcast=True,
+                                     model_mpi=model_mpi)
+
+        self.case_timing = []
+        for retval, err in results:
+            if err is not None:
+                raise RuntimeError("{}: Error running case:\n{}".format(self.msginfo, err))
+            self.case_timing.append(retval)
+
+        self.iter_count = len(results)
+
+    def _run_forked(self, done):
+        """
+        Run the cases using forked copies of the model.
+
+        This process runs the generator, and fork_imap keeps a few cases queued for each worker,
+        so the cases are never all in memory. The workers run the cases in the order they get them
+        and send back the data to be recorded, which is then recorded here. Only the driver is
+        recorded, since the systems and solvers in the workers cannot share the recorders of this
+        process.
+
+        Parameters
+        ----------
+        done : set of int
+            Indices of the cases that should be skipped.
+        """
+        results = fork_imap(self._run_forked_case, self._iter_cases(done),
+                            self.options['local_procs'], initializer=self._init_forked_worker)
+
+        # close the generator on an error so that the workers are stopped right away
+        with closing(results):
+            for _, retval, err in results:
+                if err is not None:
+                    raise RuntimeError("{}: Error running case:\n{}".format(self.msginfo, err))
+
+                i, color, elapsed, data = retval
+                self.case_timing.append((i, color, elapsed))
+                self.iter_count += 1
+
+                if data is not None:
+                    self._recording_iter.push((self._get_name(), i))
+                    try:
+                        self._rec_mgr.record_iteration(self, *data)
+                    finally:
+                        self._recording_iter.pop()
+
+    def _init_forked_worker(self, color):
+        """
+        Prepare a forked worker process to run cases.
+
+        Parameters
+        ----------
+        color : int
+            Index of this worker.
+        """
+        self._color = color
+        self._rec_mgr = _RecordingCollector(self._rec_mgr)
+
+        # turn off recording of the systems and solvers, and record the driver explicitly below.
+        self._recording_iter._norec_refcount += 1
+
+    def _run_forked_case(self, case):
+        """
+        Run a case in a forked worker process and collect the data to be recorded.
+
+        Parameters
+        ----------
+        case : tuple
+            Index of the case in the generator and list of name, value tuples for the design
+            variables.
+
+        Returns
+        -------
+        tuple
+            Case index, model color, wall time in seconds and the data and metadata to record.
+        """
+        i, case = case
+        self.iter_count = i
+        self._rec_mgr.data = None
+
+        start = time.perf_counter()
+        self._run_case(case)
+        elapsed = time.perf_counter() - start
+        self.record_iteration()
+
+        return i, self._color, elapsed, self._rec_mgr.data
+
+    def _run_lb_case(self, i, case):
+        """
+        Run a case sent by rank 0 when load balancing.
+
+        Parameters
+        ----------
+        i : int
+            Index of the case in the generator, which is used as the iteration counter.
+        case : list
+            list of name, value tuples for the design variables.
+
+        Returns
+        -------
+        tuple
+            Case index, model color and wall time in seconds.
+        """
+        self.iter_count = i
+        return self._run_timed_case(i, case)
+
+    def _run_timed_case(self, i, case):
+        """
+        Run a case and save its wall time.
+
+        Parameters
+        ----------
+        i : int
+            Index of the case in the generator.
+        case : list
+            list of name, value tuples for the design variables.
+
+        Returns
+        -------
+        tuple
+            Case index, model color and wall time in seconds.
+        """
+        start = time.perf_counter()
+        self._run_case(case)
+        timing = (i, self._color, time.perf_counter() - start)
+        self.case_timing.append(timing)
+
+        return timing
+
     def _run_case(self, case):
         """
         Run case, save exception info and mark the metadata if the case fails.
@@ -182,7 +571,9 @@ class DOEDriver(Driver):
         case : list
             list of name, value tuples for the design variables.
         """
-        metadata = {}
+        # If the case is interrupted, it is recorded as a failure.
+        metadata = {'success': 0, 'msg': 'Case did not finish.'}
+        self._metadata = metadata
 
         for dv_name, dv_val in case:
             try:
@@ -207,34 +598,6 @@ class DOEDriver(Driver):
                 metadata['msg'] = traceback.format_exc()
                 print(metadata['msg'])
 
-            # save reference to metadata for use in record_iteration
-            self._metadata = metadata
-
-    def _parallel_generator(self, design_vars, model=None):
-        """
-        Generate case for this processor when running under MPI.
-
-        Parameters
-        ----------
-        design_vars : dict
-            Dictionary of design variables for which to generate values.
-
-        model : Group
-            The model containing the design variables (used by some generators).
-
-        Yields
-        ------
-        list
-            list of name, value tuples for the design variables.
-        """
-        size = self._problem_comm.size // self.options['procs_per_model']
-        color = self._color
-
-        generator = self.options['generator']
-        for i, case in enumerate(generator(design_vars, model)):
-            if i % size == color:
-                yield case
-
     def add_recorder(self, recorder):
         """
         Add a recorder to the driver.
@@ -290,3 +653,61 @@ class DOEDriver(Driver):
         """
         self._metadata['name'] = case_name
         return self._metadata
+
+
+class _RecordingCollector(object):
+    """
+    Stand-in for the RecordingManager of a DOEDriver.
+
+    It keeps the data and metadata of the last recorded case so they can be recorded later with
+    the real recorders, either by the parent of a worker process or after splitting a batch.
+
+    Attributes
+    ----------
+    data : tuple or None
+        Data and metadata of the last recorded case.
+    _rec_mgr : <RecordingManager>
+        The RecordingManager of the driver.
+    _recorders : list
+        The recorders of the driver, which are not used but show that the driver is recorded.
+    """
+
+    def __init__(self, rec_mgr):
+        """
+        Initialize attributes.
+
+        Parameters
+        ----------
+        rec_mgr : <RecordingManager>
+            The RecordingManager of the driver.
+        """
+        self._rec_mgr = rec_mgr
+        self._recorders = rec_mgr._recorders
+        self.data = None
+
+    def _check_parallel(self):
+        """
+        Check if there are any parallel recorders.
+
+        Returns
+        -------
+        bool
+            True if any of the recorders of the driver are parallel.
+        """
+        return self._rec_mgr._check_parallel()
+
+    def record_iteration(self, recording_requester, data, metadata):
+        """
+        Keep the data and metadata of the current case.
+
+        Parameters
+        ----------
+        recording_requester : object
+            The object that needs an iteration of itself recorded.
+        data : dict
+            Dictionary containing desvars, objectives, constraints, responses, and System vars.
+        metadata : dict
+            Metadata for iteration coordinate.
+        """
+        # the queue pickles the data in another thread, so it must not be changed by the next case
+        self.data = deepcopy((data, metadata))
@@ -7,12 +7,14 @@ import numpy as np
 import os.path
 import csv
 import re
+from itertools import islice
 
 import pyDOE2
 
 from openmdao.utils.name_maps import prom_name2abs_name
 
 _LEVELS = 2  # default number of levels for pyDOE generators
+_BLOCK_SIZE = 1024  # number of cases decoded at once by generators that compute cases from indices
 
 
 class DOEGenerator(object):
@@ -39,6 +41,36 @@ class DOEGenerator(object):
         """
         return []
 
+    def iter_cases(self, design_vars, model=None, start=0, stop=None, step=1):
+        """
+        Generate the cases with indices in range(start, stop, step), along with their indices.
+
+        This can be used to resume a DOE from a given case, or to split the cases among several
+        processes. By default, the cases that are skipped are still generated, but generators that
+        can compute a case from its index skip them without generating them.
+
+        Parameters
+        ----------
+        design_vars : OrderedDict
+            Dictionary of design variables for which to generate values.
+        model : Group
+            The model containing the design variables (used by some subclasses).
+        start : int
+            Index of the first case.
+        stop : int or None
+            Index at which to stop, or None to generate all of the remaining cases.
+        step : int
+            Difference between the indices of successive cases.
+
+        Yields
+        ------
+        int
+            Index of the case.
+        list
+            list of name, value tuples for the design variables.
+        """
+        yield from islice(enumerate(self(design_vars, model)), start, stop, step)
+
 
 class ListGenerator(DOEGenerator):
     """
@@ -172,6 +204,36 @@ class CSVGenerator(DOEGenerator):
         list
             list of name, value tuples for the design variables.
         """
+        for _, case in self.iter_cases(design_vars, model):
+            yield case
+
+    def iter_cases(self, design_vars, model=None, start=0, stop=None, step=1):
+        """
+        Generate the cases with indices in range(start, stop, step), along with their indices.
+
+        The file is read one row at a time, and the values of the rows that are skipped are not
+        parsed.
+
+        Parameters
+        ----------
+        design_vars : OrderedDict
+            Dictionary of design variables for which to generate values.
+        model : Group
+            The model containing the design variables.
+        start : int
+            Index of the first case.
+        stop : int or None
+            Index at which to stop, or None to generate all of the remaining cases.
+        step : int
+            Difference between the indices of successive cases.
+
+        Yields
+        ------
+        int
+            Index of the case.
+        list
+            list of name, value tuples for the design variables.
+        """
         name_map = {}
 
         with open(self._filename, 'r') as f:
@@ -198,11 +260,11 @@ class CSVGenerator(DOEGenerator):
         # read cases from file, parse values into numpy arrays
         with open(self._filename, 'r') as f:
             reader = csv.DictReader(f)
-            for row in reader:
+            for i, row in islice(enumerate(reader), start, stop, step):
                 case = [(name_map[name.strip()],
                          np.fromstring(re.sub(r'[\[\]]', '', row[name]), sep=' '))
                         for name in reader.fieldnames]
-                yield case
+                yield i, case
 
 
 class UniformGenerator(DOEGenerator):
@@ -314,9 +376,34 @@ class _pyDOE_Generator(DOEGenerator):
         list
             list of name, value tuples for the design variables.
         """
-        size = sum([meta['global_size'] for name, meta in design_vars.items()])
+        for _, case in self.iter_cases(design_vars, model):
+            yield case
 
-        doe = self._generate_design(size)
+    def iter_cases(self, design_vars, model=None, start=0, stop=None, step=1):
+        """
+        Generate the cases with indices in range(start, stop, step), along with their indices.
+
+        Parameters
+        ----------
+        design_vars : OrderedDict
+            Dictionary of design variables for which to generate values.
+        model : Group
+            The model containing the design variables (not used).
+        start : int
+            Index of the first case.
+        stop : int or None
+            Index at which to stop, or None to generate all of the remaining cases.
+        step : int
+            Difference between the indices of successive cases.
+
+        Yields
+        ------
+        int
+            Index of the case.
+        list
+            list of name, value tuples for the design variables.
+        """
+        size = sum([meta['global_size'] for name, meta in design_vars.items()])
 
         # generate values for each level for each design variable
         # over the range of that variable's lower to upper bound
@@ -340,19 +427,45 @@ class _pyDOE_Generator(DOEGenerator):
                 values[row][:] = np.linspace(lower, upper, num=self._levels)
                 row += 1
 
+        rows = np.arange(values.shape[0])
+
         # yield values for doe generated indices
-        for idxs in doe.astype('int'):
-            retval = []
-            row = 0
-            for name, meta in design_vars.items():
-                size = meta['global_size']
-                val = np.empty(size)
-                for k in range(size):
-                    idx = idxs[row + k]
-                    val[k] = values[row + k][idx]
-                retval.append((name, val))
-                row += size
-            yield retval
+        for case_idxs, level_idxs in self._iter_design(values.shape[0], start, stop, step):
+            block = values[rows, level_idxs]
+            for i, vals in zip(case_idxs, block):
+                retval = []
+                row = 0
+                for name, meta in design_vars.items():
+                    size = meta['global_size']
+                    retval.append((name, vals[row:row + size].copy()))
+                    row += size
+                yield i, retval
+
+    def _iter_design(self, size, start, stop, step):
+        """
+        Generate blocks of rows of the DOE design.
+
+        Parameters
+        ----------
+        size : int
+            The number of factors for the design.
+        start : int
+            Index of the first case.
+        stop : int or None
+            Index at which to stop, or None to generate all of the remaining cases.
+        step : int
+            Difference between the indices of successive cases.
+
+        Yields
+        ------
+        ndarray
+            Indices of the cases in the block.
+        ndarray
+            Rows of the design matrix for the cases in the block, as arrays of level indices.
+        """
+        doe = self._generate_design(size).astype(int)
+        idxs = np.arange(len(doe))[start:stop:step]
+        yield idxs, doe[idxs]
 
     def _generate_design(self, size):
         """
@@ -374,8 +487,42 @@ class _pyDOE_Generator(DOEGenerator):
 class FullFactorialGenerator(_pyDOE_Generator):
     """
     DOE case generator implementing the Full Factorial method.
+
+    The design is not stored. Instead, the level of each factor is decoded from the index of the
+    case, with the first factor varying fastest, so the memory use does not depend on the number
+    of cases and any case can be generated without generating the ones before it.
     """
 
+    def _iter_design(self, size, start, stop, step):
+        """
+        Generate blocks of rows of the full factorial DOE design.
+
+        Parameters
+        ----------
+        size : int
+            The number of factors for the design.
+        start : int
+            Index of the first case.
+        stop : int or None
+            Index at which to stop, or None to generate all of the remaining cases.
+        step : int
+            Difference between the indices of successive cases.
+
+        Yields
+        ------
+        ndarray
+            Indices of the cases in the block.
+        ndarray
+            Rows of the design matrix for the cases in the block, as arrays of level indices.
+        """
+        levels = self._levels
+        cases = range(self._levels ** size)[start:stop:step]
+        strides = levels ** np.arange(size)
+
+        for i in range(0, len(cases), _BLOCK_SIZE):
+            idxs = np.array(cases[i:i + _BLOCK_SIZE])
+            yield idxs, (idxs[:, np.newaxis] // strides) % levels
+
     def _generate_design(self, size):
         """
         Generate a full factorial DOE design.
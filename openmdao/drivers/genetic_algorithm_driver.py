@@ -22,13 +22,19 @@ John Wiley & Sons, Ltd.
 """
 import os
 import copy
+import traceback
+import hashlib
+import zipfile
+from collections import OrderedDict
 
 import numpy as np
 from pyDOE2 import lhs
 
 import openmdao
 from openmdao.core.driver import Driver, RecordingDebugging
-from openmdao.utils.concurrent import concurrent_eval
+from openmdao.drivers.surrogate_screen import SurrogateScreen
+from openmdao.surrogate_models.surrogate_model import SurrogateModel
+from openmdao.utils.concurrent import concurrent_eval, concurrent_eval_lb
 from openmdao.utils.mpi import MPI
 from openmdao.core.analysis_error import AnalysisError
 
@@ -117,6 +123,31 @@ class SimpleGADriver(Driver):
                              desc='Set to True to execute the points in a generation in parallel.')
         self.options.declare('procs_per_model', default=1, lower=1,
                              desc='Number of processors to give each model under MPI.')
+        self.options.declare('load_balance', types=bool, default=False,
+                             desc='When running in parallel, set to True to have rank 0 send each '
+                             'point to the next model that is free instead of dividing the '
+                             'population evenly among the models. Rank 0 (and the rest of its '
+                             'model, if procs_per_model > 1) only schedules the points.')
+        self.options.declare('asynchronous', types=bool, default=False,
+                             desc='Set to True to use a steady-state algorithm after the initial '
+                             'population has been evaluated. A new point is bred as soon as any '
+                             'point has been evaluated, and it replaces the worst point in the '
+                             'population right away if it is better, instead of waiting for the '
+                             'whole generation. When running in parallel, rank 0 schedules the '
+                             'points as with load_balance. This can not be used with '
+                             'compute_pareto.')
+        self.options.declare('surrogate', types=SurrogateModel, default=None, allow_none=True,
+                             desc='Surrogate model of the fitness, which is trained on the points '
+                             'that have been evaluated. When given, the surrogate ranks the '
+                             'points in each generation, and only the best ones are evaluated. '
+                             'The rest are treated as failed points. This can not be used with '
+                             'compute_pareto or asynchronous.')
+        self.options.declare('screen_fraction', default=0.5, lower=0., upper=1.,
+                             desc='Fraction of the points in each generation that are evaluated '
+                             'when a surrogate is given.')
+        self.options.declare('surrogate_max_points', types=int, default=500, lower=2,
+                             desc='Maximum number of evaluated points that the surrogate is '
+                             'trained on. The most recently evaluated points are used.')
         self.options.declare('penalty_parameter', default=10., lower=0.,
                              desc='Penalty function parameter.')
         self.options.declare('penalty_exponent', default=1.,
@@ -132,11 +163,29 @@ class SimpleGADriver(Driver):
                              'if not given.')
         self.options.declare('multi_obj_exponent', default=1., lower=0.,
                              desc='Multi-objective weighting exponent.')
+        self.options.declare('cache_size', types=int, default=0, lower=0,
+                             desc='Maximum number of design points whose fitness is cached so '
+                             'that repeated points in the population are not evaluated again. '
+                             'Set to 0 to turn off the cache.')
+        self.options.declare('cache_file', types=str, default=None, allow_none=True,
+                             desc='Name of a file that the fitness cache is loaded from at the '
+                             'start of the run (if it exists) and saved to at the end, so that '
+                             'a restarted run can reuse previous evaluations. A saved cache is '
+                             'ignored if the design variables, objectives, constraints, or '
+                             'penalty settings have changed.')
+        self.options.declare('disp', types=bool, default=False,
+                             desc='Set to True to print the number of fitness cache hits and '
+                             'misses at the end of the run.')
         self.options.declare('compute_pareto', default=False, types=(bool, ),
                              desc='When True, compute a set of non-dominated points based on all '
                              'given objectives and update it each generation. The multi-objective '
                              'weight and exponents are ignored because the algorithm uses all '
                              'objective values instead of a composite.')
+        self.options.declare('max_pareto_size', types=int, default=None, allow_none=True,
+                             lower=1,
+                             desc='When compute_pareto is True, maximum number of non-dominated '
+                             'points to keep. When there are more, the most crowded points are '
+                             'removed. Set to None to keep all of them.')
 
     def _setup_driver(self, problem):
         """
@@ -226,6 +275,8 @@ class SimpleGADriver(Driver):
         ga.elite = self.options['elitism']
         ga.gray_code = self.options['gray']
         ga.cross_bits = self.options['cross_bits']
+        ga.load_balance = self.options['load_balance']
+        ga.asynchronous = self.options['asynchronous']
         pop_size = self.options['pop_size']
         max_gen = self.options['max_gen']
         user_bits = self.options['bits']
@@ -236,8 +287,23 @@ class SimpleGADriver(Driver):
 
         self._check_for_missing_objective()
 
+        if compute_pareto and ga.asynchronous:
+            raise RuntimeError("{}: Options 'asynchronous' and 'compute_pareto' cannot both be "
+                               "True.".format(self.msginfo))
+
+        surrogate = self.options['surrogate']
+        if surrogate is not None:
+            if compute_pareto or ga.asynchronous:
+                raise RuntimeError("{}: Option 'surrogate' cannot be used when 'asynchronous' or "
+                                   "'compute_pareto' is True.".format(self.msginfo))
+            ga.screen = SurrogateScreen(surrogate, self.options['screen_fraction'],
+                                        self.options['surrogate_max_points'])
+        else:
+            ga.screen = None
+
         if compute_pareto:
             self._ga.nobj = len(self._objs)
+            self._ga.max_pareto_size = self.options['max_pareto_size']
 
         # Size design variables.
         desvars = self._designvars
@@ -304,10 +370,29 @@ class SimpleGADriver(Driver):
         if pop_size == 0:
             pop_size = 4 * np.sum(bits)
 
+        cache_size = self.options['cache_size']
+        cache_file = self.options['cache_file']
+        if cache_size > 0:
+            signature = self._compute_cache_signature(lower_bound, upper_bound, outer_bound,
+                                                      bits)
+        else:
+            signature = None
+        ga.init_cache(cache_size, cache_file, signature)
+
         desvar_new, obj, nfit = ga.execute_ga(x0, lower_bound, upper_bound, outer_bound,
                                               bits, pop_size, max_gen,
                                               self._randomstate, Pm, Pc)
 
+        if cache_size > 0 and self._problem().comm.rank == 0:
+            if cache_file is not None:
+                ga.save_cache(cache_file)
+
+            if self.options['disp']:
+                total = ga.cache_hits + ga.cache_misses
+                rate = ga.cache_hits / total if total > 0 else 0.0
+                print('{}: Fitness cache had {} hits and {} misses ({:.1%} hit rate).'.format(
+                      self._get_name(), ga.cache_hits, ga.cache_misses, rate))
+
         if compute_pareto:
             # Just save the non-dominated points.
             self.desvar_nd = desvar_new
@@ -329,6 +414,47 @@ class SimpleGADriver(Driver):
 
         return False
 
+    def _compute_cache_signature(self, lower_bound, upper_bound, outer_bound, bits):
+        """
+        Compute a signature of everything that the cached fitness values depend on.
+
+        Parameters
+        ----------
+        lower_bound : ndarray
+            Lower bounds of the design variables.
+        upper_bound : ndarray
+            Upper bounds of the design variables, including any padding.
+        outer_bound : ndarray
+            Upper bounds of the design variables before padding.
+        bits : ndarray
+            Bits of resolution of the design variables.
+
+        Returns
+        -------
+        str
+            Hex digest of the signature.
+        """
+        sha = hashlib.sha256()
+
+        def add(*vals):
+            for val in vals:
+                if isinstance(val, np.ndarray):
+                    sha.update(np.ascontiguousarray(val, dtype=float).tobytes())
+                else:
+                    sha.update(repr(val).encode())
+
+        add(list(self._designvars), lower_bound, upper_bound, outer_bound, bits)
+        add(list(self._objs))
+        for name, meta in self._cons.items():
+            add(name, meta['lower'], meta['upper'], meta['equals'])
+
+        weights = self.options['multi_obj_weights']
+        add(self.options['penalty_parameter'], self.options['penalty_exponent'],
+            self.options['multi_obj_exponent'], self.options['compute_pareto'],
+            sorted((name, repr(val)) for name, val in weights.items()))
+
+        return sha.hexdigest()
+
     def objective_callback(self, x, icase):
         r"""
         Evaluate problem objective at the requested point.
@@ -505,6 +631,14 @@ class GeneticAlgorithm(object):
 
     Attributes
     ----------
+    asynchronous : bool
+        When True, use a steady-state algorithm after the initial population has been evaluated.
+    cache_hits : int
+        Number of population members whose fitness was found in the cache.
+    cache_misses : int
+        Number of population members that had to be evaluated while the cache was active.
+    cache_size : int
+        Maximum number of entries in the fitness cache. The cache is not used if this is 0.
     comm : MPI communicator or None
         The MPI communicator that will be used objective evaluation for each generation.
     elite : bool
@@ -516,6 +650,10 @@ class GeneticAlgorithm(object):
         so when used Pc should be increased and Pm reduced.
     lchrom : int
         Chromosome length.
+    load_balance : bool
+        When True, dynamically schedule the points in a generation when running in parallel.
+    max_pareto_size : int or None
+        Maximum number of non-dominated points to keep for multi-objective optimization.
     model_mpi : None or tuple
         If the model in objfun is also parallel, then this will contain a tuple with the the
         total number of population points to evaluate concurrently, and the color of the point
@@ -526,6 +664,13 @@ class GeneticAlgorithm(object):
         Population size.
     objfun : function
         Objective function callback.
+    screen : <SurrogateScreen> or None
+        If not None, chooses the points in each generation that are evaluated.
+    _cache : OrderedDict
+        Fitness of previously evaluated design points, keyed by the bytes of the design point and
+        ordered from least to most recently used.
+    _cache_signature : str
+        Identifies the problem that the cached fitness values belong to.
     """
 
     def __init__(self, objfun, comm=None, model_mpi=None):
@@ -548,12 +693,145 @@ class GeneticAlgorithm(object):
 
         self.lchrom = 0
         self.npop = 0
+        self.load_balance = False
+        self.asynchronous = False
         self.nobj = 1
         self.elite = True
         self.gray_code = False
         self.cross_bits = False
+        self.max_pareto_size = None
+        self.screen = None
         self.model_mpi = model_mpi
 
+        self.cache_size = 0
+        self.cache_hits = 0
+        self.cache_misses = 0
+        self._cache = OrderedDict()
+        self._cache_signature = ''
+
+    def init_cache(self, cache_size, filename=None, signature=None):
+        """
+        Clear the fitness cache and the hit statistics, and optionally load a saved cache.
+
+        Parameters
+        ----------
+        cache_size : int
+            Maximum number of entries in the fitness cache. Set to 0 to turn off the cache.
+        filename : str or None
+            Name of a file created by save_cache. It is only loaded if it exists and was saved
+            with the same signature.
+        signature : str or None
+            Identifies the problem that the cached fitness values belong to.
+        """
+        self.cache_size = cache_size
+        self.cache_hits = 0
+        self.cache_misses = 0
+        self._cache = OrderedDict()
+        self._cache_signature = '' if signature is None else signature
+
+        if cache_size > 0 and filename is not None and os.path.isfile(filename):
+            try:
+                with open(filename, 'rb') as f:
+                    data = np.load(f, allow_pickle=False)
+                    saved_signature = str(data['signature'])
+                    keys = data['keys']
+                    values = data['values']
+            except (OSError, ValueError, KeyError, zipfile.BadZipFile):
+                # Not a cache file; it will be overwritten by save_cache.
+                return
+
+            if saved_signature != self._cache_signature or keys.ndim != 2 or \
+               values.ndim != 2 or len(keys) != len(values):
+                return
+
+            for key, val in zip(keys, values):
+                self._cache[key.tobytes()] = val
+
+            while len(self._cache) > cache_size:
+                self._cache.popitem(last=False)
+
+    def save_cache(self, filename):
+        """
+        Save the fitness cache to a file, along with the signature passed to init_cache.
+
+        Parameters
+        ----------
+        filename : str
+            Name of the file.
+        """
+        cache = self._cache
+        if cache:
+            keys = np.frombuffer(b''.join(cache), dtype=np.uint8).reshape(len(cache), -1)
+            values = np.array(list(cache.values()))
+        else:
+            keys = np.empty((0, 0), dtype=np.uint8)
+            values = np.empty((0, self.nobj))
+
+        # Write through a file object so that numpy doesn't append a '.npz' extension.
+        with open(filename, 'wb') as f:
+            np.savez(f, signature=np.array(self._cache_signature), keys=keys, values=values)
+
+    def _check_cache(self, x_pop, fitness, idx):
+        """
+        Fill in cached fitness values and find the points that still need to be evaluated.
+
+        Parameters
+        ----------
+        x_pop : ndarray
+            Design points in the current generation.
+        fitness : ndarray
+            Fitness of each point in the current generation, filled in for cached points.
+        idx : iter of int
+            Indices of the points in x_pop that are candidates for evaluation.
+
+        Returns
+        -------
+        OrderedDict
+            Indices of the points to evaluate, keyed by the cache key of the design point. The
+            first index in each list is evaluated and the rest are duplicates of it.
+        """
+        cache = self._cache
+        pending = OrderedDict()
+
+        for ii in idx:
+            key = x_pop[ii].tobytes()
+            if key in cache:
+                cache.move_to_end(key)
+                fitness[ii, :] = cache[key]
+                self.cache_hits += 1
+            elif key in pending:
+                pending[key].append(ii)
+                self.cache_hits += 1
+            else:
+                pending[key] = [ii]
+                self.cache_misses += 1
+
+        return pending
+
+    def _update_cache(self, pending, fitness):
+        """
+        Store the fitness of newly evaluated points, and copy it to their duplicates.
+
+        Parameters
+        ----------
+        pending : OrderedDict
+            Indices of the evaluated points keyed by the cache key of the design point, as
+            returned by _check_cache.
+        fitness : ndarray
+            Fitness of each point in the current generation.
+        """
+        cache = self._cache
+
+        for key, idx in pending.items():
+            val = fitness[idx[0], :]
+            fitness[idx[1:], :] = val
+
+            # Don't cache failed points so that they are retried.
+            if np.all(np.isfinite(val)):
+                cache[key] = val.copy()
+                if len(cache) > self.cache_size:
+                    cache.popitem(last=False)
+
     def execute_ga(self, x0, vlb, vub, vob, bits, pop_size, max_gen, random_state, Pm=None, Pc=0.5):
         """
         Perform the genetic algorithm.
@@ -626,6 +904,7 @@ class GeneticAlgorithm(object):
 
         # Main Loop
         nfit = 0
+        pending = None
         for generation in range(max_gen + 1):
             old_gen = copy.deepcopy(new_gen)
             x_pop = self.decode(old_gen, vlb, vub, bits)
@@ -638,20 +917,26 @@ class GeneticAlgorithm(object):
                 # and use it on all.
                 x_pop = comm.bcast(x_pop, root=0)
 
-                cases = [((item, ii), None) for ii, item in enumerate(x_pop)
-                         if np.all(item - vob <= 0)]
+                fitness[:] = np.inf
+                eval_idx = [ii for ii, item in enumerate(x_pop) if np.all(item - vob <= 0)]
 
-                # Pad the cases with some dummy cases to make the cases divisible amongst the procs.
-                # TODO: Add a load balancing option to this driver.
-                extra = len(cases) % comm.size
-                if extra > 0:
-                    for j in range(comm.size - extra):
-                        cases.append(cases[-1])
+                # Only dispatch the points that aren't in the cache.
+                if self.cache_size > 0:
+                    pending = self._check_cache(x_pop, fitness, eval_idx)
+                    eval_idx = [idx[0] for idx in pending.values()]
 
-                results = concurrent_eval(self.objfun, cases, comm, allgather=True,
-                                          model_mpi=self.model_mpi)
+                if self.screen is not None:
+                    eval_idx, pending = self._screen(x_pop, fitness, eval_idx, vob, pending)
+
+                cases = [((x_pop[ii], ii), None) for ii in eval_idx]
+
+                if self.load_balance:
+                    results = concurrent_eval_lb(self.objfun, cases, comm, broadcast=True,
+                                                 model_mpi=self.model_mpi)
+                else:
+                    results = concurrent_eval(self.objfun, cases, comm, allgather=True,
+                                              model_mpi=self.model_mpi)
 
-                fitness[:] = np.inf
                 for result in results:
                     returns, traceback = result
 
@@ -668,7 +953,19 @@ class GeneticAlgorithm(object):
 
             else:
                 # Serial
-                for ii in range(self.npop):
+                eval_idx = range(self.npop)
+
+                if self.cache_size > 0:
+                    fitness[:] = np.inf
+                    pending = self._check_cache(x_pop, fitness,
+                                                [ii for ii in eval_idx
+                                                 if np.all(x_pop[ii] - vob <= 0)])
+                    eval_idx = [idx[0] for idx in pending.values()]
+
+                if self.screen is not None:
+                    eval_idx, pending = self._screen(x_pop, fitness, eval_idx, vob, pending)
+
+                for ii in eval_idx:
                     x = x_pop[ii]
 
                     if np.any(x - vob > 0):
@@ -682,6 +979,12 @@ class GeneticAlgorithm(object):
                     else:
                         fitness[ii, :] = np.inf
 
+            if self.cache_size > 0:
+                self._update_cache(pending, fitness)
+
+            if self.screen is not None:
+                self.screen.add_points(x_pop, fitness[:, 0])
+
             # Find Pareto front.
             if nobj > 1:
                 xopt, fopt = self.eval_pareto(x_pop, fitness, xopt, fopt)
@@ -706,6 +1009,10 @@ class GeneticAlgorithm(object):
                     fopt = min_fit
                     xopt = min_x
 
+                if self.asynchronous:
+                    return self._steady_state(old_gen, x_pop, fitness, xopt, fopt, nfit, max_gen,
+                                              vlb, vub, vob, bits, Pm, Pc)
+
             # Evolve new generation.
 
             if nobj > 1:
@@ -718,6 +1025,179 @@ class GeneticAlgorithm(object):
 
         return xopt, fopt, nfit
 
+    def _screen(self, x_pop, fitness, eval_idx, vob, pending=None):
+        """
+        Choose the points in the current generation that are evaluated.
+
+        The points that are not chosen get an infinite fitness.
+
+        Parameters
+        ----------
+        x_pop : ndarray
+            Design points in the current generation.
+        fitness : ndarray
+            Fitness of each point in the current generation.
+        eval_idx : list of int
+            Indices of the points in x_pop that are candidates for evaluation.
+        vob : ndarray
+            Outer bounds array. Points outside of it are never chosen.
+        pending : OrderedDict or None
+            Points that were not found in the fitness cache, as returned by _check_cache.
+
+        Returns
+        -------
+        list of int
+            Indices of the chosen points.
+        OrderedDict or None
+            Entries of pending for the chosen points.
+        """
+        comm = self.comm
+        candidates = [ii for ii in eval_idx if np.all(x_pop[ii] - vob <= 0)]
+
+        # The surrogate is only trained on rank 0.
+        if comm is None or comm.rank == 0:
+            chosen = self.screen.select(x_pop, candidates)
+        else:
+            chosen = None
+
+        if comm is not None:
+            chosen = comm.bcast(chosen, root=0)
+
+        fitness[sorted(set(eval_idx).difference(chosen)), :] = np.inf
+
+        if pending is not None:
+            chosen_set = set(chosen)
+            pending = OrderedDict((key, idx) for key, idx in pending.items()
+                                  if idx[0] in chosen_set)
+
+        return chosen, pending
+
+    def _steady_state(self, old_gen, x_pop, fitness, xopt, fopt, nfit, max_gen, vlb, vub, vob,
+                      bits, Pm, Pc):
+        """
+        Evolve the evaluated initial population with a steady-state algorithm.
+
+        Pairs of children are bred from parents that win binary tournaments in the current
+        population, and each child is created as soon as a model is free to evaluate it. When the
+        evaluation of a child finishes, it replaces the worst point in the population if it is
+        better, so the best point is always kept.
+
+        Parameters
+        ----------
+        old_gen : ndarray
+            Evaluated initial population, encoded. This is updated in place.
+        x_pop : ndarray
+            Design points of the population. This is updated in place.
+        fitness : ndarray
+            Objective value of each point in the population. This is updated in place.
+        xopt : ndarray
+            Best design point in the initial population.
+        fopt : float
+            Objective value at best design point in the initial population.
+        nfit : int
+            Number of successful function evaluations of the initial population.
+        max_gen : int
+            Number of generations to run the GA. Each generation is npop new points.
+        vlb : ndarray
+            Lower bounds array.
+        vub : ndarray
+            Upper bounds array.
+        vob : ndarray
+            Outer bounds array. This is purely for bounds check.
+        bits : ndarray
+            Number of bits to encode the design space for each element of the design vector.
+        Pm : float
+            Mutation rate
+        Pc : float
+            Crossover rate
+
+        Returns
+        -------
+        ndarray
+            Best design point
+        float
+            Objective value at best design point.
+        int
+            Number of successful function evaluations.
+        """
+        comm = self.comm
+        npop = self.npop
+        cache = self._cache
+        children = {}
+
+        def replace_worst(gen, x, val):
+            nonlocal xopt, fopt
+
+            worst = np.argmax(fitness[:, 0])
+            if val < fitness[worst, 0]:
+                old_gen[worst] = gen
+                x_pop[worst] = x
+                fitness[worst, :] = val
+
+                if fitness[worst, 0] < fopt:
+                    fopt = fitness[worst, 0]
+                    xopt = x
+
+        def cases():
+            for icase in range(max_gen * npop):
+                if icase % 2 == 0:
+                    pick = np.random.randint(npop, size=(2, 2))
+                    parents = pick[np.arange(2), np.argmin(fitness[pick, 0], axis=1)]
+                    pair = self.mutate(self.crossover(old_gen[parents], Pc), Pm)
+                    x_pair = self.decode(pair, vlb, vub, bits)
+
+                gen = pair[icase % 2]
+                x = x_pair[icase % 2]
+
+                if np.any(x - vob > 0):
+                    # Exceeded bounds for integer variables that are over-allocated.
+                    continue
+
+                if self.cache_size > 0:
+                    key = x.tobytes()
+                    if key in cache:
+                        cache.move_to_end(key)
+                        self.cache_hits += 1
+                        replace_worst(gen, x, cache[key][0])
+                        continue
+                    self.cache_misses += 1
+
+                children[icase] = (gen, x)
+                yield (x, icase), None
+
+        def evaluate(x, icase):
+            # Trap errors here rather than in concurrent_eval_lb, so that a failed case still
+            # reports which child it was.
+            try:
+                return self.objfun(x, icase) + (None, )
+            except Exception:
+                return None, False, icase, traceback.format_exc()
+
+        def update(returns, err):
+            nonlocal nfit
+
+            val, success, icase, err = returns
+            gen, x = children.pop(icase)
+            if success:
+                nfit += 1
+                replace_worst(gen, x, val)
+
+                if self.cache_size > 0 and np.all(np.isfinite(val)):
+                    cache[x.tobytes()] = np.full(self.nobj, val)
+                    if len(cache) > self.cache_size:
+                        cache.popitem(last=False)
+            elif err is not None:
+                # Print the traceback if it fails. The failed child is discarded.
+                print('A case failed:')
+                print(err)
+
+        concurrent_eval_lb(evaluate, cases(), comm, model_mpi=self.model_mpi, callback=update)
+
+        if comm is not None:
+            xopt, fopt, nfit = comm.bcast((xopt, fopt, nfit), root=0)
+
+        return xopt, fopt, nfit
+
     def eval_pareto(self, x, obj, x_nd, obj_nd):
         """
         Produce a set of non dominated designs.
@@ -740,27 +1220,128 @@ class GeneticAlgorithm(object):
         ndarray
             Objective at nondominated design points.
         """
-        if len(x_nd) > 1:
+        if len(x_nd) > 0:
             ypop = np.concatenate((np.array(obj_nd), obj), axis=0)
             xpop = np.concatenate((x_nd, x), axis=0)
         else:
             ypop = obj
             xpop = x
 
-        n_pts = ypop.shape[0]
-        i = 0
-        pot_idx = np.arange(n_pts)
-        while i < len(ypop):
-            nd_point_mask = np.any(ypop < ypop[i, :], axis=1)
-            nd_point_mask[i] = True
+        pot_idx = np.nonzero(self.nondominated(ypop))[0]
+        ypop = ypop[pot_idx]
+
+        # Remove the most crowded points one at a time, so that the remaining points stay spread
+        # out along the front.
+        max_size = self.max_pareto_size
+        if max_size is not None and len(pot_idx) > max_size:
+            keep = np.ones(len(pot_idx), dtype=bool)
+            for i in range(len(pot_idx) - max_size):
+                remaining = np.nonzero(keep)[0]
+                dist = self.crowding_distance(ypop[remaining])
+                keep[remaining[np.argmin(dist)]] = False
 
-            # Remove dominated points
-            pot_idx = pot_idx[nd_point_mask]
-            ypop = ypop[nd_point_mask]
-            i = np.sum(nd_point_mask[:i]) + 1
+            pot_idx = pot_idx[keep]
+            ypop = ypop[keep]
 
         return xpop[pot_idx, :], ypop
 
+    @staticmethod
+    def nondominated(obj, block_size=32):
+        """
+        Find the non-dominated points for minimization of all objectives.
+
+        A point is removed if another point is at least as good in every objective. Of a set of
+        identical points, only the first one is kept.
+
+        The points are sorted lexicographically so that a point can only be dominated by points
+        that come before it. For two objectives, a single sweep over the sorted points is enough.
+        Otherwise, blocks of points are compared to the front found so far and to each other.
+
+        Parameters
+        ----------
+        obj : ndarray
+            Objective values, with one row per point.
+        block_size : int
+            Number of points compared at once when there are more than two objectives.
+
+        Returns
+        -------
+        ndarray of bool
+            True for each non-dominated point.
+        """
+        n, nobj = obj.shape
+
+        # lexsort is stable, so identical points stay in their original order.
+        order = np.lexsort(obj.T[::-1])
+        y = obj[order]
+
+        if nobj == 1:
+            keep_sorted = np.zeros(n, dtype=bool)
+            keep_sorted[:1] = True
+
+        elif nobj == 2:
+            # Within the sorted points, a point is non-dominated if its second objective is
+            # better than that of every point before it.
+            prev_min = np.empty(n)
+            prev_min[:1] = np.inf
+            np.minimum.accumulate(y[:-1, 1], out=prev_min[1:])
+            keep_sorted = y[:, 1] < prev_min
+
+        else:
+            keep_sorted = np.zeros(n, dtype=bool)
+            front = y[:0]
+
+            for start in range(0, n, block_size):
+                block = y[start:start + block_size]
+
+                # Points dominated by the front found so far.
+                dominated = np.all(front[:, np.newaxis, :] <= block, axis=2).any(axis=0)
+
+                # Points dominated by earlier points in the same block.
+                weak = np.all(block[:, np.newaxis, :] <= block, axis=2)
+                dominated |= np.triu(weak, 1).any(axis=0)
+
+                keep_sorted[start:start + block_size] = ~dominated
+                front = np.concatenate((front, block[~dominated]))
+
+        keep = np.empty(n, dtype=bool)
+        keep[order] = keep_sorted
+        return keep
+
+    @staticmethod
+    def crowding_distance(obj):
+        """
+        Compute the crowding distance of each point on a front.
+
+        This is the sum over all objectives of the distance between the two neighbors of the
+        point, normalized by the range of the objective. The points at the ends of the front
+        have an infinite distance.
+
+        Parameters
+        ----------
+        obj : ndarray
+            Objective values, with one row per point.
+
+        Returns
+        -------
+        ndarray
+            Crowding distance of each point.
+        """
+        n, nobj = obj.shape
+        dist = np.zeros(n)
+
+        for k in range(nobj):
+            order = np.argsort(obj[:, k], kind='mergesort')
+            f = obj[order, k]
+
+            dist[order[0]] = dist[order[-1]] = np.inf
+
+            span = f[-1] - f[0]
+            if n > 2 and np.isfinite(span) and span > 0:
+                dist[order[1:-1]] += (f[2:] - f[:-2]) / span
+
+        return dist
+
     def tournament(self, old_gen, fitness):
         """
         Apply tournament selection and keep the best points.
@@ -851,7 +1432,7 @@ class GeneticAlgorithm(object):
             Current generation with crossovers applied.
         """
         new_gen = copy.deepcopy(old_gen)
-        num_sites = self.npop // 2
+        num_sites = len(old_gen) // 2
         sites = np.random.rand(num_sites, self.lchrom)
         idx, idy = np.where(sites < Pc)
         for ii, jj in zip(idx, idy):
@@ -884,7 +1465,7 @@ class GeneticAlgorithm(object):
         ndarray
             Current generation with mutations applied.
         """
-        temp = np.random.rand(self.npop, self.lchrom)
+        temp = np.random.rand(*current_gen.shape)
         idx, idy = np.where(temp < Pm)
         current_gen[idx, idy] = 1 - current_gen[idx, idy]
         return current_gen
@@ -937,7 +1518,7 @@ class GeneticAlgorithm(object):
                 pts[i] = self.from_gray(gen[i])
         num_desvar = len(bits)
         interval = (vub - vlb) / (2**bits - 1)
-        x = np.empty((self.npop, num_desvar))
+        x = np.empty((len(gen), num_desvar))
         sbit = 0
         ebit = 0
         for jj in range(num_desvar):
@@ -0,0 +1,166 @@
+"""
+Surrogate-based pre-screening of the points in a generation of a genetic algorithm.
+"""
+from collections import OrderedDict
+
+import numpy as np
+from scipy.stats import norm
+
+from openmdao.surrogate_models.surrogate_model import SurrogateModel
+from openmdao.utils.class_util import overrides_method
+
+
+class SurrogateScreen(object):
+    """
+    Choose the most promising new points with a surrogate model of the fitness.
+
+    The surrogate is trained on the points that have been evaluated so far. New points are ranked
+    by their predicted fitness, or by their expected improvement if the surrogate also predicts
+    its error (e.g. KrigingSurrogate with eval_rmse=True), and only the best ones are evaluated.
+
+    Attributes
+    ----------
+    fraction : float
+        Fraction of the candidates that are chosen.
+    max_points : int
+        Maximum number of points that the surrogate is trained on. The most recently evaluated
+        points are kept.
+    surrogate : <SurrogateModel>
+        Surrogate model of the fitness.
+    _points : OrderedDict
+        Fitness of the evaluated points, keyed by the bytes of the design point and ordered from
+        least to most recently evaluated.
+    _x : dict
+        Evaluated design points, with the same keys as _points.
+    _trained : bool
+        True if the surrogate has been trained on the current points.
+    """
+
+    def __init__(self, surrogate, fraction=0.5, max_points=500):
+        """
+        Initialize attributes.
+
+        Parameters
+        ----------
+        surrogate : <SurrogateModel>
+            Surrogate model of the fitness.
+        fraction : float
+            Fraction of the candidates that are chosen.
+        max_points : int
+            Maximum number of points that the surrogate is trained on.
+        """
+        self.surrogate = surrogate
+        self.fraction = fraction
+        self.max_points = max_points
+
+        self._points = OrderedDict()
+        self._x = {}
+        self._trained = False
+
+    def add_points(self, x, fitness):
+        """
+        Add evaluated points to the training data.
+
+        Points that failed (have a fitness that isn't finite) are skipped.
+
+        Parameters
+        ----------
+        x : ndarray
+            Design points, with one row per point.
+        fitness : ndarray
+            Fitness of each point.
+        """
+        points = self._points
+
+        for x_i, fit in zip(x, fitness):
+            if np.isfinite(fit):
+                key = x_i.tobytes()
+                if key in points:
+                    points.move_to_end(key)
+                else:
+                    self._x[key] = x_i.copy()
+                points[key] = float(fit)
+                self._trained = False
+
+        while len(points) > self.max_points:
+            key, _ = points.popitem(last=False)
+            del self._x[key]
+
+    def select(self, x, idx):
+        """
+        Choose the most promising candidates.
+
+        All candidates are chosen until there are at least two training points.
+
+        Parameters
+        ----------
+        x : ndarray
+            Design points, with one row per point.
+        idx : list of int
+            Indices of the candidates in x.
+
+        Returns
+        -------
+        list of int
+            Indices of the chosen candidates, in the order they appear in idx.
+        """
+        points = self._points
+        idx = list(idx)
+        nkeep = int(np.ceil(self.fraction * len(idx)))
+
+        if len(points) < 2 or nkeep >= len(idx):
+            return idx
+
+        if not self._trained:
+            x_train = np.array([self._x[key] for key in points])
+            y_train = np.array(list(points.values()))[:, np.newaxis]
+            self.surrogate.train(x_train, y_train)
+            self._trained = True
+
+        mean, rmse = self._predict(x[idx])
+
+        if rmse is None:
+            score = mean
+        else:
+            # Rank by negative expected improvement over the best point so far.
+            improvement = min(points.values()) - mean
+            with np.errstate(divide='ignore', invalid='ignore'):
+                z = improvement / rmse
+                score = -(improvement * norm.cdf(z) + rmse * norm.pdf(z))
+            exact = rmse <= 0.
+            score[exact] = -np.maximum(improvement[exact], 0.)
+
+        keep = np.sort(np.argsort(score, kind='stable')[:nkeep])
+        return [idx[i] for i in keep]
+
+    def _predict(self, x):
+        """
+        Predict the fitness of the given points.
+
+        Parameters
+        ----------
+        x : ndarray
+            Design points, with one row per point.
+
+        Returns
+        -------
+        ndarray
+            Predicted fitness of each point.
+        ndarray or None
+            Predicted error of each point, or None if the surrogate doesn't predict it.
+        """
+        surrogate = self.surrogate
+        n = len(x)
+
+        if overrides_method('vectorized_predict', surrogate, SurrogateModel):
+            pred = surrogate.vectorized_predict(x)
+        else:
+            pred = [surrogate.predict(x_i) for x_i in x]
+            if isinstance(pred[0], tuple):
+                pred = tuple(zip(*pred))
+
+        if isinstance(pred, tuple):
+            mean, rmse = pred
+            return np.reshape(mean, (n, -1))[:, 0], np.reshape(rmse, (n, -1))[:, 0]
+
+        return np.reshape(pred, (n, -1))[:, 0], None
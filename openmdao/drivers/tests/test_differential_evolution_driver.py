@@ -1,7 +1,9 @@
 """ Unit tests for the DifferentialEvolutionDriver Driver."""
 
 import unittest
+import io
 import os
+from contextlib import redirect_stdout
 
 import numpy as np
 
@@ -164,6 +166,156 @@ class TestDifferentialEvolution(unittest.TestCase):
         assert_near_equal(prob['x'][0], 0.2, 1e-4)
         assert_near_equal(prob['x'][1], -0.88653391, 1e-4)
 
+    def test_batch_objective_callback(self):
+
+        class VectorizedDEDriver(om.DifferentialEvolutionDriver):
+            """Evaluates the paraboloid for the whole population with numpy."""
+
+            def batch_objective_callback(self, population):
+                self.batch_calls += 1
+                self.batch_sizes.add(len(population))
+                x, y = population.T
+                return (x - 3.0)**2 + x * y + (y + 4.0)**2 - 3.0, np.ones(len(population), bool)
+
+        prob = om.Problem()
+        comp = prob.model.add_subsystem('comp', Paraboloid(), promotes=['*'])
+        prob.model.add_design_var('x', lower=-50.0, upper=50.0)
+        prob.model.add_design_var('y', lower=-50.0, upper=50.0)
+        prob.model.add_objective('f_xy')
+
+        prob.driver = VectorizedDEDriver(max_gen=50, pop_size=40)
+        prob.driver.batch_calls = 0
+        prob.driver.batch_sizes = set()
+
+        prob.setup()
+        prob.run_driver()
+
+        # one call per generation, plus the initial population
+        self.assertEqual(prob.driver.batch_calls, 51)
+        self.assertEqual(prob.driver.batch_sizes, {40})
+
+        # the model was only run at the optimum
+        self.assertEqual(comp.iter_count, 1)
+
+        assert_near_equal(prob['x'], 6.66666667, 1e-3)
+        assert_near_equal(prob['y'], -7.3333333, 1e-3)
+        assert_near_equal(prob['f_xy'], -27.3333333, 1e-6)
+
+    def test_asynchronous(self):
+        prob = om.Problem()
+        comp = prob.model.add_subsystem('comp', Paraboloid(), promotes=['*'])
+        prob.model.add_design_var('x', lower=-50.0, upper=50.0)
+        prob.model.add_design_var('y', lower=-50.0, upper=50.0)
+        prob.model.add_objective('f_xy')
+
+        prob.driver = om.DifferentialEvolutionDriver(max_gen=50, pop_size=40, asynchronous=True)
+
+        prob.setup()
+        prob.run_driver()
+
+        # Same number of evaluations as the generational algorithm, plus the final run.
+        self.assertEqual(comp.iter_count, 40 * 51 + 1)
+
+        assert_near_equal(prob['x'], 6.66666667, 1e-3)
+        assert_near_equal(prob['y'], -7.3333333, 1e-3)
+        assert_near_equal(prob['f_xy'], -27.3333333, 1e-6)
+
+    def test_asynchronous_failed_cases(self):
+        class FailingParaboloid(Paraboloid):
+            # Only fail after the initial population has been evaluated.
+            ncompute = 0
+
+            def compute(self, inputs, outputs):
+                self.ncompute += 1
+                if self.ncompute > 100 and inputs['x'] > 40.0:
+                    raise RuntimeError('x is too large')
+                super().compute(inputs, outputs)
+
+        prob = om.Problem()
+        prob.model.add_subsystem('comp', FailingParaboloid(), promotes=['*'])
+        prob.model.add_design_var('x', lower=-50.0, upper=50.0)
+        prob.model.add_design_var('y', lower=-50.0, upper=50.0)
+        prob.model.add_objective('f_xy')
+
+        prob.driver = om.DifferentialEvolutionDriver(max_gen=50, pop_size=40, asynchronous=True)
+
+        prob.setup()
+
+        stdout = io.StringIO()
+        with redirect_stdout(stdout):
+            prob.run_driver()
+
+        # The failed children are reported and dropped without stopping the run.
+        self.assertIn('A case failed:', stdout.getvalue())
+        self.assertIn('x is too large', stdout.getvalue())
+
+        assert_near_equal(prob['x'], 6.66666667, 1e-3)
+        assert_near_equal(prob['y'], -7.3333333, 1e-3)
+        assert_near_equal(prob['f_xy'], -27.3333333, 1e-6)
+
+    def test_surrogate_screen(self):
+        prob = om.Problem()
+        comp = prob.model.add_subsystem('comp', Paraboloid(), promotes=['*'])
+        prob.model.add_design_var('x', lower=-50.0, upper=50.0)
+        prob.model.add_design_var('y', lower=-50.0, upper=50.0)
+        prob.model.add_objective('f_xy')
+
+        # The paraboloid is quadratic, so a response surface fits it exactly.
+        prob.driver = om.DifferentialEvolutionDriver(max_gen=50, pop_size=20,
+                                                     surrogate=om.ResponseSurface(),
+                                                     screen_fraction=0.25)
+
+        prob.setup()
+        prob.run_driver()
+
+        # The whole initial population, a quarter of each generation, and the final run.
+        self.assertEqual(comp.iter_count, 20 + 50 * 5 + 1)
+
+        assert_near_equal(prob['x'], 6.66666667, 1e-3)
+        assert_near_equal(prob['y'], -7.3333333, 1e-3)
+        assert_near_equal(prob['f_xy'], -27.3333333, 1e-6)
+
+    def test_surrogate_asynchronous_error(self):
+        prob = om.Problem()
+        prob.model.add_subsystem('comp', Paraboloid(), promotes=['*'])
+        prob.model.add_design_var('x', lower=-50.0, upper=50.0)
+        prob.model.add_objective('f_xy')
+
+        prob.driver = om.DifferentialEvolutionDriver(surrogate=om.KrigingSurrogate(),
+                                                     asynchronous=True)
+
+        prob.setup()
+
+        with self.assertRaises(RuntimeError) as cm:
+            prob.run_driver()
+
+        self.assertEqual(str(cm.exception), "DifferentialEvolutionDriver: Option 'surrogate' "
+                                            "cannot be used when 'asynchronous' is True.")
+
+    def test_evolve(self):
+        rng = np.random.default_rng(0)
+        pop = np.arange(8.)[:, np.newaxis] * np.ones((1, 3))
+        vlb = -np.ones(3)
+        vub = 10. * np.ones(3)
+
+        # With F = 0 and Pc = 1, each member is replaced by a random other member.
+        for _ in range(10):
+            new = DifferentialEvolution.evolve(pop, rng, 0., 1., vlb, vub)
+            self.assertTrue(np.all(new[:, 0] != pop[:, 0]))
+            self.assertTrue(np.all(new == new[:, :1]))
+
+        # With Pc = 0, exactly one feature of each member comes from the clipped mutant.
+        pop = rng.random((20, 5))
+        new = DifferentialEvolution.evolve(pop, rng, 0.9, 0., np.zeros(5), np.ones(5))
+        self.assertTrue(np.all(np.sum(new != pop, axis=1) <= 1))
+        self.assertTrue(np.all((new >= 0.) & (new <= 1.)))
+
+        # Children of selected parents only.
+        new = DifferentialEvolution.evolve(pop, rng, 0.9, 0., np.zeros(5), np.ones(5),
+                                           targets=[3, 7])
+        self.assertEqual(new.shape, (2, 5))
+        self.assertTrue(np.all(np.sum(new != pop[[3, 7]], axis=1) <= 1))
+
     def test_analysis_error(self):
         class ValueErrorComp(om.ExplicitComponent):
             def setup(self):
@@ -600,6 +752,45 @@ class MPITestDifferentialEvolution(unittest.TestCase):
         prob.run_driver()
 
 
+    def test_mpi_bug_solver_asynchronous(self):
+        prob = om.Problem()
+        prob.model = SellarMDA()
+
+        prob.model.add_design_var('x', lower=0, upper=10)
+        prob.model.add_design_var('z', lower=0, upper=10)
+        prob.model.add_objective('obj')
+
+        prob.driver = om.DifferentialEvolutionDriver(run_parallel=True, asynchronous=True)
+
+        # Set these low because we don't need to run long.
+        prob.driver.options['max_gen'] = 2
+        prob.driver.options['pop_size'] = 5
+
+        prob.setup()
+        prob.set_solver_print(level=0)
+
+        prob.run_driver()
+
+    def test_mpi_bug_solver_load_balance(self):
+        prob = om.Problem()
+        prob.model = SellarMDA()
+
+        prob.model.add_design_var('x', lower=0, upper=10)
+        prob.model.add_design_var('z', lower=0, upper=10)
+        prob.model.add_objective('obj')
+
+        prob.driver = om.DifferentialEvolutionDriver(run_parallel=True, load_balance=True)
+
+        # Set these low because we don't need to run long.
+        prob.driver.options['max_gen'] = 2
+        prob.driver.options['pop_size'] = 5
+
+        prob.setup()
+        prob.set_solver_print(level=0)
+
+        prob.run_driver()
+
+
 class D1(om.ExplicitComponent):
     def initialize(self):
         self.options['distributed'] = True
@@ -775,6 +966,35 @@ class MPITestDifferentialEvolution4Procs(unittest.TestCase):
 
         prob.run_driver()
 
+    def test_proc_per_model_load_balance(self):
+        # Test that load balancing works with a model that runs on multiple procs.
+        prob = om.Problem()
+        model = prob.model
+
+        model.add_subsystem('p', om.IndepVarComp('x', 3.0), promotes=['x'])
+
+        model.add_subsystem('d1', D1(), promotes=['*'])
+        model.add_subsystem('d2', D2(), promotes=['*'])
+
+        model.add_subsystem('obj_comp', Summer(), promotes=['*'])
+        model.nonlinear_solver = om.NewtonSolver(solve_subsystems=True)
+        model.linear_solver = om.LinearBlockGS()
+
+        model.add_design_var('x', lower=-0.5, upper=0.5)
+        model.add_objective('obj')
+
+        driver = prob.driver = om.DifferentialEvolutionDriver()
+        prob.driver.options['pop_size'] = 5
+        prob.driver.options['max_gen'] = 3
+        prob.driver.options['run_parallel'] = True
+        prob.driver.options['procs_per_model'] = 2
+        prob.driver.options['load_balance'] = True
+
+        prob.setup()
+        prob.set_solver_print(level=0)
+
+        prob.run_driver()
+
     def test_distributed_obj(self):
         size = 3
         prob = om.Problem()
@@ -520,6 +520,267 @@ class TestDOEDriver(unittest.TestCase):
             for name in ('x', 'y', 'f_xy'):
                 self.assertEqual(outputs[name], expected_case[name])
 
+    def test_iter_cases(self):
+        prob = om.Problem()
+        model = prob.model
+
+        model.add_subsystem('comp', om.ExecComp('y = sum(x) + z', x=np.zeros(3), y=0., z=0.),
+                            promotes=['*'])
+        model.add_design_var('x', lower=np.array([0., 1., 2.]), upper=np.array([1., 3., 5.]))
+        model.add_design_var('z', lower=-1.0, upper=1.0)
+        model.add_objective('y')
+
+        prob.setup()
+        prob.final_setup()
+
+        design_vars = prob.driver._designvars
+
+        with open('cases.csv', 'w') as f:
+            f.write('x,z\n')
+            for i in range(20):
+                f.write('[%d %d %d],%d\n' % (i, -i, 2 * i, i % 3))
+
+        generators = [
+            om.FullFactorialGenerator(levels=3),
+            om.PlackettBurmanGenerator(),
+            om.BoxBehnkenGenerator(),
+            om.LatinHypercubeGenerator(samples=10, seed=0),
+            om.CSVGenerator('cases.csv'),
+        ]
+
+        for generator in generators:
+            cases = list(generator(design_vars, model))
+            for start, stop, step in [(0, None, 1), (5, None, 1), (1, None, 4), (2, 9, 3)]:
+                sliced = list(generator.iter_cases(design_vars, model, start, stop, step))
+                expected = list(enumerate(cases))[start:stop:step]
+
+                self.assertEqual([i for i, _ in sliced], [i for i, _ in expected])
+                for (_, case), (_, expected_case) in zip(sliced, expected):
+                    for (name, val), (expected_name, expected_val) in zip(case, expected_case):
+                        self.assertEqual(name, expected_name)
+                        assert_near_equal(val, expected_val)
+
+    def test_full_factorial_large(self):
+        prob = om.Problem()
+        model = prob.model
+
+        model.add_subsystem('comp', om.ExecComp('y = sum(x)', x=np.zeros(8), y=0.),
+                            promotes=['*'])
+        model.add_design_var('x', lower=0., upper=9.)
+        model.add_objective('y')
+
+        prob.setup()
+        prob.final_setup()
+
+        # 10^8 cases, which are generated from their indices rather than stored
+        generator = om.FullFactorialGenerator(levels=10)
+        cases = generator.iter_cases(prob.driver._designvars, model, start=12345678, step=10**7)
+
+        for n, (i, case) in enumerate(cases):
+            self.assertEqual(i, 12345678 + n * 10**7)
+
+            # the first factor varies fastest
+            digits = [int(d) for d in reversed('%08d' % i)]
+            assert_near_equal(case[0][1], digits)
+
+        self.assertEqual(n, 8)
+
+    def test_full_factorial_load_balanced(self):
+        prob = om.Problem()
+        model = prob.model
+
+        model.add_subsystem('comp', Paraboloid(), promotes=['x', 'y', 'f_xy'])
+        model.set_input_defaults('x', 0.0)
+        model.set_input_defaults('y', 0.0)
+        model.add_design_var('x', lower=0.0, upper=1.0)
+        model.add_design_var('y', lower=0.0, upper=1.0)
+        model.add_objective('f_xy')
+
+        # without MPI, the load balanced cases are run in order on this proc
+        prob.driver = om.DOEDriver(generator=om.FullFactorialGenerator(levels=3),
+                                   run_parallel=True, load_balance=True)
+        prob.driver.add_recorder(om.SqliteRecorder("cases.sql"))
+
+        prob.setup()
+        prob.run_driver()
+        prob.cleanup()
+
+        self.assertEqual(prob.driver.iter_count, 9)
+        self.assertEqual([t[0] for t in prob.driver.case_timing], list(range(9)))
+        self.assertTrue(all(t[2] >= 0. for t in prob.driver.case_timing))
+
+        expected = self.expected_fullfact3
+
+        cr = om.CaseReader("cases.sql")
+        cases = cr.list_cases('driver', out_stream=None)
+
+        self.assertEqual(len(cases), 9)
+
+        for i, (case, expected_case) in enumerate(zip(cases, expected)):
+            self.assertEqual(case, 'rank0:DOEDriver_FullFactorial|%d' % i)
+            outputs = cr.get_case(case).outputs
+            for name in ('x', 'y', 'f_xy'):
+                self.assertEqual(outputs[name], expected_case[name])
+
+    def test_full_factorial_local_procs(self):
+        prob = om.Problem()
+        model = prob.model
+
+        model.add_subsystem('comp', Paraboloid(), promotes=['x', 'y', 'f_xy'])
+        model.set_input_defaults('x', 0.0)
+        model.set_input_defaults('y', 0.0)
+        model.add_design_var('x', lower=0.0, upper=1.0)
+        model.add_design_var('y', lower=0.0, upper=1.0)
+        model.add_objective('f_xy')
+
+        prob.driver = om.DOEDriver(generator=om.FullFactorialGenerator(levels=3), local_procs=3)
+        prob.driver.add_recorder(om.SqliteRecorder("cases.sql"))
+
+        prob.setup()
+        prob.run_driver()
+        prob.cleanup()
+
+        self.assertEqual(prob.driver.iter_count, 9)
+        self.assertEqual(sorted(t[0] for t in prob.driver.case_timing), list(range(9)))
+
+        expected = self.expected_fullfact3
+
+        cr = om.CaseReader("cases.sql")
+        cases = cr.list_cases('driver', out_stream=None)
+
+        # the cases are recorded in the order in which they finished
+        self.assertEqual(sorted(cases),
+                         sorted('rank0:DOEDriver_FullFactorial|%d' % i for i in range(9)))
+
+        for case in cases:
+            idx = int(case.rpartition('|')[2])  # index of expected case
+            outputs = cr.get_case(case).outputs
+            for name in ('x', 'y', 'f_xy'):
+                self.assertEqual(outputs[name], expected[idx][name])
+
+    def test_full_factorial_batch(self):
+        prob = om.Problem()
+        model = prob.model
+
+        # a vectorized paraboloid that evaluates 4 cases at once
+        n = 4
+        comp = model.add_subsystem('comp', om.ExecComp('f_xy = (x-3.0)**2 + x*y + (y+4.0)**2 - 3.0',
+                                                       shape=(n, ), has_diag_partials=True),
+                                   promotes=['*'])
+        model.add_design_var('x', lower=0.0, upper=1.0)
+        model.add_design_var('y', lower=0.0, upper=1.0)
+        model.add_objective('f_xy', index=0)
+
+        prob.driver = om.DOEDriver(generator=om.FullFactorialGenerator(levels=3), batch_size=n)
+        prob.driver.add_recorder(om.SqliteRecorder("cases.sql"))
+
+        prob.setup()
+        prob.run_driver()
+        prob.cleanup()
+
+        # 9 cases in 3 evaluations, where the last one is padded
+        self.assertEqual(comp.iter_count, 3)
+        self.assertEqual(prob.driver.iter_count, 9)
+        self.assertEqual([t[0] for t in prob.driver.case_timing], list(range(9)))
+
+        expected = self.expected_fullfact3
+
+        cr = om.CaseReader("cases.sql")
+        cases = cr.list_cases('driver', out_stream=None)
+
+        self.assertEqual(len(cases), 9)
+
+        for i, (case, expected_case) in enumerate(zip(cases, expected)):
+            self.assertEqual(case, 'rank0:DOEDriver_FullFactorial|%d' % i)
+            outputs = cr.get_case(case).outputs
+            for name in ('x', 'y', 'f_xy'):
+                assert_near_equal(outputs[name], expected_case[name])
+
+    def test_batch_size_error(self):
+        prob = om.Problem()
+        model = prob.model
+
+        model.add_subsystem('comp', om.ExecComp('f_xy = x + y', shape=(3, )), promotes=['*'])
+        model.add_design_var('x', lower=0.0, upper=1.0)
+        model.add_design_var('y', lower=0.0, upper=1.0)
+        model.add_objective('f_xy', index=0)
+
+        prob.driver = om.DOEDriver(generator=om.FullFactorialGenerator(levels=3), batch_size=2)
+
+        prob.setup()
+
+        with self.assertRaises(RuntimeError) as context:
+            prob.run_driver()
+
+        self.assertEqual(str(context.exception),
+                         "DOEDriver: The size of design variable 'x' (3) is not a multiple of the "
+                         "batch size (2).")
+
+    def test_resume(self):
+
+        class Interrupt(BaseException):
+            pass
+
+        class InterruptedParaboloid(Paraboloid):
+            def initialize(self):
+                self.options.declare('max_runs', default=None, allow_none=True)
+                self.runs = 0
+
+            def compute(self, inputs, outputs):
+                if self.runs == self.options['max_runs']:
+                    raise Interrupt()
+                self.runs += 1
+                super().compute(inputs, outputs)
+
+        def make_problem(max_runs, filename, resume_from=None):
+            prob = om.Problem()
+            model = prob.model
+
+            model.add_subsystem('comp', InterruptedParaboloid(max_runs=max_runs),
+                                promotes=['x', 'y', 'f_xy'])
+            model.set_input_defaults('x', 0.0)
+            model.set_input_defaults('y', 0.0)
+            model.add_design_var('x', lower=0.0, upper=1.0)
+            model.add_design_var('y', lower=0.0, upper=1.0)
+            model.add_objective('f_xy')
+
+            prob.driver = om.DOEDriver(generator=om.FullFactorialGenerator(levels=3),
+                                       resume_from=resume_from)
+            prob.driver.add_recorder(om.SqliteRecorder(filename))
+
+            prob.setup()
+            return prob
+
+        # the first run is interrupted during the sixth case
+        prob = make_problem(5, "cases1.sql")
+        with self.assertRaises(Interrupt):
+            prob.run_driver()
+        prob.cleanup()
+
+        prob = make_problem(None, "cases2.sql", resume_from="cases1.sql")
+        prob.run_driver()
+        prob.cleanup()
+
+        self.assertEqual([t[0] for t in prob.driver.case_timing], [5, 6, 7, 8])
+
+        expected = self.expected_fullfact3
+
+        cases = []
+        for filename in ("cases1.sql", "cases2.sql"):
+            cr = om.CaseReader(filename)
+            cases.extend(cr.get_case(case) for case in cr.list_cases('driver', out_stream=None))
+
+        # the interrupted case was recorded as a failure, and was run again
+        self.assertEqual([case.name for case in cases],
+                         ['rank0:DOEDriver_FullFactorial|%d' % i for i in range(6)] +
+                         ['rank0:DOEDriver_FullFactorial|%d' % i for i in range(5, 9)])
+        self.assertEqual(cases[5].success, 0)
+        del cases[5]
+
+        for case, expected_case in zip(cases, expected):
+            for name in ('x', 'y', 'f_xy'):
+                self.assertEqual(case.outputs[name], expected_case[name])
+
     def test_full_factorial_factoring(self):
 
         class Digits2Num(om.ExplicitComponent):
@@ -1269,6 +1530,52 @@ class TestParallelDOE(unittest.TestCase):
         num_cases = prob.comm.allgather(num_cases)
         self.assertEqual(sum(num_cases), len(expected))
 
+    def test_full_factorial_load_balanced(self):
+        prob = om.Problem()
+        model = prob.model
+
+        model.add_subsystem('p1', om.IndepVarComp('x', 0.0), promotes=['x'])
+        model.add_subsystem('p2', om.IndepVarComp('y', 0.0), promotes=['y'])
+        model.add_subsystem('comp', Paraboloid(), promotes=['x', 'y', 'f_xy'])
+
+        model.add_design_var('x', lower=0.0, upper=1.0)
+        model.add_design_var('y', lower=0.0, upper=1.0)
+        model.add_objective('f_xy')
+
+        prob.driver = om.DOEDriver(om.FullFactorialGenerator(levels=3), procs_per_model=1,
+                                   run_parallel=True, load_balance=True)
+        prob.driver.add_recorder(om.SqliteRecorder("cases.sql"))
+
+        prob.setup()
+
+        failed, output = run_driver(prob)
+        self.assertFalse(failed)
+
+        prob.cleanup()
+
+        expected = self.expected_fullfact3
+
+        rank = prob.comm.rank
+
+        # every proc knows the timing of all cases
+        self.assertEqual(sorted(t[0] for t in prob.driver.case_timing), list(range(9)))
+
+        # rank 0 only dispatches cases, so it records nothing
+        cr = om.CaseReader("cases.sql_%d" % rank)
+        cases = cr.list_cases('driver', out_stream=None)
+        if rank == 0:
+            self.assertEqual(len(cases), 0)
+
+        for case in cases:
+            idx = int(case.rpartition('|')[2])  # index of expected case
+            outputs = cr.get_case(case).outputs
+            for name in ('x', 'y', 'f_xy'):
+                self.assertEqual(outputs[name], expected[idx][name])
+
+        # total number of cases recorded across all procs
+        num_cases = prob.comm.allgather(len(cases))
+        self.assertEqual(sum(num_cases), len(expected))
+
     def test_fan_in_grouped_parallel_2x2(self):
         # run cases in parallel with 2 procs per model
         # (cases will be split between the 2 parallel model instances)
@@ -1,7 +1,11 @@
 """ Unit tests for the SimpleGADriver Driver."""
 
 import unittest
+import io
 import os
+import shutil
+import tempfile
+from contextlib import redirect_stdout
 
 import numpy as np
 
@@ -113,6 +117,187 @@ class TestSimpleGA(unittest.TestCase):
         assert_near_equal(prob['comp.f'], 0.49399549, 1e-4)
         self.assertTrue(int(prob['xI']) in [3, -3])
 
+    def test_mixed_integer_branin_cache(self):
+        def make_problem(**options):
+            prob = om.Problem()
+            model = prob.model
+
+            model.set_input_defaults('xC', 7.5)
+            model.set_input_defaults('xI', 0.0)
+
+            model.add_subsystem('comp', Branin(),
+                                promotes_inputs=[('x0', 'xI'), ('x1', 'xC')])
+
+            model.add_design_var('xI', lower=-5.0, upper=10.0)
+            model.add_design_var('xC', lower=0.0, upper=15.0)
+            model.add_objective('comp.f')
+
+            prob.driver = om.SimpleGADriver(max_gen=75, pop_size=25, **options)
+            prob.driver.options['bits'] = {'xC': 8}
+
+            prob.driver._randomstate = 1
+
+            prob.setup()
+
+            # Crossover and mutation use numpy's global random state.
+            np.random.seed(1)
+            return prob
+
+        prob = make_problem()
+        prob.run_driver()
+        no_cache_count = prob.driver.iter_count
+
+        tempdir = tempfile.mkdtemp()
+        try:
+            cache_file = os.path.join(tempdir, 'ga_cache.npz')
+
+            prob = make_problem(cache_size=1000, cache_file=cache_file)
+            prob.run_driver()
+            ga = prob.driver._ga
+
+            # The cache doesn't change the result, but repeated points are only run once.
+            assert_near_equal(prob['comp.f'], 0.49399549, 1e-4)
+            self.assertTrue(int(prob['xI']) in [3, -3])
+            self.assertEqual(ga.cache_hits + ga.cache_misses, ga.npop * 76)
+            self.assertTrue(ga.cache_hits > 0)
+            self.assertEqual(prob.driver.iter_count, no_cache_count - ga.cache_hits)
+
+            # A restarted run finds everything in the saved cache.
+            prob = make_problem(cache_size=1000, cache_file=cache_file)
+            prob.run_driver()
+            ga = prob.driver._ga
+
+            assert_near_equal(prob['comp.f'], 0.49399549, 1e-4)
+            self.assertEqual(ga.cache_misses, 0)
+            self.assertEqual(prob.driver.iter_count, 1)
+
+            # A saved cache from a different problem is ignored and then overwritten.
+            prob = make_problem(cache_size=1000, cache_file=cache_file, penalty_parameter=20.)
+            prob.run_driver()
+            ga = prob.driver._ga
+
+            assert_near_equal(prob['comp.f'], 0.49399549, 1e-4)
+            self.assertEqual(prob.driver.iter_count, no_cache_count - ga.cache_hits)
+
+            prob = make_problem(cache_size=1000, cache_file=cache_file, penalty_parameter=20.)
+            prob.run_driver()
+            self.assertEqual(prob.driver._ga.cache_misses, 0)
+
+            # So is a file that isn't a cache.
+            with open(cache_file, 'w') as f:
+                f.write('not a cache')
+
+            prob = make_problem(cache_size=1000, cache_file=cache_file)
+            prob.run_driver()
+            ga = prob.driver._ga
+
+            assert_near_equal(prob['comp.f'], 0.49399549, 1e-4)
+            self.assertEqual(prob.driver.iter_count, no_cache_count - ga.cache_hits)
+        finally:
+            shutil.rmtree(tempdir)
+
+    def test_mixed_integer_branin_asynchronous(self):
+        prob = om.Problem()
+        model = prob.model
+
+        model.set_input_defaults('xC', 7.5)
+        model.set_input_defaults('xI', 0.0)
+
+        model.add_subsystem('comp', Branin(),
+                            promotes_inputs=[('x0', 'xI'), ('x1', 'xC')])
+
+        model.add_design_var('xI', lower=-5.0, upper=10.0)
+        model.add_design_var('xC', lower=0.0, upper=15.0)
+        model.add_objective('comp.f')
+
+        prob.driver = om.SimpleGADriver(max_gen=75, pop_size=25, asynchronous=True)
+        prob.driver.options['bits'] = {'xC': 8}
+
+        prob.driver._randomstate = 1
+
+        prob.setup()
+        prob.run_driver()
+
+        # Optimal solution
+        assert_near_equal(prob['comp.f'], 0.49399549, 1e-4)
+        self.assertTrue(int(prob['xI']) in [3, -3])
+
+        # Same number of evaluations as the generational algorithm, plus the final run.
+        self.assertEqual(prob.driver.iter_count, prob.driver._ga.npop * 76 + 1)
+
+    def test_mixed_integer_branin_asynchronous_failed_cases(self):
+        class FailingBranin(Branin):
+            # Only fail after the initial population has been evaluated.
+            ncompute = 0
+
+            def compute(self, inputs, outputs):
+                self.ncompute += 1
+                if self.ncompute > 100 and inputs['x0'] > 4.0:
+                    raise RuntimeError('x0 is too large')
+                super().compute(inputs, outputs)
+
+        prob = om.Problem()
+        model = prob.model
+
+        model.set_input_defaults('xC', 7.5)
+        model.set_input_defaults('xI', 0.0)
+
+        model.add_subsystem('comp', FailingBranin(),
+                            promotes_inputs=[('x0', 'xI'), ('x1', 'xC')])
+
+        model.add_design_var('xI', lower=-5.0, upper=10.0)
+        model.add_design_var('xC', lower=0.0, upper=15.0)
+        model.add_objective('comp.f')
+
+        prob.driver = om.SimpleGADriver(max_gen=75, pop_size=25, asynchronous=True)
+        prob.driver.options['bits'] = {'xC': 8}
+
+        prob.driver._randomstate = 1
+
+        prob.setup()
+
+        stdout = io.StringIO()
+        with redirect_stdout(stdout):
+            prob.run_driver()
+
+        # The failed children are reported and dropped without stopping the run.
+        self.assertIn('A case failed:', stdout.getvalue())
+        self.assertIn('x0 is too large', stdout.getvalue())
+
+        assert_near_equal(prob['comp.f'], 0.49399549, 1e-4)
+        self.assertTrue(int(prob['xI']) in [3, -3])
+
+    def test_mixed_integer_branin_surrogate_screen(self):
+        prob = om.Problem()
+        model = prob.model
+
+        model.set_input_defaults('xC', 7.5)
+        model.set_input_defaults('xI', 0.0)
+
+        comp = model.add_subsystem('comp', Branin(),
+                                   promotes_inputs=[('x0', 'xI'), ('x1', 'xC')])
+
+        model.add_design_var('xI', lower=-5.0, upper=10.0)
+        model.add_design_var('xC', lower=0.0, upper=15.0)
+        model.add_objective('comp.f')
+
+        prob.driver = om.SimpleGADriver(max_gen=30, pop_size=25,
+                                        surrogate=om.KrigingSurrogate(eval_rmse=True))
+        prob.driver.options['bits'] = {'xC': 8}
+
+        prob.driver._randomstate = 1
+
+        prob.setup()
+        prob.run_driver()
+
+        # Optimal solution
+        assert_near_equal(prob['comp.f'], 0.49399549, 1e-4)
+        self.assertTrue(int(prob['xI']) in [3, -3])
+
+        # The whole initial population, half of each generation, and the final run.
+        npop = prob.driver._ga.npop
+        self.assertEqual(comp.iter_count, npop + 30 * npop // 2 + 1)
+
     def test_mixed_integer_branin_discrete(self):
         prob = om.Problem()
         model = prob.model
@@ -619,6 +804,100 @@ class TestMultiObjectiveSimpleGA(unittest.TestCase):
         self.assertTrue(np.all(sorted_obj[:-1, 0] <= sorted_obj[1:, 0]))
         self.assertTrue(np.all(sorted_obj[:-1, 1] >= sorted_obj[1:, 1]))
 
+    def test_pareto_max_size(self):
+        np.random.seed(11)
+
+        prob = om.Problem()
+
+        indeps = prob.model.add_subsystem('indeps', om.IndepVarComp(), promotes=['*'])
+        indeps.add_output('length', 1.5)
+        indeps.add_output('width', 1.5)
+        indeps.add_output('height', 1.5)
+
+        prob.model.add_subsystem('box', Box(), promotes=['*'])
+
+        prob.driver = om.SimpleGADriver()
+        prob.driver.options['max_gen'] = 20
+        prob.driver.options['bits'] = {'length': 8, 'width': 8, 'height': 8}
+        prob.driver.options['penalty_parameter'] = 10.
+        prob.driver.options['compute_pareto'] = True
+        prob.driver.options['max_pareto_size'] = 5
+
+        prob.model.add_design_var('length', lower=0.1, upper=2.)
+        prob.model.add_design_var('width', lower=0.1, upper=2.)
+        prob.model.add_design_var('height', lower=0.1, upper=2.)
+        prob.model.add_objective('front_area', scaler=-1)  # maximize
+        prob.model.add_objective('top_area', scaler=-1)  # maximize
+        prob.model.add_constraint('volume', upper=1.)
+
+        prob.setup()
+        prob.run_driver()
+
+        nd_obj = prob.driver.obj_nd
+        self.assertEqual(nd_obj.shape, (5, 2))
+        self.assertEqual(prob.driver.desvar_nd.shape, (5, 3))
+
+        sorted_obj = nd_obj[nd_obj[:, 0].argsort()]
+        self.assertTrue(np.all(sorted_obj[:-1, 0] <= sorted_obj[1:, 0]))
+        self.assertTrue(np.all(sorted_obj[:-1, 1] >= sorted_obj[1:, 1]))
+
+    def test_asynchronous_pareto_error(self):
+        prob = om.Problem()
+
+        prob.model.add_subsystem('box', Box(), promotes=['*'])
+        prob.model.add_design_var('length', lower=0.1, upper=2.)
+        prob.model.add_objective('front_area', scaler=-1)
+        prob.model.add_objective('top_area', scaler=-1)
+
+        prob.driver = om.SimpleGADriver(compute_pareto=True, asynchronous=True)
+        prob.driver.options['bits'] = {'length': 8}
+
+        prob.setup()
+
+        with self.assertRaises(RuntimeError) as cm:
+            prob.run_driver()
+
+        self.assertEqual(str(cm.exception), "SimpleGADriver: Options 'asynchronous' and "
+                                            "'compute_pareto' cannot both be True.")
+
+    def test_nondominated(self):
+        def brute_force(obj):
+            # keep a point if no other point is at least as good everywhere, keeping the first
+            # of any identical points.
+            keep = []
+            for i, y in enumerate(obj):
+                dominated = np.all(obj <= y, axis=1)
+                dominated[i:] &= np.any(obj[i:] < y, axis=1)
+                keep.append(not np.any(dominated))
+            return np.array(keep)
+
+        rng = np.random.RandomState(7)
+        for nobj in (1, 2, 3, 5):
+            for n in (1, 10, 100):
+                # small integer values so that there are ties and duplicates
+                obj = rng.randint(0, 5, (n, nobj)).astype(float)
+                for block_size in (1, 7, 32):
+                    mask = GeneticAlgorithm.nondominated(obj, block_size=block_size)
+                    np.testing.assert_array_equal(mask, brute_force(obj))
+
+    def test_crowding_truncation(self):
+        # Points on a linear front, with a tight cluster in the middle.
+        f1 = np.array([0., 1., 2., 4.9, 5., 5.1, 8., 9., 10.])
+        obj = np.column_stack((f1, 10. - f1))
+        x = f1[:, np.newaxis]
+
+        dist = GeneticAlgorithm.crowding_distance(obj)
+        self.assertTrue(np.isinf(dist[0]) and np.isinf(dist[-1]))
+        self.assertEqual(np.argmin(dist), 4)
+
+        ga = GeneticAlgorithm(lambda: None)
+        ga.max_pareto_size = 7
+        x_nd, obj_nd = ga.eval_pareto(x, obj, np.empty((0, 1)), np.empty((0, 2)))
+
+        # The extremes are kept and the cluster is thinned out first.
+        assert_near_equal(np.sort(x_nd[:, 0]), [0., 2., 4.9, 5.1, 8., 9., 10.])
+        assert_near_equal(obj_nd[:, 0], x_nd[:, 0])
+
 
 class TestConstrainedSimpleGA(unittest.TestCase):
 
@@ -851,6 +1130,67 @@ class MPITestSimpleGA(unittest.TestCase):
         assert_near_equal(prob['comp.f'], 0.49399549, 1e-4)
         self.assertTrue(int(prob['p2.xI']) in [3, -3])
 
+    def test_mixed_integer_branin_load_balance(self):
+        prob = om.Problem()
+        model = prob.model
+
+        model.add_subsystem('p1', om.IndepVarComp('xC', 7.5))
+        model.add_subsystem('p2', om.IndepVarComp('xI', 0.0))
+        model.add_subsystem('comp', Branin())
+
+        model.connect('p2.xI', 'comp.x0')
+        model.connect('p1.xC', 'comp.x1')
+
+        model.add_design_var('p2.xI', lower=-5.0, upper=10.0)
+        model.add_design_var('p1.xC', lower=0.0, upper=15.0)
+        model.add_objective('comp.f')
+
+        prob.driver = om.SimpleGADriver()
+        prob.driver.options['bits'] = {'p1.xC': 8}
+        prob.driver.options['max_gen'] = 50
+        prob.driver.options['pop_size'] = 25
+        prob.driver.options['run_parallel'] = True
+        prob.driver.options['load_balance'] = True
+
+        prob.driver._randomstate = 1
+
+        prob.setup()
+        prob.run_driver()
+
+        # Same solution as the evenly divided population.
+        assert_near_equal(prob['comp.f'], 0.49399549, 1e-4)
+        self.assertTrue(int(prob['p2.xI']) in [3, -3])
+
+    def test_mixed_integer_branin_asynchronous(self):
+        prob = om.Problem()
+        model = prob.model
+
+        model.add_subsystem('p1', om.IndepVarComp('xC', 7.5))
+        model.add_subsystem('p2', om.IndepVarComp('xI', 0.0))
+        model.add_subsystem('comp', Branin())
+
+        model.connect('p2.xI', 'comp.x0')
+        model.connect('p1.xC', 'comp.x1')
+
+        model.add_design_var('p2.xI', lower=-5.0, upper=10.0)
+        model.add_design_var('p1.xC', lower=0.0, upper=15.0)
+        model.add_objective('comp.f')
+
+        prob.driver = om.SimpleGADriver()
+        prob.driver.options['bits'] = {'p1.xC': 8}
+        prob.driver.options['max_gen'] = 50
+        prob.driver.options['pop_size'] = 25
+        prob.driver.options['run_parallel'] = True
+        prob.driver.options['asynchronous'] = True
+
+        prob.driver._randomstate = 1
+
+        prob.setup()
+        prob.run_driver()
+
+        assert_near_equal(prob['comp.f'], 0.49399549, 1e-4)
+        self.assertTrue(int(prob['p2.xI']) in [3, -3])
+
     def test_two_branin_parallel_model(self):
         prob = om.Problem()
         model = prob.model
@@ -1208,6 +1548,35 @@ class MPITestSimpleGA4Procs(unittest.TestCase):
 
         prob.run_driver()
 
+    def test_proc_per_model_load_balance(self):
+        # Test that load balancing works with a model that runs on multiple procs.
+        prob = om.Problem()
+        model = prob.model
+
+        model.add_subsystem('p', om.IndepVarComp('x', 3.0), promotes=['x'])
+
+        model.add_subsystem('d1', D1(), promotes=['*'])
+        model.add_subsystem('d2', D2(), promotes=['*'])
+
+        model.add_subsystem('obj_comp', Summer(), promotes=['*'])
+        model.nonlinear_solver = om.NewtonSolver(solve_subsystems=True)
+        model.linear_solver = om.LinearBlockGS()
+
+        model.add_design_var('x', lower=-0.5, upper=0.5)
+        model.add_objective('obj')
+
+        driver = prob.driver = om.SimpleGADriver()
+        prob.driver.options['pop_size'] = 5
+        prob.driver.options['max_gen'] = 3
+        prob.driver.options['run_parallel'] = True
+        prob.driver.options['procs_per_model'] = 2
+        prob.driver.options['load_balance'] = True
+
+        prob.setup()
+        prob.set_solver_print(level=0)
+
+        prob.run_driver()
+
     def test_distributed_obj(self):
         size = 3
         prob = om.Problem()
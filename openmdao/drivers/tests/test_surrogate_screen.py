@@ -0,0 +1,53 @@
+""" Unit tests for the SurrogateScreen used by the genetic algorithm drivers."""
+
+import unittest
+
+import numpy as np
+
+import openmdao.api as om
+from openmdao.drivers.surrogate_screen import SurrogateScreen
+
+
+class TestSurrogateScreen(unittest.TestCase):
+
+    def test_select(self):
+        screen = SurrogateScreen(om.ResponseSurface(), fraction=0.3)
+
+        x = np.linspace(-2., 2., 11)[:, np.newaxis]
+
+        # Everything is chosen until there is training data.
+        self.assertEqual(screen.select(x, range(11)), list(range(11)))
+
+        screen.add_points(x[::2], (x[::2, 0] - 0.5)**2)
+
+        # The four (30% rounded up) points closest to the minimum of the fitted parabola, in their
+        # original order.
+        self.assertEqual(screen.select(x, range(11)), [5, 6, 7, 8])
+        self.assertEqual(screen.select(x, [0, 1, 2, 3]), [2, 3])
+
+    def test_expected_improvement(self):
+        screen = SurrogateScreen(om.KrigingSurrogate(eval_rmse=True), fraction=0.25)
+
+        x = np.array([[0.], [1.], [2.], [3.]])
+        screen.add_points(x, np.array([1., 0., 1., 4.]))
+
+        # Far from the training points, the uncertainty makes a point more promising than
+        # repeating an evaluated one.
+        x_new = np.array([[3.], [1.], [10.], [0.]])
+        self.assertEqual(screen.select(x_new, range(4)), [2])
+
+    def test_add_points(self):
+        screen = SurrogateScreen(om.ResponseSurface(), max_points=3)
+
+        x = np.arange(5.)[:, np.newaxis]
+        screen.add_points(x[:2], np.array([1., np.inf]))
+        screen.add_points(x, np.arange(5.))
+        screen.add_points(x[2:3], np.array([7.]))
+
+        # Failed points are skipped, and the most recent ones are kept.
+        self.assertEqual([screen._x[key][0] for key in screen._points], [3., 4., 2.])
+        self.assertEqual(list(screen._points.values()), [3., 4., 7.])
+
+
+if __name__ == '__main__':
+    unittest.main()
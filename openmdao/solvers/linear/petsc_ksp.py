@@ -360,7 +360,7 @@ class PETScKrylov(LinearSolver):
 
         maxiter = options['maxiter']
         atol = options['atol']
-        rtol = options['rtol']
+        rtol = options['rtol'] if self._forcing_rtol is None else self._forcing_rtol
 
         for vec_name in vec_names:
 
@@ -20,6 +20,11 @@ class ScipyKrylov(LinearSolver):
     """
     The Krylov iterative solvers in scipy.sparse.linalg.
 
+    When the right-hand-side vectors contain multiple columns (i.e., 'vectorize_derivs' is active),
+    the scipy solvers cannot be used directly, so a restarted block GMRES is used instead.  All of
+    the columns share a single Krylov subspace, and each iteration performs one multi-column
+    '_apply_linear' call regardless of the number of columns.
+
     Attributes
     ----------
     precon : Solver
@@ -202,20 +207,39 @@ class ScipyKrylov(LinearSolver):
         maxiter = self.options['maxiter']
         atol = self.options['atol']
 
+        # An inexact Newton solver may request a tolerance relative to the norm of the rhs, in
+        # which case 'atol' is used as a true absolute tolerance where scipy supports it.
+        rtol = self._forcing_rtol
+
         fail = False
 
+        if self._mode == 'fwd':
+            b_vecs = system._vectors['residual']
+        else:  # rev
+            b_vecs = system._vectors['output']
+
+        # A block preconditioner may modify the right-hand sides of all linear vectors, so grab
+        # them before solving any of them.
+        rhs = {vec_name: b_vecs[vec_name].asarray(True) for vec_name in self._vec_names}
+
         for vec_name in self._vec_names:
 
             self._vec_name = vec_name
 
             if self._mode == 'fwd':
                 x_vec = system._vectors['output'][vec_name]
-                b_vec = system._vectors['residual'][vec_name]
             else:  # rev
                 x_vec = system._vectors['residual'][vec_name]
-                b_vec = system._vectors['output'][vec_name]
 
             x_vec_combined = x_vec._data
+
+            if x_vec._ncol > 1:
+                self._iter_count = 0
+                info = self._block_gmres(rhs[vec_name], x_vec_combined.copy(), maxiter,
+                                         atol if rtol is None else rtol)
+                fail |= (info != 0)
+                continue
+
             size = x_vec_combined.size
             linop = LinearOperator((size, size), dtype=float,
                                    matvec=self._mat_vec)
@@ -231,21 +255,107 @@ class ScipyKrylov(LinearSolver):
             self._iter_count = 0
             if solver is gmres:
                 if LooseVersion(scipy.__version__) < LooseVersion("1.1"):
-                    x, info = solver(linop, b_vec.asarray(True), M=M, restart=restart,
-                                     x0=x_vec_combined, maxiter=maxiter, tol=atol,
+                    x, info = solver(linop, rhs[vec_name], M=M, restart=restart,
+                                     x0=x_vec_combined, maxiter=maxiter,
+                                     tol=atol if rtol is None else rtol,
+                                     callback=self._monitor)
+                elif rtol is not None:
+                    x, info = solver(linop, rhs[vec_name], M=M, restart=restart,
+                                     x0=x_vec_combined, maxiter=maxiter, tol=rtol, atol=atol,
                                      callback=self._monitor)
                 else:
-                    x, info = solver(linop, b_vec.asarray(True), M=M, restart=restart,
+                    x, info = solver(linop, rhs[vec_name], M=M, restart=restart,
                                      x0=x_vec_combined, maxiter=maxiter, tol=atol, atol='legacy',
                                      callback=self._monitor)
             else:
-                x, info = solver(linop, b_vec.asarray(True), M=M,
+                x, info = solver(linop, rhs[vec_name], M=M,
                                  x0=x_vec_combined, maxiter=maxiter, tol=atol,
                                  callback=self._monitor)
 
             fail |= (info != 0)
             x_vec.set_val(x)
 
+    def _block_gmres(self, b, x, maxiter, atol):
+        """
+        Solve a multi-column linear system using restarted, right-preconditioned block GMRES.
+
+        Parameters
+        ----------
+        b : ndarray
+            Right-hand-side array of shape (size, ncol).
+        x : ndarray
+            Initial guess array of shape (size, ncol).  It is updated in place.
+        maxiter : int
+            Maximum number of block iterations.
+        atol : float
+            Convergence tolerance on the norm of each column's residual relative to the norm of
+            the corresponding column of b.
+
+        Returns
+        -------
+        int
+            0 if the solver converged, otherwise the number of iterations performed.
+        """
+        vec_name = self._vec_name
+        system = self._system()
+        restart = self.options['restart']
+        ncol = b.shape[1]
+
+        if self._mode == 'fwd':
+            x_vec = system._vectors['output'][vec_name]
+        else:  # rev
+            x_vec = system._vectors['residual'][vec_name]
+
+        bnorm = np.linalg.norm(b, axis=0)
+        bnorm[bnorm == 0.0] = 1.0
+        tol = atol * bnorm
+
+        while True:
+            r = b - self._mat_vec(x)
+            if np.all(np.linalg.norm(r, axis=0) <= tol) or self._iter_count >= maxiter:
+                break
+
+            # The Krylov basis V and the preconditioned basis Z, stored by block.
+            V = []
+            Z = []
+            H = np.zeros(((restart + 1) * ncol, restart * ncol))
+            G = np.zeros(((restart + 1) * ncol, ncol))
+
+            Q, G[:ncol] = np.linalg.qr(r)
+            V.append(Q)
+
+            for j in range(restart):
+                Z.append(self._apply_precon(V[j]) if self.precon else V[j])
+                W = self._mat_vec(Z[j]).copy()
+
+                # block modified Gram-Schmidt, applied twice to maintain orthogonality
+                cols = slice(j * ncol, (j + 1) * ncol)
+                for _ in range(2):
+                    for i in range(j + 1):
+                        h = V[i].T.dot(W)
+                        W -= V[i].dot(h)
+                        H[i * ncol:(i + 1) * ncol, cols] += h
+
+                Q, R = np.linalg.qr(W)
+                H[(j + 1) * ncol:(j + 2) * ncol, cols] = R
+                V.append(Q)
+
+                k = (j + 1) * ncol
+                Y = np.linalg.lstsq(H[:k + ncol, :k], G[:k + ncol], rcond=None)[0]
+                res = G[:k + ncol] - H[:k + ncol, :k].dot(Y)
+                self._monitor(res)
+
+                if np.all(np.linalg.norm(res, axis=0) <= tol) or self._iter_count >= maxiter or \
+                   np.linalg.norm(R) <= 1e-14 * np.linalg.norm(H[:k, :k]):
+                    break
+
+            for i, z in enumerate(Z):
+                x += z.dot(Y[i * ncol:(i + 1) * ncol])
+
+        x_vec.set_val(x)
+
+        return 0 if np.all(np.linalg.norm(r, axis=0) <= tol) else self._iter_count
+
     def _apply_precon(self, in_vec):
         """
         Apply preconditioner.
@@ -11,6 +11,7 @@ from openmdao.test_suite.components.misc_components import Comp4LinearCacheTest
 from openmdao.test_suite.components.sellar import SellarDis1withDerivatives, SellarDis2withDerivatives
 from openmdao.test_suite.groups.implicit_group import TestImplicitGroup
 from openmdao.utils.assert_utils import assert_near_equal, assert_warning
+from openmdao.utils.testing_utils import use_tempdirs
 
 
 # use this to fake out the TestImplicitGroup so it'll use the solver we want.
@@ -20,6 +21,7 @@ def krylov_factory(solver):
     return f
 
 
+@use_tempdirs
 class TestScipyKrylov(LinearSolverTests.LinearSolverTestCase):
 
     linear_solver_name = 'gmres'
@@ -186,6 +188,55 @@ class TestScipyKrylov(LinearSolverTests.LinearSolverTestCase):
         # Should take less iterations when starting from previous solution.
         self.assertTrue(icount2 < icount1)
 
+    def _coupled_vectorized_model(self, mode, precon=False):
+        n = 6
+        prob = om.Problem()
+        model = prob.model
+
+        model.add_subsystem('px', om.IndepVarComp('x', np.arange(1.0, n + 1)), promotes=['x'])
+
+        cycle = model.add_subsystem('cycle', om.Group(), promotes=['*'])
+        cycle.add_subsystem('d1', om.ExecComp('y1 = x**2 + 0.3 * y2', x=np.ones(n), y1=np.ones(n),
+                                              y2=np.ones(n), has_diag_partials=True),
+                            promotes=['*'])
+        cycle.add_subsystem('d2', om.ExecComp('y2 = 0.5 * y1 - 0.2 * x', x=np.ones(n),
+                                              y1=np.ones(n), y2=np.ones(n),
+                                              has_diag_partials=True),
+                            promotes=['*'])
+        cycle.nonlinear_solver = om.NonlinearBlockGS(atol=1e-14, rtol=1e-14)
+
+        model.add_design_var('x', vectorize_derivs=True)
+        model.add_constraint('y1', upper=0.0, vectorize_derivs=True)
+        model.add_constraint('y2', upper=0.0, vectorize_derivs=True)
+
+        model.linear_solver = om.ScipyKrylov()
+        if precon:
+            model.linear_solver.precon = om.LinearBlockGS(maxiter=2)
+
+        prob.setup(mode=mode)
+        prob.set_solver_print(level=0)
+        prob.run_model()
+
+        return prob
+
+    def test_block_gmres_vectorized_derivs(self):
+        # y1 = x**2 + 0.3 * y2, y2 = 0.5 * y1 - 0.2 * x
+        x = np.arange(1.0, 7)
+        dy1 = np.diag((2.0 * x - 0.06) / 0.85)
+        dy2 = 0.5 * dy1 - 0.2 * np.eye(6)
+
+        for mode in ('fwd', 'rev'):
+            for precon in (False, True):
+                prob = self._coupled_vectorized_model(mode, precon)
+                J = prob.compute_totals(of=['y1', 'y2'], wrt=['x'])
+
+                assert_near_equal(J['y1', 'x'], dy1, 1e-10)
+                assert_near_equal(J['y2', 'x'], dy2, 1e-10)
+
+                # all 6 columns share one Krylov subspace, so the number of block iterations
+                # doesn't grow with the number of columns.
+                self.assertLessEqual(prob.model.linear_solver._iter_count, 3)
+
 
 class TestScipyKrylovFeature(unittest.TestCase):
 
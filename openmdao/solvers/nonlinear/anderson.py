@@ -0,0 +1,198 @@
+"""Define the AndersonAccelerator class used by the nonlinear block solvers."""
+
+import numpy as np
+
+
+class AndersonAccelerator(object):
+    """
+    Anderson acceleration of a fixed-point iteration x = G(x).
+
+    Differences of the past fixed-point residuals f = G(x) - x and map values G(x) are stored in
+    ring buffers with a column for each of the last 'depth' iterations, so the memory cost is
+    2 * depth vectors of the size of the iterate.
+
+    Attributes
+    ----------
+    _comm : MPI.Comm or <FakeComm> or None
+        Communicator used to sum the least squares system when the iterate is distributed.
+    _count : int
+        Number of valid columns in the history.
+    _damping : float
+        Mixing parameter (beta) applied to the accelerated update.
+    _depth : int
+        Maximum number of previous iterations used in the update.
+    _dF : ndarray or None
+        Ring buffer of differences of successive fixed-point residuals.
+    _dG : ndarray or None
+        Ring buffer of differences of successive fixed-point map values.
+    _f : ndarray or None
+        Fixed-point residual from the previous iteration.
+    _g : ndarray or None
+        Fixed-point map value from the previous iteration.
+    _next : int
+        Column of the ring buffers that will be overwritten next.
+    _regularization : float
+        Tikhonov regularization parameter, relative to the squared norm of the residual history.
+    _restart : bool
+        If True, clear the history whenever it is full instead of discarding the oldest column.
+    """
+
+    def __init__(self, depth, regularization=0.0, restart=False, damping=1.0, comm=None):
+        """
+        Initialize attributes.
+
+        Parameters
+        ----------
+        depth : int
+            Maximum number of previous iterations used in the update.
+        regularization : float
+            Tikhonov regularization parameter, relative to the squared norm of the residual
+            history.
+        restart : bool
+            If True, clear the history whenever it is full instead of discarding the oldest column.
+        damping : float
+            Mixing parameter (beta) applied to the accelerated update.
+        comm : MPI.Comm or <FakeComm> or None
+            Communicator used to sum the least squares system when the iterate is distributed.
+        """
+        self._depth = depth
+        self._regularization = regularization
+        self._restart = restart
+        self._damping = damping
+        self._comm = comm
+
+        self._dF = None
+        self._dG = None
+        self.reset()
+
+    def reset(self):
+        """
+        Clear the iteration history.
+        """
+        self._f = None
+        self._g = None
+        self._count = 0
+        self._next = 0
+
+    def update(self, x, g):
+        """
+        Compute the next iterate.
+
+        Parameters
+        ----------
+        x : ndarray
+            Current iterate.
+        g : ndarray
+            Value of the fixed-point map at the current iterate.
+
+        Returns
+        -------
+        ndarray
+            The accelerated next iterate.
+        """
+        f = g - x
+
+        if self._f is not None:
+            if self._dF is None or self._dF.shape[0] != x.size or self._dF.dtype != x.dtype:
+                self._dF = np.empty((x.size, self._depth), dtype=x.dtype)
+                self._dG = np.empty((x.size, self._depth), dtype=x.dtype)
+
+            col = self._next
+            np.subtract(f, self._f, out=self._dF[:, col])
+            np.subtract(g, self._g, out=self._dG[:, col])
+            self._next = (col + 1) % self._depth
+            self._count = min(self._count + 1, self._depth)
+
+        self._f = f
+        self._g = g.copy()
+
+        damping = self._damping
+        if self._count == 0:
+            return x + damping * f
+
+        dF = self._dF[:, :self._count]
+        dG = self._dG[:, :self._count]
+
+        # Don't conjugate here so that this works under complex step.
+        A = dF.T.dot(dF)
+        b = dF.T.dot(f)
+        if self._comm is not None and self._comm.size > 1:
+            A = self._comm.allreduce(A)
+            b = self._comm.allreduce(b)
+
+        if self._regularization > 0.0:
+            A[np.diag_indices_from(A)] += self._regularization * np.trace(A)
+
+        gamma = np.linalg.lstsq(A, b, rcond=None)[0]
+
+        x_new = g - dG.dot(gamma)
+        if damping != 1.0:
+            x_new -= (1.0 - damping) * (f - dF.dot(gamma))
+
+        if self._restart and self._count == self._depth:
+            self.reset()
+
+        return x_new
+
+
+def declare_anderson_options(options):
+    """
+    Declare the Anderson acceleration options of a nonlinear block solver.
+
+    Parameters
+    ----------
+    options : <OptionsDictionary>
+        Options of the solver.
+    """
+    options.declare('use_anderson', types=bool, default=False,
+                    desc='set to True to use Anderson acceleration')
+    options.declare('anderson_depth', types=int, default=5, lower=1,
+                    desc='number of previous iterations used by Anderson acceleration')
+    options.declare('anderson_regularization', default=1e-10, lower=0.0,
+                    desc='Tikhonov regularization of the Anderson least squares problem, '
+                    'relative to the squared norm of the residual history')
+    options.declare('anderson_restart', types=bool, default=False,
+                    desc='When True, clear the Anderson history each time it is full '
+                    'instead of discarding the oldest iteration.')
+    options.declare('anderson_damping', default=1.0, lower=0.0, upper=1.0,
+                    desc='damping (mixing) factor applied to the Anderson update')
+
+
+def prepare_anderson_accelerator(accelerator, options, comm):
+    """
+    Prepare an AndersonAccelerator for a new solve by a nonlinear block solver.
+
+    A new accelerator is only created the first time, or if the depth has changed, so that the
+    history buffers are reused from one solve to the next. Otherwise the settings of the existing
+    accelerator are updated from the options and its history is cleared.
+
+    Parameters
+    ----------
+    accelerator : <AndersonAccelerator> or None
+        Accelerator used by the previous solve, if any.
+    options : <OptionsDictionary>
+        Options of the solver.
+    comm : MPI.Comm or <FakeComm>
+        Communicator of the solver's system.
+
+    Returns
+    -------
+    <AndersonAccelerator>
+        An accelerator with an empty history.
+    """
+    comm = comm if comm.size > 1 else None
+
+    if accelerator is None or accelerator._depth != options['anderson_depth']:
+        return AndersonAccelerator(options['anderson_depth'],
+                                   regularization=options['anderson_regularization'],
+                                   restart=options['anderson_restart'],
+                                   damping=options['anderson_damping'],
+                                   comm=comm)
+
+    accelerator._regularization = options['anderson_regularization']
+    accelerator._restart = options['anderson_restart']
+    accelerator._damping = options['anderson_damping']
+    accelerator._comm = comm
+    accelerator.reset()
+
+    return accelerator
@@ -37,8 +37,8 @@ class BroydenSolver(NonlinearSolver):
         Most recent change in state vector.
     fxm : ndarray
         Most recent residual.
-    Gm : ndarray
-        Most recent Jacobian matrix.
+    Gm : ndarray or None
+        Most recent inverse Jacobian matrix. Not allocated when the limited_memory option is True.
     linear_solver : LinearSolver
         Linear solver to use for calculating inverse Jacobian.
     linesearch : NonlinearSolver
@@ -49,6 +49,12 @@ class BroydenSolver(NonlinearSolver):
         Most recent state.
     _idx : dict
         Cache of vector indices for each state name.
+    _lm_u : list of ndarray
+        Left vectors of the rank-one updates to the initial inverse Jacobian. Only used if the
+        limited_memory option is True.
+    _lm_v : list of ndarray
+        Right vectors of the rank-one updates to the initial inverse Jacobian. Only used if the
+        limited_memory option is True.
     _computed_jacobians : int
         Number of computed jacobians.
     _converge_failures : int
@@ -90,6 +96,8 @@ class BroydenSolver(NonlinearSolver):
         self.delta_fxm = None
         self._converge_failures = 0
         self._computed_jacobians = 0
+        self._lm_u = []
+        self._lm_v = []
 
         # This gets set to True if the user doesn't declare any states.
         self._full_inverse = False
@@ -124,6 +132,14 @@ class BroydenSolver(NonlinearSolver):
                                   "Jacobian.")
         self.options.declare('max_jacobians', default=10,
                              desc="Maximum number of jacobians to compute.")
+        self.options.declare('limited_memory', types=bool, default=False,
+                             desc="When True, store only the most recent Broyden updates and "
+                                  "apply the inverse Jacobian implicitly instead of forming it. "
+                                  "The initial Jacobian, if computed, is applied with a linear "
+                                  "solve instead of being inverted.")
+        self.options.declare('memory', types=int, default=10, lower=1,
+                             desc="Maximum number of Broyden updates to store when limited_memory "
+                                  "is True. The updates are discarded when this number is reached.")
         self.options.declare('state_vars', [], desc="List of the state-variable/residuals that "
                                                     "are to be solved here.")
         self.options.declare('update_broyden', default=True,
@@ -194,17 +210,20 @@ class BroydenSolver(NonlinearSolver):
             n = np.sum(system._owned_sizes)
 
         self.size = n
-        self.Gm = np.empty((n, n))
+        self.Gm = None if self.options['limited_memory'] else np.empty((n, n))
         self.xm = np.empty((n, ))
         self.fxm = np.empty((n, ))
         self.delta_xm = None
         self.delta_fxm = None
+        self._lm_u = []
+        self._lm_v = []
 
         if self._full_inverse:
 
-            # Can only use DirectSolver here.
+            # Can only use DirectSolver here, unless the inverse is never formed.
             from openmdao.solvers.linear.direct import DirectSolver
-            if not isinstance(self.linear_solver, DirectSolver):
+            if not self.options['limited_memory'] and \
+               not isinstance(self.linear_solver, DirectSolver):
                 msg = "{}: Linear solver must be DirectSolver when solving the full model."
                 raise ValueError(msg.format(self.msginfo, ', '.join(bad_names)))
 
@@ -295,15 +314,25 @@ class BroydenSolver(NonlinearSolver):
             self._err_cache['inputs'] = system._inputs._copy_views()
             self._err_cache['outputs'] = system._outputs._copy_views()
 
+        # In limited memory mode, the initial Jacobian must be linearized again when switching
+        # into or out of complex step so that its factorization has the right data type.
+        if self.options['limited_memory'] and \
+           system.under_complex_step != np.iscomplexobj(self.xm):
+            self._recompute_jacobian = True
+
         # Convert local storage if we are under complex step.
         if system.under_complex_step:
-            self.Gm = self.Gm.astype(np.complex)
+            if self.Gm is not None:
+                self.Gm = self.Gm.astype(np.complex)
             self.xm = self.xm.astype(np.complex)
             self.fxm = self.fxm.astype(np.complex)
         elif np.iscomplexobj(self.xm):
-            self.Gm = self.Gm.real
+            if self.Gm is not None:
+                self.Gm = self.Gm.real
             self.xm = self.xm.real
             self.fxm = self.fxm.real
+            self._lm_u = [u.real for u in self._lm_u]
+            self._lm_v = [v.real for v in self._lm_v]
 
         self._converge_failures = 0
         self._computed_jacobians = 0
@@ -375,10 +404,15 @@ class BroydenSolver(NonlinearSolver):
         Perform the operations in the iteration loop.
         """
         system = self._system()
-        Gm = self._update_inverse_jacobian()
         fxm = self.fxm
 
-        delta_xm = -Gm.dot(fxm)
+        if self.options['limited_memory']:
+            self._update_limited_memory()
+            Gm = None
+            delta_xm = -self._apply_inverse_jacobian(fxm)
+        else:
+            Gm = self._update_inverse_jacobian()
+            delta_xm = -Gm.dot(fxm)
 
         if self.linesearch:
             self._solver_info.append_subsolver()
@@ -472,6 +506,105 @@ class BroydenSolver(NonlinearSolver):
 
         return Gm
 
+    def _update_limited_memory(self):
+        """
+        Update the stored rank-one corrections for a new limited-memory Broyden iteration.
+
+        The inverse Jacobian is the initial inverse Jacobian plus the sum of the outer products of
+        the stored vectors, so only 2 * memory vectors of the state size are kept.
+        """
+        # Apply the Broyden Update approximation to the previous value of the inverse jacobian.
+        if self.options['update_broyden'] and not self._recompute_jacobian:
+            dfxm = self.delta_fxm
+            fact = np.linalg.norm(dfxm)
+
+            # Sometimes you can get stuck, particularly when enforcing bounds in a linesearch.
+            # Make sure we don't update in this case because of divide by zero.
+            if fact > self.options['atol']:
+
+                # Restart from the initial inverse Jacobian when the storage is full.
+                if len(self._lm_u) >= self.options['memory']:
+                    self._lm_u = []
+                    self._lm_v = []
+
+                self._lm_u.append(self.delta_xm - self._apply_inverse_jacobian(dfxm))
+                self._lm_v.append(dfxm * (1.0 / fact**2))
+
+        else:
+            self._lm_u = []
+            self._lm_v = []
+
+            # Linearize the model so that the initial Jacobian can be applied with a linear solve.
+            if self.options['compute_jacobian']:
+                system = self._system()
+
+                # Disable local fd
+                approx_status = system._owns_approx_jac
+                system._owns_approx_jac = False
+
+                self._linearize_model()
+
+                # Enable local fd
+                system._owns_approx_jac = approx_status
+
+                self._computed_jacobians += 1
+
+    def _apply_inverse_jacobian(self, vec):
+        """
+        Multiply a vector by the limited-memory inverse Jacobian.
+
+        Parameters
+        ----------
+        vec : ndarray
+            Vector to multiply.
+
+        Returns
+        -------
+        ndarray
+            Product of the inverse Jacobian and vec.
+        """
+        if self.options['compute_jacobian']:
+            result = self._solve_initial_jacobian(vec)
+        else:
+            # Identity scaled by alpha, as in the full Broyden update.
+            result = -self.options['alpha'] * vec
+
+        for u, v in zip(self._lm_u, self._lm_v):
+            result += u * v.dot(vec)
+
+        return result
+
+    def _solve_initial_jacobian(self, vec):
+        """
+        Solve the linear system with the most recently linearized Jacobian.
+
+        Parameters
+        ----------
+        vec : ndarray
+            Right-hand side at the states.
+
+        Returns
+        -------
+        ndarray
+            Solution at the states.
+        """
+        system = self._system()
+        d_res = system._vectors['residual']['linear']
+        d_out = system._vectors['output']['linear']
+
+        if self._full_inverse:
+            d_res.set_val(vec)
+        else:
+            d_res.set_val(0.0)
+            for name in self.options['state_vars']:
+                if name in d_res:
+                    i, j = self._idx[name]
+                    d_res[name] = vec[i:j]
+
+        self.linear_solver.solve(['linear'], 'fwd')
+
+        return self.get_vector(d_out)
+
     def get_vector(self, vec):
         """
         Return a vector containing the values of vec at the states specified in options.
@@ -562,14 +695,8 @@ class BroydenSolver(NonlinearSolver):
         approx_status = system._owns_approx_jac
         system._owns_approx_jac = False
 
-        # Linearize model.
+        self._linearize_model()
         ln_solver = self.linear_solver
-        do_sub_ln = ln_solver._linearize_children()
-        my_asm_jac = ln_solver._assembled_jac
-        system._linearize(my_asm_jac, sub_do_ln=do_sub_ln)
-        if my_asm_jac is not None and system.linear_solver._assembled_jac is not my_asm_jac:
-            my_asm_jac._update(system)
-        self._linearize()
 
         for wrt_name in states:
             i_wrt, j_wrt = self._idx[wrt_name]
@@ -598,6 +725,26 @@ class BroydenSolver(NonlinearSolver):
 
         return inv_jac
 
+    def _linearize_model(self, linearize_solvers=True):
+        """
+        Linearize the model and optionally the linear solver, including any matrix factorization.
+
+        Parameters
+        ----------
+        linearize_solvers : bool
+            If True, also linearize this solver's linear solver and line search.
+        """
+        system = self._system()
+        ln_solver = self.linear_solver
+        do_sub_ln = ln_solver._linearize_children()
+        my_asm_jac = ln_solver._assembled_jac
+        system._linearize(my_asm_jac, sub_do_ln=do_sub_ln)
+        if my_asm_jac is not None and system.linear_solver._assembled_jac is not my_asm_jac:
+            my_asm_jac._update(system)
+
+        if linearize_solvers:
+            self._linearize()
+
     def _compute_full_inverse_jacobian(self):
         """
         Compute inverse Jacobian for entire system vector.
@@ -615,13 +762,9 @@ class BroydenSolver(NonlinearSolver):
         approx_status = system._owns_approx_jac
         system._owns_approx_jac = False
 
-        # Linearize model.
-        ln_solver = self.linear_solver
-        do_sub_ln = ln_solver._linearize_children()
-        my_asm_jac = ln_solver._assembled_jac
-        system._linearize(my_asm_jac, sub_do_ln=do_sub_ln)
-        if my_asm_jac is not None and system.linear_solver._assembled_jac is not my_asm_jac:
-            my_asm_jac._update(system)
+        # Linearize model. The inverse is computed from the assembled jacobian, so the linear
+        # solver doesn't need to factor it.
+        self._linearize_model(linearize_solvers=False)
 
         inv_jac = self.linear_solver._inverse()
 
@@ -1,5 +1,6 @@
 """Define the NewtonSolver class."""
 
+import os
 
 import numpy as np
 
@@ -17,6 +18,12 @@ class NewtonSolver(NonlinearSolver):
 
     Attributes
     ----------
+    _ew_norm : float
+        Residual norm at the previous iteration, used to compute the Eisenstat-Walker forcing term.
+    _ew_rtol : float
+        Forcing term (linear solver relative tolerance) used at the previous iteration.
+    _linear_iter_count : int
+        Total number of linear solver iterations performed during the current solve.
     linear_solver : LinearSolver
         Linear solver to use to find the Newton search direction. The default
         is the parent system's linear solver.
@@ -43,6 +50,10 @@ class NewtonSolver(NonlinearSolver):
         # Slot for linesearch
         self.linesearch = BoundsEnforceLS()
 
+        self._linear_iter_count = 0
+        self._ew_norm = None
+        self._ew_rtol = None
+
     def _declare_options(self):
         """
         Declare options before kwargs are processed in the init method.
@@ -60,6 +71,25 @@ class NewtonSolver(NonlinearSolver):
                              desc='When the option is true, a solver will reraise any '
                              'AnalysisError that arises during subsolve; when false, it will '
                              'continue solving.')
+        self.options.declare('use_eisenstat_walker', types=bool, default=False,
+                             desc='Set to True to use an inexact Newton method, where the relative '
+                             'tolerance of an iterative linear solver is adapted each iteration '
+                             'from the reduction of the nonlinear residual (Eisenstat-Walker '
+                             'forcing terms).')
+        self.options.declare('ew_initial_rtol', default=0.3, lower=0.0, upper=1.0,
+                             desc='Linear solver relative tolerance for the first Newton '
+                             'iteration when use_eisenstat_walker is True.')
+        self.options.declare('ew_max_rtol', default=0.9, lower=0.0, upper=1.0,
+                             desc='Upper limit for the Eisenstat-Walker linear solver relative '
+                             'tolerance.')
+        self.options.declare('ew_min_rtol', default=1e-10, lower=0.0, upper=1.0,
+                             desc='Lower limit for the Eisenstat-Walker linear solver relative '
+                             'tolerance.')
+        self.options.declare('ew_gamma', default=1.0, lower=0.0, upper=1.0,
+                             desc='Scaling factor (gamma) of the Eisenstat-Walker forcing term.')
+        self.options.declare('ew_alpha', default=(1.0 + np.sqrt(5.0)) / 2.0, lower=1.0,
+                             upper=2.0,
+                             desc='Exponent (alpha) of the Eisenstat-Walker forcing term.')
 
         self.supports['gradients'] = True
         self.supports['implicit_components'] = True
@@ -203,9 +233,65 @@ class NewtonSolver(NonlinearSolver):
         self._run_apply()
         norm = self._iter_get_norm()
 
+        self._linear_iter_count = 0
+        self._ew_norm = None
+
         norm0 = norm if norm != 0.0 else 1.0
         return norm0, norm
 
+    def _eisenstat_walker_rtol(self):
+        """
+        Compute the forcing term for the current iteration.
+
+        This is choice 2 from Eisenstat and Walker, "Choosing the Forcing Terms in an Inexact
+        Newton Method", SIAM J. Sci. Comput., 1996, including their safeguard against the forcing
+        term decreasing too quickly.
+
+        Returns
+        -------
+        float
+            Relative tolerance for the linear solve.
+        """
+        options = self.options
+        norm = self._iter_get_norm()
+
+        if self._ew_norm is None or self._ew_norm == 0.0:
+            rtol = options['ew_initial_rtol']
+        else:
+            gamma = options['ew_gamma']
+            alpha = options['ew_alpha']
+            rtol = gamma * (norm / self._ew_norm) ** alpha
+
+            safeguard = gamma * self._ew_rtol ** alpha
+            if safeguard > 0.1:
+                rtol = max(rtol, safeguard)
+
+            rtol = min(rtol, options['ew_max_rtol'])
+
+        rtol = max(rtol, options['ew_min_rtol'])
+
+        self._ew_norm = norm
+        self._ew_rtol = rtol
+
+        return rtol
+
+    def _solve_linear(self):
+        """
+        Solve the linear system for the Newton step, optionally to an adaptive tolerance.
+        """
+        linear_solver = self.linear_solver
+
+        if self.options['use_eisenstat_walker']:
+            linear_solver._forcing_rtol = self._eisenstat_walker_rtol()
+            try:
+                linear_solver.solve(['linear'], 'fwd')
+            finally:
+                linear_solver._forcing_rtol = None
+        else:
+            linear_solver.solve(['linear'], 'fwd')
+
+        self._linear_iter_count += linear_solver._iter_count
+
     def _single_iteration(self):
         """
         Perform the operations in the iteration loop.
@@ -229,7 +315,7 @@ class NewtonSolver(NonlinearSolver):
             my_asm_jac._update(system)
         self._linearize()
 
-        self.linear_solver.solve(['linear'], 'fwd')
+        self._solve_linear()
 
         if self.linesearch:
             self.linesearch._do_subsolve = do_subsolve
@@ -249,6 +335,18 @@ class NewtonSolver(NonlinearSolver):
         # Enable local fd
         system._owns_approx_jac = approx_status
 
+    def _solve(self):
+        """
+        Run the iterative solver.
+        """
+        super()._solve()
+
+        system = self._system()
+        if self.options['use_eisenstat_walker'] and self.options['iprint'] > 0 and \
+           (system.comm.rank == 0 or os.environ.get('USE_PROC_FILES')):
+            print(self._solver_info.prefix + self.SOLVER +
+                  ' Total linear iterations: {}'.format(self._linear_iter_count))
+
     def _set_complex_step_mode(self, active):
         """
         Turn on or off complex stepping mode.
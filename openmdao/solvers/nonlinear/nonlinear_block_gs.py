@@ -2,6 +2,8 @@
 
 import numpy as np
 
+from openmdao.solvers.nonlinear.anderson import declare_anderson_options, \
+    prepare_anderson_accelerator
 from openmdao.solvers.solver import NonlinearSolver
 from openmdao.utils.mpi import MPI
 
@@ -12,6 +14,9 @@ class NonlinearBlockGS(NonlinearSolver):
 
     Attributes
     ----------
+    _anderson : <AndersonAccelerator> or None
+        Object that stores the iteration history and computes the accelerated update. Only used if
+        the anderson acceleration option is turned on.
     _delta_outputs_n_1 : ndarray
         Cached change in the full output vector for the previous iteration. Only used if the aitken
         acceleration option is turned on.
@@ -35,6 +40,7 @@ class NonlinearBlockGS(NonlinearSolver):
 
         self._theta_n_1 = 1.0
         self._delta_outputs_n_1 = None
+        self._anderson = None
 
     def _setup_solvers(self, system, depth):
         """
@@ -55,6 +61,10 @@ class NonlinearBlockGS(NonlinearSolver):
             raise RuntimeError('{}: Nonlinear Gauss-Seidel cannot be used on a '
                                'parallel group.'.format(self.msginfo))
 
+        if self.options['use_aitken'] and self.options['use_anderson']:
+            raise RuntimeError("{}: Options 'use_aitken' and 'use_anderson' cannot both be "
+                               "True.".format(self.msginfo))
+
     def _declare_options(self):
         """
         Declare options before kwargs are processed in the init method.
@@ -69,6 +79,7 @@ class NonlinearBlockGS(NonlinearSolver):
                              desc='upper limit for Aitken relaxation factor')
         self.options.declare('aitken_initial_factor', default=1.0,
                              desc='initial value for Aitken relaxation factor')
+        declare_anderson_options(self.options)
         self.options.declare('cs_reconverge', types=bool, default=True,
                              desc='When True, when this driver solves under a complex step, nudge '
                              'the Solution vector by a small amount so that it reconverges.')
@@ -97,6 +108,10 @@ class NonlinearBlockGS(NonlinearSolver):
             self._delta_outputs_n_1 = system._outputs.asarray(copy=True)
             self._theta_n_1 = 1.
 
+        if self.options['use_anderson']:
+            self._anderson = prepare_anderson_accelerator(self._anderson, self.options,
+                                                          system.comm)
+
         # When under a complex step from higher in the hierarchy, sometimes the step is too small
         # to trigger reconvergence, so nudge the outputs slightly so that we always get at least
         # one iteration.
@@ -116,6 +131,11 @@ class NonlinearBlockGS(NonlinearSolver):
         outputs = system._outputs
         residuals = system._residuals
         use_aitken = self.options['use_aitken']
+        use_anderson = self.options['use_anderson']
+
+        if use_anderson:
+            # store a copy of the scaled outputs, which is the current Anderson iterate
+            anderson_x = outputs.asarray(copy=True)
 
         if use_aitken:
 
@@ -200,6 +220,11 @@ class NonlinearBlockGS(NonlinearSolver):
             # save update to use in next iteration
             delta_outputs_n_1[:] = delta_outputs_n
 
+        elif use_anderson:
+            # the NLBGS sweep is the fixed-point map, so replace its result with the Anderson
+            # combination of it and the stored history.
+            outputs.set_val(self._anderson.update(anderson_x, outputs.asarray()))
+
         if not self.options['use_apply_nonlinear']:
             # Residual is the change in the outputs vector.
             with system._unscaled_context(outputs=[outputs], residuals=[residuals]):
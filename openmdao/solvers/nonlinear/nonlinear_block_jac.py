@@ -1,5 +1,7 @@
 """Define the NonlinearBlockJac class."""
 from openmdao.recorders.recording_iteration_stack import Recording
+from openmdao.solvers.nonlinear.anderson import declare_anderson_options, \
+    prepare_anderson_accelerator
 from openmdao.solvers.solver import NonlinearSolver
 from openmdao.utils.mpi import multi_proc_fail_check
 
@@ -7,15 +9,65 @@ from openmdao.utils.mpi import multi_proc_fail_check
 class NonlinearBlockJac(NonlinearSolver):
     """
     Nonlinear block Jacobi solver.
+
+    Attributes
+    ----------
+    _anderson : <AndersonAccelerator> or None
+        Object that stores the iteration history and computes the accelerated update. Only used if
+        the anderson acceleration option is turned on.
     """
 
     SOLVER = 'NL: NLBJ'
 
+    def __init__(self, **kwargs):
+        """
+        Initialize all attributes.
+
+        Parameters
+        ----------
+        **kwargs : dict
+            options dictionary.
+        """
+        super().__init__(**kwargs)
+
+        self._anderson = None
+
+    def _declare_options(self):
+        """
+        Declare options before kwargs are processed in the init method.
+        """
+        super()._declare_options()
+
+        declare_anderson_options(self.options)
+
+    def _iter_initialize(self):
+        """
+        Perform any necessary pre-processing operations.
+
+        Returns
+        -------
+        float
+            initial error.
+        float
+            error at the first iteration.
+        """
+        if self.options['use_anderson']:
+            self._anderson = prepare_anderson_accelerator(self._anderson, self.options,
+                                                          self._system().comm)
+
+        return super()._iter_initialize()
+
     def _single_iteration(self):
         """
         Perform the operations in the iteration loop.
         """
         system = self._system()
+        use_anderson = self.options['use_anderson']
+
+        if use_anderson:
+            # store a copy of the scaled outputs, which is the current Anderson iterate
+            anderson_x = system._outputs.asarray(copy=True)
+
         self._solver_info.append_subsolver()
         system._transfer('nonlinear', 'fwd')
 
@@ -35,6 +87,12 @@ class NonlinearBlockJac(NonlinearSolver):
 
         self._solver_info.pop()
 
+        if use_anderson:
+            # the block Jacobi sweep is the fixed-point map, so replace its result with the
+            # Anderson combination of it and the stored history.
+            outputs = system._outputs
+            outputs.set_val(self._anderson.update(anderson_x, outputs.asarray()))
+
     def _mpi_print_header(self):
         """
         Print header text before solving.
@@ -497,6 +497,60 @@ class TestBryoden(unittest.TestCase):
         # Jacobian.
         self.assertTrue(model.nonlinear_solver._iter_count < 5)
 
+    def test_mixed_limited_memory(self):
+        # The limited memory inverse should match the dense inverse until the storage fills up.
+
+        for limited_memory in [False, True]:
+            prob = om.Problem()
+            model = prob.model
+
+            model.add_subsystem('p1', om.IndepVarComp('c', 0.01))
+            model.add_subsystem('mixed', MixedEquation())
+
+            model.connect('p1.c', 'mixed.c')
+
+            model.nonlinear_solver = om.BroydenSolver()
+            model.nonlinear_solver.options['state_vars'] = ['mixed.x12', 'mixed.x3', 'mixed.x45']
+            model.nonlinear_solver.options['maxiter'] = 15
+            model.nonlinear_solver.options['compute_jacobian'] = False
+            model.nonlinear_solver.options['limited_memory'] = limited_memory
+            model.nonlinear_solver.options['memory'] = 15
+
+            prob.setup()
+
+            prob.run_model()
+
+            assert_near_equal(prob['mixed.x12'], np.zeros((2, )), 1e-6)
+            assert_near_equal(prob['mixed.x3'], 0.0, 1e-6)
+            assert_near_equal(prob['mixed.x45'], np.zeros((2, )), 1e-6)
+
+            if limited_memory:
+                self.assertIsNone(model.nonlinear_solver.Gm)
+                self.assertEqual(model.nonlinear_solver._iter_count, iter_count)
+            else:
+                iter_count = model.nonlinear_solver._iter_count
+
+    def test_simple_sellar_full_limited_memory(self):
+        # Full model mode with an iterative linear solver.
+
+        prob = om.Problem()
+        model = prob.model = SellarStateConnection(nonlinear_solver=om.BroydenSolver(),
+                                                   linear_solver=om.LinearRunOnce())
+
+        prob.setup()
+
+        model.nonlinear_solver.linear_solver = om.ScipyKrylov()
+        model.nonlinear_solver.options['limited_memory'] = True
+        model.nonlinear_solver.options['memory'] = 2
+
+        prob.run_model()
+
+        assert_near_equal(prob['y1'], 25.58830273, .00001)
+        assert_near_equal(prob['state_eq.y2_command'], 12.05848819, .00001)
+
+        self.assertTrue(model.nonlinear_solver._iter_count < 5)
+        self.assertTrue(len(model.nonlinear_solver._lm_u) <= 2)
+
     def test_jacobian_update_converge_limit(self):
         # This model needs jacobian updates to converge.
 
@@ -705,6 +759,45 @@ class TestBryoden(unittest.TestCase):
         for key, val in totals.items():
             assert_near_equal(val['rel error'][0], 0.0, 1e-6)
 
+    def test_cs_around_broyden_limited_memory(self):
+
+        prob = om.Problem()
+        model = prob.model
+        sub = model.add_subsystem('sub', om.Group(), promotes=['*'])
+
+        model.add_subsystem('px', om.IndepVarComp('x', 1.0), promotes=['x'])
+        model.add_subsystem('pz', om.IndepVarComp('z', np.array([5.0, 2.0])), promotes=['z'])
+
+        sub.add_subsystem('d1', SellarDis1withDerivatives(), promotes=['x', 'z', 'y1', 'y2'])
+        sub.add_subsystem('d2', SellarDis2withDerivatives(), promotes=['z', 'y1', 'y2'])
+
+        model.add_subsystem('obj_cmp', om.ExecComp('obj = x**2 + z[1] + y1 + exp(-y2)',
+                                                z=np.array([0.0, 0.0]), x=0.0),
+                            promotes=['obj', 'x', 'z', 'y1', 'y2'])
+
+        model.add_subsystem('con_cmp1', om.ExecComp('con1 = 3.16 - y1'), promotes=['con1', 'y1'])
+        model.add_subsystem('con_cmp2', om.ExecComp('con2 = y2 - 24.0'), promotes=['con2', 'y2'])
+
+        sub.nonlinear_solver = om.BroydenSolver(limited_memory=True)
+        sub.linear_solver = om.DirectSolver()
+        model.linear_solver = om.DirectSolver()
+
+        prob.model.add_design_var('x', lower=-100, upper=100)
+        prob.model.add_design_var('z', lower=-100, upper=100)
+        prob.model.add_objective('obj')
+        prob.model.add_constraint('con1', upper=0.0)
+        prob.model.add_constraint('con2', upper=0.0)
+
+        prob.setup(check=False, force_alloc_complex=True)
+        prob.set_solver_print(level=0)
+
+        prob.run_model()
+
+        totals = prob.check_totals(method='cs', out_stream=None)
+
+        for key, val in totals.items():
+            assert_near_equal(val['rel error'][0], 0.0, 1e-6)
+
     def test_complex_step(self):
         prob = om.Problem()
         model = prob.model
@@ -898,6 +991,41 @@ class TestBryodenFeature(unittest.TestCase):
         # sanity check: should sum to .1 Amps
         assert_near_equal(p.get_val('circuit.R1.I') + p.get_val('circuit.D1.I'), .1, 1e-6)
 
+    def test_circuit_limited_memory(self):
+        import openmdao.api as om
+        from openmdao.test_suite.scripts.circuit_analysis import Circuit
+
+        p = om.Problem()
+        model = p.model
+
+        model.add_subsystem('circuit', Circuit(), promotes_inputs=[('Vg', 'V'), ('I_in', 'I')])
+        model.set_input_defaults('V', 0., units='V')
+        model.set_input_defaults('I', 0.1, units='A')
+
+        p.setup()
+
+        # Replace existing solver with BroydenSolver
+        model.circuit.nonlinear_solver = om.BroydenSolver()
+        model.circuit.nonlinear_solver.options['maxiter'] = 20
+
+        # Keep only the last 5 Broyden updates instead of a dense inverse Jacobian.
+        model.circuit.nonlinear_solver.options['limited_memory'] = True
+        model.circuit.nonlinear_solver.options['memory'] = 5
+        model.circuit.nonlinear_solver.linear_solver = om.DirectSolver()
+
+        # set some initial guesses
+        p.set_val('circuit.n1.V', 10.)
+        p.set_val('circuit.n2.V', 1.)
+
+        p.set_solver_print(level=2)
+        p.run_model()
+
+        assert_near_equal(p.get_val('circuit.n1.V'), 9.90804735, 1e-5)
+        assert_near_equal(p.get_val('circuit.n2.V'), 0.71278226, 1e-5)
+
+        # sanity check: should sum to .1 Amps
+        assert_near_equal(p.get_val('circuit.R1.I') + p.get_val('circuit.D1.I'), .1, 1e-6)
+
 
 if __name__ == "__main__":
     unittest.main()
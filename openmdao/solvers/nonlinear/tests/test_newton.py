@@ -843,6 +843,54 @@ class TestNewton(unittest.TestCase):
         msg = "NewtonSolver in Group (<model>): solve_subsystems must be set by the user."
         self.assertEqual(str(context.exception), msg)
 
+    def test_eisenstat_walker(self):
+        counts = {}
+        for use_ew in (False, True):
+            prob = om.Problem(model=DoubleSellar())
+            model = prob.model
+
+            newton = model.nonlinear_solver = om.NewtonSolver(solve_subsystems=False,
+                                                              use_eisenstat_walker=use_ew,
+                                                              atol=1e-10, rtol=1e-10, maxiter=30)
+            model.linear_solver = om.LinearBlockGS(maxiter=100)
+
+            prob.setup()
+            prob.set_solver_print(level=0)
+            prob.run_model()
+
+            assert_near_equal(prob.get_val('g1.y1'), 0.64, 1e-8)
+            assert_near_equal(prob.get_val('g1.y2'), 0.80, 1e-8)
+            assert_near_equal(prob.get_val('g2.y1'), 0.64, 1e-8)
+            assert_near_equal(prob.get_val('g2.y2'), 0.80, 1e-8)
+
+            counts[use_ew] = newton._linear_iter_count
+
+            # the linear solver's own tolerance is only overridden during the Newton step
+            self.assertIsNone(model.linear_solver._forcing_rtol)
+
+        self.assertLess(counts[True], counts[False])
+
+    def test_eisenstat_walker_scipy_krylov(self):
+        prob = om.Problem(model=DoubleSellar())
+        model = prob.model
+
+        model.nonlinear_solver = om.NewtonSolver(solve_subsystems=False,
+                                                 use_eisenstat_walker=True,
+                                                 atol=1e-10, rtol=1e-10)
+        model.linear_solver = om.ScipyKrylov()
+
+        prob.setup()
+        prob.set_solver_print(level=0)
+        prob.run_model()
+
+        assert_near_equal(prob.get_val('g1.y1'), 0.64, 1e-8)
+        assert_near_equal(prob.get_val('g2.y1'), 0.64, 1e-8)
+
+        # derivatives use the linear solver's own tolerance
+        J = prob.compute_totals(of=['g1.y1'], wrt=['g1.z'])
+        J_fd = prob.check_totals(of=['g1.y1'], wrt=['g1.z'], out_stream=None)
+        assert_near_equal(J['g1.y1', 'g1.z'], J_fd['g1.y1', 'g1.z']['J_fd'], 1e-5)
+
 
 
 class TestNewtonFeatures(unittest.TestCase):
@@ -456,6 +456,81 @@ class TestNLBGaussSeidel(unittest.TestCase):
         J = prob.compute_totals(of=['y1'], wrt=['x'])
         assert_near_equal(J['y1', 'x'][0][0], 0.98061448, 1e-6)
 
+    def test_NLBGS_Anderson(self):
+
+        prob = om.Problem(model=SellarDerivatives())
+        model = prob.model
+        model.nonlinear_solver = om.NonlinearBlockGS()
+
+        prob.setup()
+        model.nonlinear_solver.options['use_anderson'] = True
+        prob.run_model()
+
+        assert_near_equal(prob.get_val('y1'), 25.58830273, .00001)
+        assert_near_equal(prob.get_val('y2'), 12.05848819, .00001)
+
+        # plain NLBGS takes 8 iterations
+        self.assertEqual(model.nonlinear_solver._iter_count, 5)
+
+        # restarting and damping still converge to the same solution
+        model.nonlinear_solver.options['anderson_depth'] = 2
+        model.nonlinear_solver.options['anderson_restart'] = True
+        model.nonlinear_solver.options['anderson_damping'] = 0.8
+        prob.set_val('y1', 1.0)
+        prob.set_val('y2', 1.0)
+        prob.run_model()
+
+        assert_near_equal(prob.get_val('y1'), 25.58830273, .00001)
+        assert_near_equal(prob.get_val('y2'), 12.05848819, .00001)
+
+        # later solves reuse the accelerator and its history buffers
+        anderson = model.nonlinear_solver._anderson
+        buffer = anderson._dF
+        prob.set_val('y1', 1.0)
+        prob.run_model()
+
+        self.assertIs(model.nonlinear_solver._anderson, anderson)
+        self.assertIs(anderson._dF, buffer)
+        assert_near_equal(prob.get_val('y1'), 25.58830273, .00001)
+
+    def test_NLBGS_Anderson_cs(self):
+
+        prob = om.Problem(model=SellarDerivatives())
+
+        model = prob.model
+        model.approx_totals(method='cs', step=1e-10)
+
+        prob.setup()
+        prob.set_solver_print(level=0)
+        model.nonlinear_solver.options['use_anderson'] = True
+        model.nonlinear_solver.options['atol'] = 1e-15
+        model.nonlinear_solver.options['rtol'] = 1e-15
+
+        prob.run_model()
+
+        assert_near_equal(prob.get_val('y1'), 25.58830273, .00001)
+        assert_near_equal(prob.get_val('y2'), 12.05848819, .00001)
+
+        J = prob.compute_totals(of=['y1'], wrt=['x'])
+        assert_near_equal(J['y1', 'x'][0][0], 0.98061448, 1e-6)
+
+    def test_NLBGS_Aitken_Anderson_error(self):
+
+        prob = om.Problem(model=SellarDerivatives())
+        model = prob.model
+        model.nonlinear_solver = om.NonlinearBlockGS()
+
+        prob.setup()
+        model.nonlinear_solver.options['use_aitken'] = True
+        model.nonlinear_solver.options['use_anderson'] = True
+
+        with self.assertRaises(RuntimeError) as cm:
+            prob.run_model()
+
+        self.assertEqual(str(cm.exception),
+                         "NonlinearBlockGS in SellarDerivatives (<model>): Options "
+                         "'use_aitken' and 'use_anderson' cannot both be True.")
+
     def test_NLBGS_cs(self):
 
         prob = om.Problem(model=SellarDerivatives())
@@ -738,6 +738,9 @@ class LinearSolver(Solver):
 
     Attributes
     ----------
+    _forcing_rtol : float or None
+        Relative tolerance requested by an inexact Newton solver for the current solve. When not
+        None, it is used in place of the 'rtol' option.
     _rel_systems : set of str
         Names of systems relevant to the current solve.
     _assembled_jac : AssembledJacobian or None
@@ -755,6 +758,7 @@ class LinearSolver(Solver):
         """
         self._rel_systems = None
         self._assembled_jac = None
+        self._forcing_rtol = None
         super().__init__(**kwargs)
 
     def _assembled_jac_solver_iter(self):
@@ -821,7 +825,7 @@ class LinearSolver(Solver):
         """
         maxiter = self.options['maxiter']
         atol = self.options['atol']
-        rtol = self.options['rtol']
+        rtol = self.options['rtol'] if self._forcing_rtol is None else self._forcing_rtol
         iprint = self.options['iprint']
 
         self._mpi_print_header()
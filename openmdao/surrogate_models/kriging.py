@@ -2,11 +2,49 @@
 import numpy as np
 import scipy.linalg as linalg
 from scipy.optimize import minimize
+from scipy.spatial.distance import pdist, squareform
 
 from openmdao.surrogate_models.surrogate_model import SurrogateModel
+from openmdao.utils.concurrent import fork_map
 
 MACHINE_EPSILON = np.finfo(np.double).eps
 
+# Maximum number of entries in the (points, samples, dims) distance arrays of a batched evaluation.
+_MAX_DISTANCE_SIZE = 2 ** 20
+
+# Jitter added to the diagonal of the correlation matrix when its Cholesky factorization fails.
+_CHOLESKY_JITTER = (0., 1e-10, 1e-8, 1e-6)
+
+
+def _jittered_cholesky(A):
+    """
+    Compute the lower Cholesky factor of a symmetric matrix, adding jitter if necessary.
+
+    If the matrix isn't numerically positive definite, increasing amounts of jitter are added to
+    its diagonal until the factorization succeeds.
+
+    Parameters
+    ----------
+    A : ndarray
+        Symmetric matrix. Its diagonal is modified in place if jitter is needed.
+
+    Returns
+    -------
+    ndarray
+        Lower Cholesky factor.
+    """
+    diag = A.diagonal().copy()
+
+    for jitter in _CHOLESKY_JITTER:
+        A[np.diag_indices_from(A)] = diag + jitter
+        try:
+            return linalg.cholesky(A, lower=True)
+        except linalg.LinAlgError:
+            pass
+
+    raise ValueError('KrigingSurrogate: the correlation matrix is not positive definite. '
+                     'Try increasing the nugget.')
+
 
 class KrigingSurrogate(SurrogateModel):
     """
@@ -19,16 +57,23 @@ class KrigingSurrogate(SurrogateModel):
     ----------
     alpha : ndarray
         Reduced likelihood parameter: alpha
-    L : ndarray
-        Reduced likelihood parameter: L
+    L : ndarray or None
+        Lower Cholesky factor of the correlation matrix, if training_method is 'cholesky'.
     n_dims : int
         Number of independents in the surrogate
     n_samples : int
         Number of training points.
+    S_inv : ndarray or None
+        Regularized inverse of the singular values of the correlation matrix, if training_method
+        is 'svd'.
     sigma2 : ndarray
         Reduced likelihood parameter: sigma squared
     thetas : ndarray
         Kriging hyperparameters.
+    U : ndarray or None
+        Left singular vectors of the correlation matrix, if training_method is 'svd'.
+    Vh : ndarray or None
+        Right singular vectors of the correlation matrix, if training_method is 'svd'.
     X : ndarray
         Training input values, normalized.
     X_mean : ndarray
@@ -41,6 +86,8 @@ class KrigingSurrogate(SurrogateModel):
         Mean of training model response values, normalized.
     Y_std : ndarray
         Standard deviation of training model response values, normalized.
+    _sq_dist : ndarray or None
+        Condensed squared distances between the normalized training points along each dimension.
     """
 
     def __init__(self, **kwargs):
@@ -59,7 +106,10 @@ class KrigingSurrogate(SurrogateModel):
         self.thetas = np.zeros(0)
 
         self.alpha = np.zeros(0)
-        self.L = np.zeros(0)
+        self.L = None
+        self.U = None
+        self.S_inv = None
+        self.Vh = None
         self.sigma2 = np.zeros(0)
 
         # Normalized Training Values
@@ -69,6 +119,7 @@ class KrigingSurrogate(SurrogateModel):
         self.X_std = np.zeros(0)
         self.Y_mean = np.zeros(0)
         self.Y_std = np.zeros(0)
+        self._sq_dist = None
 
     def _declare_options(self):
         """
@@ -91,6 +142,31 @@ class KrigingSurrogate(SurrogateModel):
                                   "or 'gesvd' which is slower but more reliable."
                                   "'gesvd' is the default.")
 
+        self.options.declare('training_method', values=('svd', 'cholesky'), default='svd',
+                             desc="Factorization of the correlation matrix used in training. "
+                                  "'cholesky' is much faster for many training points, and "
+                                  "supplies analytic gradients of the likelihood to the "
+                                  "hyperparameter optimizer. If the correlation matrix is not "
+                                  "numerically positive definite, jitter is added to the "
+                                  "nugget. 'svd' uses a regularized pseudo-inverse.")
+        self.options.declare('num_starts', types=int, default=1, lower=1,
+                             desc="Number of starting points of the hyperparameter optimization. "
+                                  "The starting points after the first are chosen at random, and "
+                                  "the hyperparameters with the best likelihood are kept.")
+        self.options.declare('num_procs', types=int, default=1, lower=1,
+                             desc="Number of local processes used to run the starting points of "
+                                  "the hyperparameter optimization in parallel. Only used when "
+                                  "running without MPI on platforms that support fork.")
+        self.options.declare('drift_tol', default=10., lower=0., allow_none=True,
+                             desc="When training points are added with update, the model is "
+                                  "retrained from scratch, including its hyperparameters, if the "
+                                  "mean squared error of its predictions at the new points "
+                                  "exceeds this multiple of its estimated mean squared error. If "
+                                  "None, the hyperparameters are always reused.")
+        self.options.declare('seed', types=int, default=None, allow_none=True,
+                             desc="Seed of the random starting points of the hyperparameter "
+                                  "optimization.")
+
     def train(self, x, y):
         """
         Train the surrogate model with the given set of inputs and outputs.
@@ -128,28 +204,186 @@ class KrigingSurrogate(SurrogateModel):
         self.X_mean, self.X_std = X_mean, X_std
         self.Y_mean, self.Y_std = Y_mean, Y_std
 
-        def _calcll(thetas):
-            """Calculate loglike (callback function)."""
-            loglike = self._calculate_reduced_likelihood_params(np.exp(thetas))[0]
-            return -loglike
+        # Squared distances between all pairs of training points along each dimension, in
+        # condensed (upper triangular) form. These don't depend on the hyperparameters, so they
+        # are computed once here instead of in every likelihood evaluation.
+        self._sq_dist = np.array([pdist(X[:, i:i + 1], 'sqeuclidean')
+                                  for i in range(self.n_dims)])
 
         bounds = [(np.log(1e-5), np.log(1e5)) for _ in range(self.n_dims)]
 
-        optResult = minimize(_calcll, 1e-1 * np.ones(self.n_dims), method='slsqp',
-                             options={'eps': 1e-3},
-                             bounds=bounds)
+        starts = [1e-1 * np.ones(self.n_dims)]
+        if self.options['num_starts'] > 1:
+            rng = np.random.RandomState(self.options['seed'])
+            lower, upper = np.array(bounds).T
+            starts.extend(rng.uniform(lower, upper,
+                                      size=(self.options['num_starts'] - 1, self.n_dims)))
+
+        results = self._optimize_thetas(starts, bounds)
 
-        if not optResult.success:
-            raise ValueError(f'Kriging Hyper-parameter optimization failed: {optResult.message}')
+        best = None
+        for log_thetas, fun, success, message in results:
+            if success and (best is None or fun < best[1]):
+                best = (log_thetas, fun)
 
-        self.thetas = np.exp(optResult.x)
+        if best is None:
+            raise ValueError(f'Kriging Hyper-parameter optimization failed: {results[0][3]}')
+
+        self.thetas = np.exp(best[0])
         _, params = self._calculate_reduced_likelihood_params()
         self.alpha = params['alpha']
-        self.U = params['U']
-        self.S_inv = params['S_inv']
-        self.Vh = params['Vh']
+        self.L = params.get('L')
+        self.U = params.get('U')
+        self.S_inv = params.get('S_inv')
+        self.Vh = params.get('Vh')
         self.sigma2 = params['sigma2']
 
+    def update(self, x, y):
+        """
+        Add training points to the trained model.
+
+        The hyperparameters and the normalization of the training data are reused. With
+        training_method='cholesky', the Cholesky factor of the correlation matrix is extended
+        instead of recomputed. If the current model predicts the new points poorly compared to
+        its own error estimate (see the drift_tol option), or the nugget is an array, the model is
+        retrained from scratch on all of the points instead.
+
+        Parameters
+        ----------
+        x : array-like
+            Input locations of the new training points.
+        y : array-like
+            Model responses at the new training points.
+        """
+        x, y = np.atleast_2d(x, y)
+
+        if not self.trained:
+            self.train(x, y)
+            return
+
+        drift_tol = self.options['drift_tol']
+        if drift_tol is not None:
+            y_pred, mse = self._predict(x, True)
+            mse = np.maximum(mse, MACHINE_EPSILON * np.square(self.Y_std))
+            drift = np.mean(np.square(y - y_pred) / mse) > drift_tol
+        else:
+            drift = False
+
+        if drift or np.ndim(self.options['nugget']) > 0:
+            x_old = self.X * self.X_std + self.X_mean
+            y_old = self.Y * self.Y_std + self.Y_mean
+            self.train(np.vstack((x_old, x)), np.vstack((y_old, y)))
+            return
+
+        thetas = self.thetas
+        X_new = (x - self.X_mean) / self.X_std
+        self.X = X = np.vstack((self.X, X_new))
+        self.Y = Y = np.vstack((self.Y, (y - self.Y_mean) / self.Y_std))
+        self.n_samples = n = len(X)
+        self._sq_dist = np.array([pdist(X[:, i:i + 1], 'sqeuclidean')
+                                  for i in range(self.n_dims)])
+
+        if self.L is not None:
+            # Border the existing factor: with R = [[R11, R12], [R12^T, R22]] and R11 = L11 L11^T,
+            # L21 = (L11^-1 R12)^T and L22 is the factor of the Schur complement R22 - L21 L21^T.
+            R12 = np.exp(-np.einsum('ijk,k->ji', np.square(X_new[:, np.newaxis, :] - X[:-len(x)]),
+                                    thetas))
+            R22 = np.exp(-np.einsum('ijk,k->ij',
+                                    np.square(X_new[:, np.newaxis, :] - X_new), thetas))
+            R22[np.diag_indices_from(R22)] = 1. + self.options['nugget']
+
+            L21 = linalg.solve_triangular(self.L, R12, lower=True).T
+            L22 = _jittered_cholesky(R22 - L21.dot(L21.T))
+
+            L = np.zeros((n, n))
+            L[:-len(x), :-len(x)] = self.L
+            L[-len(x):, :-len(x)] = L21
+            L[-len(x):, -len(x):] = L22
+
+            self.L = L
+            self.alpha = linalg.cho_solve((L, True), Y)
+            self.sigma2 = np.dot(Y.T, self.alpha).sum(axis=0) / n * np.square(self.Y_std)
+        else:
+            _, params = self._calculate_reduced_likelihood_params()
+            self.alpha = params['alpha']
+            self.U = params['U']
+            self.S_inv = params['S_inv']
+            self.Vh = params['Vh']
+            self.sigma2 = params['sigma2']
+
+    def _optimize_thetas(self, starts, bounds):
+        """
+        Maximize the likelihood from each of the starting points.
+
+        Parameters
+        ----------
+        starts : list of ndarray
+            Starting values of the log of the hyperparameters.
+        bounds : list of tuple
+            Bounds on the log of each hyperparameter.
+
+        Returns
+        -------
+        list of tuple
+            Optimal log of the hyperparameters, objective value, success flag and message of
+            the optimization from each starting point.
+        """
+        jac = self.options['training_method'] == 'cholesky'
+
+        def _optimize(x0):
+            res = minimize(self._neg_reduced_likelihood, x0, method='slsqp', jac=jac,
+                           options={'eps': 1e-3}, bounds=bounds)
+            return res.x, res.fun, res.success, res.message
+
+        results = fork_map(_optimize, starts, self.options['num_procs'])
+
+        # a start that raised is reported as a failed optimization
+        return [retval if err is None else (x0, np.inf, False, err)
+                for x0, (retval, err) in zip(starts, results)]
+
+    def _neg_reduced_likelihood(self, log_thetas):
+        """
+        Calculate the objective of the hyperparameter optimization.
+
+        Parameters
+        ----------
+        log_thetas : ndarray
+            Log of the correlation coefficients.
+
+        Returns
+        -------
+        float
+            Negative reduced likelihood.
+        ndarray, optional (if training_method is 'cholesky')
+            Gradient of the negative reduced likelihood with respect to log_thetas.
+        """
+        thetas = np.exp(log_thetas)
+
+        if self.options['training_method'] == 'cholesky':
+            reduced_likelihood, _, grad = self._cholesky_likelihood_params(thetas, gradient=True)
+            return -reduced_likelihood, -grad * thetas
+
+        return -self._calculate_reduced_likelihood_params(thetas)[0]
+
+    def _correlation_matrix(self, thetas):
+        """
+        Compute the correlation matrix of the training points, without the diagonal.
+
+        Parameters
+        ----------
+        thetas : ndarray
+            Correlation coefficients.
+
+        Returns
+        -------
+        ndarray
+            Condensed (upper triangular) correlations between each pair of training points.
+        ndarray
+            Correlation matrix with a zero diagonal.
+        """
+        R_cond = np.exp(-thetas.dot(self._sq_dist))
+        return R_cond, squareform(R_cond, checks=False)
+
     def _calculate_reduced_likelihood_params(self, thetas=None):
         """
         Calculate quantity with same maximum location as the log-likelihood for a given theta.
@@ -171,16 +405,14 @@ class KrigingSurrogate(SurrogateModel):
         if thetas is None:
             thetas = self.thetas
 
-        X, Y = self.X, self.Y
+        if self.options['training_method'] == 'cholesky':
+            return self._cholesky_likelihood_params(thetas)
+
+        Y = self.Y
         params = {}
 
         # Correlation Matrix
-        distances = np.zeros((self.n_samples, self.n_dims, self.n_samples))
-        for i in range(self.n_samples):
-            distances[i, :, i + 1:] = np.abs(X[i, ...] - X[i + 1:, ...]).T
-            distances[i + 1:, :, i] = distances[i, :, i + 1:].T
-
-        R = np.exp(-thetas.dot(np.square(distances)))
+        _, R = self._correlation_matrix(thetas)
         R[np.diag_indices_from(R)] = 1. + self.options['nugget']
 
         [U, S, Vh] = linalg.svd(R, lapack_driver=self.options['lapack_driver'])
@@ -207,6 +439,58 @@ class KrigingSurrogate(SurrogateModel):
 
         return reduced_likelihood, params
 
+    def _cholesky_likelihood_params(self, thetas, gradient=False):
+        """
+        Calculate the reduced likelihood and its parameters using a Cholesky factorization.
+
+        Parameters
+        ----------
+        thetas : ndarray
+            Correlation coefficients.
+        gradient : bool
+            If True, also compute the gradient of the reduced likelihood.
+
+        Returns
+        -------
+        float
+            Calculated reduced_likelihood
+        dict
+            Dictionary containing the parameters.
+        ndarray, optional (if gradient is True)
+            Gradient of the reduced likelihood with respect to thetas.
+        """
+        n = self.n_samples
+        Y = self.Y
+
+        R_cond, R = self._correlation_matrix(thetas)
+        R[np.diag_indices_from(R)] = 1. + self.options['nugget']
+        L = _jittered_cholesky(R)
+
+        alpha = linalg.cho_solve((L, True), Y)
+        logdet = 2. * np.sum(np.log(np.diag(L)))
+        sigma2 = np.dot(Y.T, alpha).sum(axis=0) / n
+        sum_sigma2 = np.sum(sigma2)
+        reduced_likelihood = -(np.log(sum_sigma2) + logdet / n)
+
+        params = {
+            'alpha': alpha,
+            'sigma2': sigma2 * np.square(self.Y_std),
+            'L': L,
+        }
+
+        if not gradient:
+            return reduced_likelihood, params
+
+        # With a = R^-1 Y 1, sum(sigma2) = (Y 1)^T a / n, and dR/dtheta_k = -D_k * R for the
+        # squared distances D_k, so
+        # d(reduced_likelihood)/dtheta_k = -2 / n * sum_i<j D_k R (a a^T / sum(sigma2) - R^-1).
+        a = alpha.sum(axis=1)
+        R_inv = linalg.cho_solve((L, True), np.eye(n))
+        weights = R_cond * (squareform(np.outer(a, a), checks=False) / sum_sigma2 -
+                            squareform(R_inv, checks=False))
+
+        return reduced_likelihood, params, -2. / n * self._sq_dist.dot(weights)
+
     def predict(self, x):
         """
         Calculate predicted value of the response based on the current trained model.
@@ -223,36 +507,84 @@ class KrigingSurrogate(SurrogateModel):
         ndarray, optional (if eval_rmse is True)
             Root mean square of the prediction error.
         """
+        return self.vectorized_predict(x)
+
+    def vectorized_predict(self, x):
+        """
+        Calculate predicted values of the response based on the current trained model.
+
+        Parameters
+        ----------
+        x : array-like
+            Points at which the surrogate is evaluated, with one row per point.
+
+        Returns
+        -------
+        ndarray
+            Kriging prediction, with one row per point.
+        ndarray, optional (if eval_rmse is True)
+            Root mean square of the prediction error, with one row per point.
+        """
         super().predict(x)
 
-        thetas = self.thetas
-        if isinstance(x, list):
-            x = np.array(x)
-        x = np.atleast_2d(x)
-        n_eval = x.shape[0]
+        eval_rmse = self.options['eval_rmse']
+        y, mse = self._predict(x, eval_rmse)
+
+        if eval_rmse:
+            return y, np.sqrt(mse)
+
+        return y
+
+    def _predict(self, x, eval_mse):
+        """
+        Calculate predicted values and, optionally, mean squared errors of the response.
+
+        Parameters
+        ----------
+        x : array-like
+            Points at which the surrogate is evaluated, with one row per point.
+        eval_mse : bool
+            If True, also compute the mean squared error of the prediction.
 
-        # Normalize input
-        x_n = (x - self.X_mean) / self.X_std
+        Returns
+        -------
+        ndarray
+            Kriging prediction, with one row per point.
+        ndarray or None
+            Mean squared error of the prediction, with one row per point, or None if eval_mse
+            is False.
+        """
+        x_n, chunks = self._normalize_points(x)
+
+        y_t = np.empty((len(x_n), self.alpha.shape[1]), dtype=x_n.dtype)
+        mse = np.empty((len(x_n), 1), dtype=x_n.dtype) if eval_mse else None
 
-        r = np.zeros((n_eval, self.n_samples), dtype=x.dtype)
-        for r_i, x_i in zip(r, x_n):
-            r_i[:] = np.exp(-thetas.dot(np.square((x_i - self.X).T)))
+        for chunk in chunks:
+            r = np.exp(-np.einsum('ijk,k->ij', np.square(x_n[chunk, np.newaxis, :] - self.X),
+                                  self.thetas))
 
-        # Scaled Predictor
-        y_t = np.dot(r, self.alpha)
+            # Scaled Predictor
+            y_t[chunk] = np.dot(r, self.alpha)
+
+            if eval_mse:
+                # Diagonal of r R^-1 r^T, using the factorization of R from training.
+                if self.L is not None:
+                    v = linalg.solve_triangular(self.L, r.T, lower=True)
+                    mse[chunk, 0] = 1. - np.einsum('ij,ij->j', v, v)
+                else:
+                    mse[chunk, 0] = 1. - np.einsum('ij,ij->i', np.dot(r, self.Vh.T),
+                                                   np.dot(r, self.U) * self.S_inv)
 
         # Predictor
         y = self.Y_mean + self.Y_std * y_t
 
-        if self.options['eval_rmse']:
-            mse = (1. - np.dot(np.dot(r, self.Vh.T),
-                               np.einsum('j,kj,lk->jl', self.S_inv, self.U, r))) * self.sigma2
+        if eval_mse:
+            mse = mse * self.sigma2
 
-            # Forcing negative RMSE to zero if negative due to machine precision
+            # Forcing negative MSE to zero if negative due to machine precision
             mse[mse < 0.] = 0.
-            return y, np.sqrt(mse)
 
-        return y
+        return y, mse
 
     def linearize(self, x):
         """
@@ -268,17 +600,58 @@ class KrigingSurrogate(SurrogateModel):
         ndarray
             Jacobian of surrogate output wrt inputs.
         """
+        return self.vectorized_linearize(x)[0]
+
+    def vectorized_linearize(self, x):
+        """
+        Calculate the jacobian of the Kriging surface at the requested points.
+
+        Parameters
+        ----------
+        x : array-like
+            Points at which the surrogate Jacobian is evaluated, with one row per point.
+
+        Returns
+        -------
+        ndarray
+            Jacobian of surrogate output wrt inputs, with shape (n_points, n_outputs, n_inputs).
+        """
         thetas = self.thetas
+        x_n, chunks = self._normalize_points(x)
 
-        # Normalize Input
-        x_n = (x - self.X_mean) / self.X_std
+        jac = np.empty((len(x_n), self.alpha.shape[1], self.n_dims), dtype=x_n.dtype)
 
-        r = np.exp(-thetas.dot(np.square((x_n - self.X).T)))
+        for chunk in chunks:
+            diff = x_n[chunk, np.newaxis, :] - self.X
+            r = np.exp(-np.einsum('ijk,k->ij', np.square(diff), thetas))
 
-        # Z = einsum('i,ij->ij', X, Y) is equivalent to, but much faster and
-        # memory efficient than, diag(X).dot(Y) for vector X and 2D array Y.
-        # i.e., Z[i,j] = X[i]*Y[i,j]
-        gradr = r * -2 * np.einsum('i,ij->ij', thetas, (x_n - self.X).T)
-        jac = np.einsum('i,j,ij->ij', self.Y_std, 1. /
-                        self.X_std, gradr.dot(self.alpha).T)
+            # d(r_ij)/dx_k = -2 * theta_k * (x_k - X_jk) * r_ij
+            jac[chunk] = np.einsum('ij,ijk,jl->ilk', r, diff, self.alpha)
+
+        jac *= np.einsum('i,j->ij', self.Y_std, -2. * thetas / self.X_std)
         return jac
+
+    def _normalize_points(self, x):
+        """
+        Normalize evaluation points and split them into chunks of bounded memory.
+
+        Parameters
+        ----------
+        x : array-like
+            Points at which the surrogate is evaluated.
+
+        Returns
+        -------
+        ndarray
+            Normalized points, with one row per point.
+        list of slice
+            Chunks of points to evaluate together.
+        """
+        x = np.atleast_2d(np.asarray(x))
+        x_n = (x.reshape((-1, self.n_dims)) - self.X_mean) / self.X_std
+
+        n_eval = len(x_n)
+        size = max(1, _MAX_DISTANCE_SIZE // (self.n_samples * self.n_dims))
+        chunks = [slice(i, i + size) for i in range(0, n_eval, size)]
+
+        return x_n, chunks
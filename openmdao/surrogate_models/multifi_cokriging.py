@@ -17,9 +17,9 @@ from numpy import atleast_2d as array2d
 
 from scipy import linalg
 from scipy.optimize import minimize
-from scipy.spatial.distance import squareform
 
 from openmdao.surrogate_models.surrogate_model import MultiFiSurrogateModel
+from openmdao.utils.concurrent import fork_map
 
 import logging
 _logger = logging.getLogger()
@@ -150,29 +150,17 @@ def l1_cross_distances(X, Y=None):
     X = array2d(X)
 
     if Y is None:
-        n_samples, n_features = X.shape
-        n_nonzero_cross_dist = n_samples * (n_samples - 1) // 2
-        D = np.zeros((n_nonzero_cross_dist, n_features))
-        ll_1 = 0
-        for k in range(n_samples - 1):
-            ll_0 = ll_1
-            ll_1 = ll_0 + n_samples - k - 1
-            D[ll_0:ll_1] = np.abs(X[k] - X[(k + 1):])
+        # pairs (i, j) with i < j, in the same order as scipy's condensed distance matrices
+        i, j = np.triu_indices(X.shape[0], k=1)
+        D = np.abs(X[i] - X[j])
     else:
         Y = array2d(Y)
-        n_samples_X, n_features_X = X.shape
-        n_samples_Y, n_features_Y = Y.shape
+        n_features_X = X.shape[1]
+        n_features_Y = Y.shape[1]
         if n_features_X != n_features_Y:
             raise ValueError("X and Y must have the same dimensions.")
-        n_features = n_features_X
 
-        n_nonzero_cross_dist = n_samples_X * n_samples_Y
-        D = np.zeros((n_nonzero_cross_dist, n_features))
-        ll_1 = 0
-        for k in range(n_samples_X):
-            ll_0 = ll_1
-            ll_1 = ll_0 + n_samples_Y  # - k - 1
-            D[ll_0:ll_1] = np.abs(X[k] - Y)
+        D = np.abs(X[:, np.newaxis, :] - Y).reshape((-1, n_features_X))
 
     return D
 
@@ -193,6 +181,9 @@ class MultiFiCoKriging(object):
         Number of fidelity levels.
     normalize : bool, optional
         When true, normalize X and Y so that the mean is at zero.
+    num_procs : int
+        Number of processes used to estimate the autocorrelation parameters of the fidelity
+        levels concurrently.
     regr : string or callable
         A regression function returning an array of outputs of the linear
         regression functional basis for Universal Kriging purpose.
@@ -302,7 +293,7 @@ class MultiFiCoKriging(object):
     }
 
     def __init__(self, regr='constant', rho_regr='constant', normalize=True,
-                 theta=None, theta0=None, thetaL=None, thetaU=None):
+                 theta=None, theta0=None, thetaL=None, thetaU=None, num_procs=1):
         """
         Initialize all attributes.
 
@@ -356,6 +347,10 @@ class MultiFiCoKriging(object):
             if list: a list of nlevel arrays specifying value for each level
         normalize : bool, optional
             When true, normalize X and Y so that the mean is at zero.
+        num_procs : int, optional
+            Number of processes used to estimate the autocorrelation parameters of the fidelity
+            levels concurrently. The levels are only run in parallel when OpenMDAO isn't
+            running under MPI.
         """
         self.corr = squared_exponential_correlation
         self.regr = regr
@@ -365,6 +360,7 @@ class MultiFiCoKriging(object):
         self.thetaL = thetaL
         self.thetaU = thetaU
         self.normalize = normalize
+        self.num_procs = num_procs
         self.X_mean = 0
         self.X_std = 1
         self.y_mean = 0
@@ -395,13 +391,21 @@ class MultiFiCoKriging(object):
         ndarray
             Correlation matrix.
         """
-        D = self.D[lvl]
+        theta = np.asarray(theta, dtype=float).ravel()
+        if theta.size != 1 and theta.size != self.n_features:
+            raise ValueError("Length of theta must be 1 or %s" % self.n_features)
+
         n_samples = self.n_samples[lvl]
+        rows, cols = self._triu[lvl]
 
-        R = np.eye(n_samples) * (1. + NUGGET)
+        # The squared distances are computed once per fit, so each evaluation of the likelihood
+        # only needs one product with all of the autocorrelation parameters.
+        corr = np.exp(-np.dot(self._D2[lvl], np.broadcast_to(theta, self.n_features)))
 
-        corr = squareform(self.corr(theta, D))
-        R = R + corr
+        R = np.empty((n_samples, n_samples))
+        R[rows, cols] = corr
+        R[cols, rows] = corr
+        R[np.diag_indices(n_samples)] = 1. + NUGGET
 
         return R
 
@@ -447,6 +451,10 @@ class MultiFiCoKriging(object):
         self.G = nlevel * [0]
         self.sigma2 = nlevel * [0]
         self._R_adj = nlevel * [None]
+        self._D2 = nlevel * [None]
+        self._triu = nlevel * [None]
+        self._Ft = nlevel * [None]
+        self._err_t = nlevel * [None]
 
         # Training data will be normalized using statistical quantities from the low fidelity set.
         if self.normalize:
@@ -468,6 +476,8 @@ class MultiFiCoKriging(object):
             self.D[lvl] = l1_cross_distances(X[lvl])
             if (np.min(np.sum(self.D[lvl], axis=1)) == 0.):
                 raise ValueError("Multiple input features cannot have the same value.")
+            self._D2[lvl] = self.D[lvl] ** 2
+            self._triu[lvl] = np.triu_indices(n_samples[lvl], k=1)
 
             # Regression matrix and parameters
             self.F[lvl] = self.regr(X[lvl])
@@ -500,23 +510,60 @@ class MultiFiCoKriging(object):
 
         self.rlf_value = np.zeros(nlevel)
 
+        # The likelihood of each level only depends on the training data, so the autocorrelation
+        # parameters of the levels can be estimated independently.
+        optimize = [lvl for lvl in range(nlevel) if self.theta[lvl] is None]
+        for lvl, sol in zip(optimize, self._max_rlf_levels(optimize, initial_range, tol)):
+            self.theta[lvl] = sol['theta']
+
         for lvl in range(nlevel):
-            # Determine Gaussian Process model parameters
-            if self.theta[lvl] is None:
-                # Maximum Likelihood Estimation of the parameters
-                sol = self._max_rlf(lvl=lvl, initial_range=initial_range, tol=tol)
-                self.theta[lvl] = sol['theta']
-                self.rlf_value[lvl] = sol['rlf_value']
-
-                if np.isinf(self.rlf_value[lvl]):
+            # Determine Gaussian Process model parameters at the final theta
+            self.rlf_value[lvl] = self.rlf(lvl=lvl)
+            if np.isinf(self.rlf_value[lvl]):
+                if lvl in optimize:
                     raise ValueError("Bad parameter region. Try increasing upper bound")
-            else:
-                self.rlf_value[lvl] = self.rlf(lvl=lvl)
-                if np.isinf(self.rlf_value[lvl]):
-                    raise ValueError("Bad point. Try increasing theta0.")
+                raise ValueError("Bad point. Try increasing theta0.")
 
         return
 
+    def _max_rlf_levels(self, levels, initial_range, tol):
+        """
+        Estimate the autocorrelation parameters of several fidelity levels.
+
+        Parameters
+        ----------
+        levels : list of int
+            Levels of fidelity.
+        initial_range : float
+            Initial range of the optimizer.
+        tol : float
+            Optimizer terminates when the tolerance tol is reached.
+
+        Returns
+        -------
+        list of dict
+            Result of _max_rlf for each level.
+        """
+        def _estimate(lvl):
+            # report the function evaluations separately so that they're also counted when
+            # the level runs in a forked process.
+            nfev = self._nfev
+            sol = self._max_rlf(lvl=lvl, initial_range=initial_range, tol=tol)
+            count = self._nfev - nfev
+            self._nfev = nfev
+            return sol, count
+
+        results = []
+        for lvl, (retval, err) in zip(levels, fork_map(_estimate, levels, self.num_procs)):
+            if err is not None:
+                raise RuntimeError('MultiFiCoKriging: the estimation of the autocorrelation '
+                                   'parameters of level %d failed:\n%s' % (lvl, err))
+            sol, nfev = retval
+            results.append(sol)
+            self._nfev += nfev
+
+        return results
+
     def rlf(self, lvl, theta=None):
         """
         Determine BLUP parameters and evaluate negative reduced likelihood function for theta.
@@ -595,6 +642,8 @@ class MultiFiCoKriging(object):
         self.sigma2[lvl] = sigma2
         self.C[lvl] = C
         self.G[lvl] = G
+        self._Ft[lvl] = Ft
+        self._err_t[lvl] = err
 
         return rlf_value
 
@@ -627,8 +676,21 @@ class MultiFiCoKriging(object):
         thetaL = self.thetaL[lvl]
         thetaU = self.thetaU[lvl]
 
+        log10_thetaL = np.log10(thetaL[0])
+        log10_thetaU = np.log10(thetaU[0])
+        best = {'rlf_value': np.inf}
+
         def rlf_transform(x):
-            return self.rlf(theta=10.**x, lvl=lvl)
+            rlf_value = self.rlf(theta=10.**x, lvl=lvl)
+
+            # Keep the best point inside the bounds, in case the optimizer stops at a point where
+            # R isn't positive definite.
+            if rlf_value < best['rlf_value'] and np.all(x >= log10_thetaL) and \
+                    np.all(x <= log10_thetaU):
+                best['rlf_value'] = rlf_value
+                best['x'] = x.copy()
+
+            return rlf_value
 
         # Use specified starting point as first guess
         theta0 = self.theta0[lvl]
@@ -651,6 +713,10 @@ class MultiFiCoKriging(object):
         optimal_rlf_value = sol['fun']
         self._nfev += sol['nfev']
 
+        if optimal_rlf_value > best['rlf_value']:
+            log10_optimal_x = best['x']
+            optimal_rlf_value = best['rlf_value']
+
         optimal_theta = 10. ** log10_optimal_x
 
         res = {}
@@ -699,14 +765,12 @@ class MultiFiCoKriging(object):
         dx = l1_cross_distances(X, Y=self.X[0])
 
         # Get regression function and correlation
-        F = self.F[0]
         C = self.C[0]
 
         beta = self.beta[0]
-        Ft = solve_triangular(C, F, lower=True)
-        yt = solve_triangular(C, self.y[0], lower=True)
+        Ft = self._Ft[0]
         r_ = self.corr(self.theta[0], dx).reshape(n_eval, self.n_samples[0])
-        gamma = solve_triangular(C.T, yt - np.dot(Ft, beta), lower=False)
+        gamma = solve_triangular(C.T, self._err_t[0], lower=False)
 
         # Scaled predictor
         mu[:, 0] = (np.dot(f, beta) + np.dot(r_, gamma)).ravel()
@@ -723,26 +787,23 @@ class MultiFiCoKriging(object):
         # Calculate recursively kriging mean and variance at level i
         for i in range(1, nlevel):
             C = self.C[i]
-            F = self.F[i]
             g = self.rho_regr(X)
             dx = l1_cross_distances(X, Y=self.X[i])
             r_ = self.corr(self.theta[i], dx).reshape(
                 n_eval, self.n_samples[i])
             f = np.vstack((g.T * mu[:, i - 1], f0.T))
 
-            Ft = solve_triangular(C, F, lower=True)
-            yt = solve_triangular(C, self.y[i], lower=True)
+            Ft = self._Ft[i]
+            err_t = self._err_t[i]
             r_t = solve_triangular(C, r_.T, lower=True)
             G = self.G[i]
             beta = self.beta[i]
 
             # scaled predictor
-            mu[:, i] = (np.dot(f.T, beta)
-                        + np.dot(r_t.T, yt - np.dot(Ft, beta))).ravel()
+            mu[:, i] = (np.dot(f.T, beta) + np.dot(r_t.T, err_t)).ravel()
 
             if eval_MSE:
-                Q_ = (np.dot((yt - np.dot(Ft, beta)).T,
-                             yt - np.dot(Ft, beta)))[0, 0]
+                Q_ = np.dot(err_t.T, err_t)[0, 0]
                 u_ = solve_triangular(G.T, f - np.dot(Ft.T, r_t), lower=True)
                 sigma2_rho = np.dot(g,
                                     self.sigma2[
@@ -968,6 +1029,10 @@ class MultiFiCoKrigingSurrogate(MultiFiSurrogateModel):
                     desc='Optimizer terminates when the tolerance tol is reached.')
         opt.declare('initial_range', default=INITIAL_RANGE_DEFAULT,
                     desc='Initial range for the optimizer.')
+        opt.declare('num_procs', types=int, default=1, lower=1,
+                    desc='Number of processes used to estimate the autocorrelation parameters '
+                    'of the fidelity levels concurrently. The levels are only run in parallel '
+                    'when not running under MPI.')
 
     def predict(self, new_x):
         """
@@ -992,6 +1057,28 @@ class MultiFiCoKrigingSurrogate(MultiFiSurrogateModel):
         Y_pred, MSE = self.model.predict([new_x])
         return Y_pred, np.sqrt(np.abs(MSE))
 
+    def vectorized_predict(self, new_x):
+        """
+        Calculate predicted values of the response at several points at once.
+
+        Parameters
+        ----------
+        new_x : array_like
+            An array with shape (n_eval, n_features) giving the points at
+            which the predictions should be made.
+
+        Returns
+        -------
+        array_like
+            An array with shape (n_eval, 1) with the Best Linear Unbiased
+            Prediction at each point.
+        array_like
+            An array with shape (n_eval, 1) with the square root of the Mean Squared Error at
+            each point.
+        """
+        Y_pred, MSE = self.model.predict(array2d(new_x))
+        return Y_pred, np.sqrt(np.abs(MSE))
+
     def train_multifi(self, X, Y):
         """
         Train the surrogate model with the given set of inputs and outputs.
@@ -1010,7 +1097,8 @@ class MultiFiCoKrigingSurrogate(MultiFiSurrogateModel):
             self.model = MultiFiCoKriging(regr=opt['regr'], rho_regr=opt['rho_regr'],
                                           theta=opt['theta'], theta0=opt['theta0'],
                                           thetaL=opt['thetaL'], thetaU=opt['thetaU'],
-                                          normalize=opt['normalize'])
+                                          normalize=opt['normalize'],
+                                          num_procs=opt['num_procs'])
 
         X, Y = self._fit_adapter(X, Y)
         self.model.fit(X, Y, tol=opt['tolerance'],
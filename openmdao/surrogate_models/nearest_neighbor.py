@@ -5,6 +5,9 @@ https://github.com/SMarone/NDInterp
 """
 
 from collections import OrderedDict
+
+import numpy as np
+
 from openmdao.surrogate_models.surrogate_model import SurrogateModel
 from openmdao.surrogate_models.nn_interpolators.linear_interpolator import \
     LinearInterpolator
@@ -56,6 +59,19 @@ class NearestNeighbor(SurrogateModel):
                              values=['linear', 'weighted', 'rbf'],
                              desc="Type of interpolant, must be 'linear', 'weighted', or 'rbf'")
 
+    def _training_settings(self):
+        """
+        Return the settings that affect the trained state of the surrogate.
+
+        Returns
+        -------
+        dict
+            Settings keyed by name, including the arguments of the interpolant.
+        """
+        settings = super()._training_settings()
+        settings.update(self.interpolant_init_args)
+        return settings
+
     def train(self, x, y):
         """
         Train the surrogate model with the given set of inputs and outputs.
@@ -71,6 +87,22 @@ class NearestNeighbor(SurrogateModel):
         self.interpolant = _interpolators[self.options['interpolant_type']](
             x, y, **self.interpolant_init_args)
 
+    def update(self, x, y):
+        """
+        Add training points to the trained interpolant.
+
+        Parameters
+        ----------
+        x : array-like
+            Input locations of the new training points.
+        y : array-like
+            Model responses at the new training points.
+        """
+        if self.interpolant is None:
+            self.train(x, y)
+        else:
+            self.interpolant.add_points(x, y)
+
     def predict(self, x, **kwargs):
         """
         Calculate a predicted value of the response based on the current trained model.
@@ -90,6 +122,27 @@ class NearestNeighbor(SurrogateModel):
         super().predict(x)
         return self.interpolant(x, **kwargs)
 
+    def vectorized_predict(self, x, **kwargs):
+        """
+        Calculate predicted values of the response based on the current trained model.
+
+        The neighbors of all of the points are found with a single query of the tree.
+
+        Parameters
+        ----------
+        x : array-like
+            Points at which the surrogate is evaluated, with one row per point.
+        **kwargs : dict
+            Additional keyword arguments passed to the interpolant.
+
+        Returns
+        -------
+        ndarray
+            Predicted values, with one row per point.
+        """
+        super().predict(x)
+        return self.interpolant(np.atleast_2d(x), **kwargs)
+
     def linearize(self, x, **kwargs):
         """
         Calculate the jacobian of the interpolant at the requested point.
@@ -110,3 +163,21 @@ class NearestNeighbor(SurrogateModel):
         if jac.shape[0] == 1 and len(jac.shape) > 2:
             return jac[0, ...]
         return jac
+
+    def vectorized_linearize(self, x, **kwargs):
+        """
+        Calculate the jacobian of the interpolant at the requested points.
+
+        Parameters
+        ----------
+        x : array-like
+            Points at which the surrogate Jacobian is evaluated, with one row per point.
+        **kwargs : dict
+            Additional keyword arguments passed to the interpolant.
+
+        Returns
+        -------
+        ndarray
+            Jacobian of surrogate output wrt inputs, with shape (n_points, n_outputs, n_inputs).
+        """
+        return self.interpolant.gradient(np.atleast_2d(x), **kwargs)
@@ -87,7 +87,7 @@ class LinearInterpolator(NNBase):
 
         # KData query takes (data, #ofneighbors) to determine closest
         # training points to predicted data
-        ndist, nloc = self._KData.query(normalized_pts.real, points_needed)
+        ndist, nloc = self._neighbors(normalized_pts, points_needed)
 
         normal, pc = self._find_hyperplane(nloc)
 
@@ -106,8 +106,6 @@ class LinearInterpolator(NNBase):
         # Rescale to original units
         predictions = (predictions * self._tvr) + self._tvm
 
-        self._pt_cache = (normalized_pts, ndist, nloc)
-
         return predictions
 
     def gradient(self, prediciton_points):
@@ -136,16 +134,12 @@ class LinearInterpolator(NNBase):
         dims = self._indep_dims + 1
 
         # Find the neighbors
-        if self._pt_cache is not None and \
-                np.allclose(self._pt_cache[0], normPredPts):
-            ndist, nloc = self._pt_cache[1:]
-        else:
-            ndist, nloc = self._KData.query(normPredPts.real, dims)
+        ndist, nloc = self._neighbors(normPredPts, dims)
 
         normal, pc = self._find_hyperplane(nloc)
         if np.any(normal[:, -1, :]) == 0:
             return gradient
-        gradient[:] = (-normal[:, :-1, :] / normal[:, -1, :]).squeeze().T
+        gradient[:] = np.transpose(-normal[:, :-1, :] / normal[:, np.newaxis, -1, :], (0, 2, 1))
 
         grad = gradient * (self._tvr[:, np.newaxis] / self._tpr)
 
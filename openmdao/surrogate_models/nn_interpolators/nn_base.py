@@ -1,10 +1,19 @@
 """Define the NNBase class."""
 
-import numpy as np
-
+from collections import OrderedDict
+from distutils.version import LooseVersion
 from math import ceil
+
+import numpy as np
+import scipy
 from scipy.spatial import cKDTree
 
+# cKDTree.query renamed its n_jobs argument to workers in scipy 1.6.
+if LooseVersion(scipy.__version__) >= LooseVersion('1.6'):
+    _WORKERS_ARG = 'workers'
+else:
+    _WORKERS_ARG = 'n_jobs'
+
 
 class NNBase(object):
     """
@@ -38,11 +47,19 @@ class NNBase(object):
         Number of training points
     _KData : scipy.spatial.cKDTree
         KDTree used for finding the nearest neighbors.
-    _pt_cache : tuple(ndarray, ndarray, ndarray)
-        Internal cache of the last found neighbors.
+    _num_leaves : int
+        How many leaves the tree should have.
+    _num_workers : int
+        Number of threads used by the tree to find neighbors. -1 uses all of the CPUs.
+    _cache_size : int
+        Maximum number of neighbor searches kept in _neighbor_cache.
+    _neighbor_cache : OrderedDict
+        Distances and indices of the neighbors of recently queried points, keyed by the number of
+        neighbors and the normalized points, and ordered from least to most recently used.
     """
 
-    def __init__(self, training_points, training_values, num_leaves=2):
+    def __init__(self, training_points, training_values, num_leaves=2, num_workers=1,
+                 cache_size=16):
         """
         Initialize nearest neighbor interpolant by scaling input to the unit hypercube.
 
@@ -54,6 +71,11 @@ class NNBase(object):
             ndarray of shape (num_points x dependent dims) containing training output values.
         num_leaves : int
             How many leaves the tree should have.
+        num_workers : int
+            Number of threads used by the tree to find neighbors. -1 uses all of the CPUs.
+        cache_size : int
+            Maximum number of neighbor searches that are cached, so that predictions and
+            gradients at the same points share them.
         """
         # training_points and training_values are the known points and their
         # respective values which will be interpolated against.
@@ -77,8 +99,123 @@ class NNBase(object):
         self._ntpts = training_points.shape[0]
 
         # Make training data into a Tree
-        leavesz = ceil(self._ntpts / float(num_leaves))
+        self._num_leaves = num_leaves
+        self._num_workers = num_workers
+        self._cache_size = cache_size
+        self._build_tree()
+
+    def _build_tree(self):
+        """
+        Build the tree of the normalized training points and clear the neighbor cache.
+        """
+        leavesz = ceil(self._ntpts / float(self._num_leaves))
         self._KData = cKDTree(self._tp, leafsize=leavesz)
 
-        # Cache for gradients
-        self._pt_cache = None
+        # Cache of neighbor searches, shared by predictions and gradients
+        self._neighbor_cache = OrderedDict()
+
+    def _neighbors(self, normalized_pts, num_neighbors):
+        """
+        Find the nearest training points of each prediction point.
+
+        All of the points are found with one query of the tree, and the result is cached so that
+        repeated predictions and gradients at the same points don't search again.
+
+        Parameters
+        ----------
+        normalized_pts : ndarray
+            ndarray of shape (num_points x independent dims) containing normalized prediction
+            locations. Only the real part is used.
+        num_neighbors : int
+            Number of neighbors to find.
+
+        Returns
+        -------
+        ndarray
+            ndarray of shape (num_points x num_neighbors) containing the distances to the
+            neighbors, from nearest to farthest.
+        ndarray
+            ndarray of shape (num_points x num_neighbors) containing the indices of the neighbors.
+        """
+        pts = np.ascontiguousarray(normalized_pts.real)
+        key = (num_neighbors, pts.shape, pts.tobytes())
+        cache = self._neighbor_cache
+
+        if key in cache:
+            cache.move_to_end(key)
+            return cache[key]
+
+        ndist, nloc = self._KData.query(pts, num_neighbors,
+                                        **{_WORKERS_ARG: self._num_workers})
+        ndist.shape = nloc.shape = (pts.shape[0], num_neighbors)
+
+        # The cached arrays are shared between callers, so make sure none of them modify them.
+        ndist.flags.writeable = nloc.flags.writeable = False
+
+        if self._cache_size > 0:
+            cache[key] = (ndist, nloc)
+            while len(cache) > self._cache_size:
+                cache.popitem(last=False)
+
+        return ndist, nloc
+
+    def add_points(self, training_points, training_values):
+        """
+        Add training points to the interpolant.
+
+        The existing normalized training data is only rescaled if the new points extend its
+        range, and the tree is rebuilt from the normalized points.
+
+        Parameters
+        ----------
+        training_points : ndarray
+            ndarray of shape (num_new_points x independent dims) containing the new training
+            input locations.
+        training_values : ndarray
+            ndarray of shape (num_new_points x dependent dims) containing the new training
+            output values.
+        """
+        self._tpm, self._tpr, self._tp = self._extend(self._tpm, self._tpr, self._tp,
+                                                      training_points)
+        self._tvm, self._tvr, self._tv = self._extend(self._tvm, self._tvr, self._tv,
+                                                      training_values)
+        self._ntpts = self._tp.shape[0]
+
+        self._build_tree()
+
+    @staticmethod
+    def _extend(old_min, old_range, normalized, new):
+        """
+        Append new data to normalized data, updating the normalization if necessary.
+
+        Parameters
+        ----------
+        old_min : ndarray
+            Minimum in each dimension of the existing data.
+        old_range : ndarray
+            Range of each dimension of the existing data.
+        normalized : ndarray
+            Existing normalized data.
+        new : ndarray
+            New data, not normalized.
+
+        Returns
+        -------
+        ndarray
+            Minimum in each dimension of all of the data.
+        ndarray
+            Range of each dimension of all of the data.
+        ndarray
+            All of the data, normalized.
+        """
+        old_max = old_min + old_range
+        new_min = np.minimum(old_min, np.amin(new, axis=0))
+        new_max = np.maximum(old_max, np.amax(new, axis=0))
+
+        if np.all(new_min == old_min) and np.all(new_max == old_max):
+            new_range = old_range
+        else:
+            new_range = new_max - new_min
+            normalized = (normalized * old_range + old_min - new_min) / new_range
+
+        return new_min, new_range, np.vstack((normalized, (new - new_min) / new_range))
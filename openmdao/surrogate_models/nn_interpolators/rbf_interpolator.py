@@ -2,8 +2,8 @@
 
 import numpy as np
 
-from openmdao.surrogate_models.nn_interpolators.nn_base import NNBase
-from scipy.sparse import csc_matrix
+from openmdao.surrogate_models.nn_interpolators.nn_base import NNBase, _WORKERS_ARG
+from scipy.sparse import csc_matrix, csr_matrix
 from scipy.sparse.linalg import spsolve
 
 
@@ -24,7 +24,7 @@ class RBFInterpolator(NNBase):
     """
 
     def __init__(self, training_points, training_values, num_leaves=2,
-                 num_neighbors=5, rbf_family=2):
+                 num_neighbors=5, rbf_family=2, num_workers=1, cache_size=16):
         """
         Initialize all attributes.
 
@@ -42,8 +42,13 @@ class RBFInterpolator(NNBase):
             Specifies the order of the radial basis function to be used.
             <-2> uses an 11th order, <-1> uses a 9th order, and any value from <0> to <4> uses an
             order equal to <floor((dimensions-1)/2) + (3*comp) +1>.
+        num_workers : int
+            Number of threads used by the tree to find neighbors. -1 uses all of the CPUs.
+        cache_size : int
+            Maximum number of neighbor searches that are cached, so that predictions and
+            gradients at the same points share them.
         """
-        super().__init__(training_points, training_values, num_leaves)
+        super().__init__(training_points, training_values, num_leaves, num_workers, cache_size)
 
         if self._ntpts < num_neighbors:
             self._raise('RBFInterpolator only given {0} training points, '
@@ -53,15 +58,36 @@ class RBFInterpolator(NNBase):
         # rbf_family is an arbitrary value that picks a function to use
         self.rbf_family = rbf_family
 
+        self.N = num_neighbors
+        self._compute_weights()
+
+    def _compute_weights(self):
+        """
+        Compute the weights of the training points.
+        """
         # For weights, first find the training points radial neighbors
-        tdist, tloc = self._KData.query(self._tp, num_neighbors)
+        # (not cached, since predictions at the training points are rare)
+        tdist, tloc = self._KData.query(self._tp, self.N, **{_WORKERS_ARG: self._num_workers})
         Tt = tdist[:, :-1] / tdist[:, -1:]
         # Next determine weight matrix
         Rt = self._find_R(self._ntpts, Tt, tloc)
-        weights = (spsolve(csc_matrix(Rt), self._tv))[..., np.newaxis]
+        self.weights = (spsolve(csc_matrix(Rt), self._tv))[..., np.newaxis]
 
-        self.N = num_neighbors
-        self.weights = weights
+    def add_points(self, training_points, training_values):
+        """
+        Add training points to the interpolant and recompute the weights.
+
+        Parameters
+        ----------
+        training_points : ndarray
+            ndarray of shape (num_new_points x independent dims) containing the new training
+            input locations.
+        training_values : ndarray
+            ndarray of shape (num_new_points x dependent dims) containing the new training
+            output values.
+        """
+        super().add_points(training_points, training_values)
+        self._compute_weights()
 
     def _find_R(self, npp, T, neighbor_idx):
         """
@@ -71,18 +97,34 @@ class RBFInterpolator(NNBase):
         ----------
         npp : int
             Number of prediction points
-        T : int
-            Radial distance
+        T : ndarray
+            Radial distance to each neighbor, relative to the farthest one.
         neighbor_idx : ndarray
             Int array of neighbor indices.
 
         Returns
         -------
-        ndarray
-            Evaluation of RBF polynomial.
+        csr_matrix
+            Evaluation of RBF polynomial, with one row per point and one column per training point.
         """
-        R = np.zeros((npp, self._ntpts), dtype="float")
+        nn = T.shape[1]
+        return csr_matrix((self._rbf(T).ravel(), neighbor_idx[:, :-1].ravel(),
+                           np.arange(0, npp * nn + 1, nn)), shape=(npp, self._ntpts))
 
+    def _rbf(self, T):
+        """
+        Evaluate RBF polynomial at the neighbors of each point.
+
+        Parameters
+        ----------
+        T : ndarray
+            Radial distance to each neighbor, relative to the farthest one.
+
+        Returns
+        -------
+        ndarray
+            Evaluation of RBF polynomial, with the same shape as T.
+        """
         # Choose type of CRBF R matrix
         if self.rbf_family == -1:
             # Comp #1 - a
@@ -202,12 +244,7 @@ class RBFInterpolator(NNBase):
                     # Cb = (105. + (1260. * T) + (6390. * T * T) + (16620. * T * T * T) +
                     #       (19305. * T * T * T * T))
 
-        Cb = np.polyval(cb_poly, T)
-
-        for i in range(npp):
-            R[i, neighbor_idx[i, :-1]] = Cf[i, :] * Cb[i, :]
-
-        return R
+        return Cf * np.polyval(cb_poly, T)
 
     def _find_dR(self, prediction_points, neighbor_idx, neighbor_dists):
         """
@@ -380,7 +417,7 @@ class RBFInterpolator(NNBase):
         normalized_pts = (prediction_points - self._tpm) / self._tpr
         nppts = normalized_pts.shape[0]
         # Setup prediction points and find their radial neighbors
-        ndist, nloc = self._KData.query(normalized_pts, self.N)
+        ndist, nloc = self._neighbors(normalized_pts, self.N)
         # Check if complex step is being run
         if np.any(np.abs(normalized_pts[0, :].imag)) > 0:
             dimdiff = np.subtract(normalized_pts.reshape((nppts, 1, self._indep_dims)),
@@ -391,11 +428,10 @@ class RBFInterpolator(NNBase):
         # Take farthest distance of each point
         Tp = ndist[:, :-1] / ndist[:, -1:]
 
-        Rp = self._find_R(nppts, Tp, nloc)
-        predz = ((np.dot(Rp, self.weights[..., 0]) * self._tvr) +
-                 self._tvm).reshape(nppts, self._dep_dims)
-
-        self._pt_cache = (normalized_pts, ndist, nloc)
+        # Sum the contributions of the neighbors of all points at once
+        weights = self.weights[..., 0].reshape(self._ntpts, self._dep_dims)
+        wt = np.einsum('ij,ijk->ik', self._rbf(Tp), weights[nloc[:, :-1]])
+        predz = (wt * self._tvr) + self._tvm
 
         return predz
 
@@ -419,11 +455,7 @@ class RBFInterpolator(NNBase):
 
         normalized_pts = (prediction_points - self._tpm) / self._tpr
         # Setup prediction points and find their radial neighbors
-        if self._pt_cache is not None and \
-                np.allclose(self._pt_cache[0], normalized_pts):
-            pdist, ploc = self._pt_cache[1:]
-        else:
-            pdist, ploc = self._KData.query(normalized_pts, self.N)
+        pdist, ploc = self._neighbors(normalized_pts, self.N)
 
         # Find Gradient
         grad = self._find_dR(normalized_pts[:, np.newaxis, :], ploc,
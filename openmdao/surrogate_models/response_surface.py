@@ -3,8 +3,9 @@
 Surrogate Model based on second order response surface equations.
 """
 
-from numpy import zeros, einsum
+from numpy import zeros, einsum, hstack, vstack, atleast_2d, asarray
 from numpy.dual import lstsq
+from numpy.linalg import qr
 from openmdao.surrogate_models.surrogate_model import SurrogateModel
 
 
@@ -20,6 +21,11 @@ class ResponseSurface(SurrogateModel):
         Number of training points.
     n : int
         Number of independent variables.
+    _qr_r : ndarray
+        Triangular factor of the QR decomposition of the training terms and responses side by
+        side, which is all that's needed to update the least squares fit with new points.
+    _y_shape : tuple
+        Shape of the response at each training point, which is () if y was 1-D.
     """
 
     def __init__(self):
@@ -32,6 +38,8 @@ class ResponseSurface(SurrogateModel):
         self.n = 0  # number of independents
         # vector of response surface equation coefficients
         self.betas = zeros(0)
+        self._qr_r = zeros(0)
+        self._y_shape = ()
 
     def train(self, x, y):
         """
@@ -46,10 +54,56 @@ class ResponseSurface(SurrogateModel):
         """
         super().train(x, y)
 
-        m = self.m = x.shape[0]
+        self.m = x.shape[0]
         n = self.n = x.shape[1]
 
-        X = zeros((m, ((n + 1) * (n + 2)) // 2))
+        # The responses are fit as columns, and betas is given the shape of a response.
+        self._y_shape = y.shape[1:]
+        y = y.reshape((x.shape[0], -1))
+
+        # Determine response surface equation coefficients (betas) using least squares
+        self._qr_r = zeros((0, ((n + 1) * (n + 2)) // 2 + y.shape[1]))
+        self._add_points(x, y)
+
+    def update(self, x, y):
+        """
+        Add training points and update the response surface equation coefficients.
+
+        With A = QR, the least squares solution of A b = y is the least squares solution of
+        R b = Q^T y, so stacking the new rows below R and Q^T y and refactoring gives the fit to
+        all of the points at the cost of a fit to the number of coefficients plus new points.
+
+        Parameters
+        ----------
+        x : array-like
+            Input locations of the new training points.
+        y : array-like
+            Model responses at the new training points.
+        """
+        if not self.trained:
+            self.train(x, y)
+            return
+
+        x = atleast_2d(x)
+        y = asarray(y).reshape((x.shape[0], -1))
+        self.m += x.shape[0]
+        self._add_points(x, y)
+
+    def _add_points(self, x, y):
+        """
+        Add points to the QR factorization and solve for the coefficients.
+
+        Parameters
+        ----------
+        x : ndarray
+            Training input locations.
+        y : ndarray
+            Model responses at given inputs.
+        """
+        n = self.n
+        nterms = ((n + 1) * (n + 2)) // 2
+
+        X = zeros((x.shape[0], nterms))
 
         # Modify X to include constant, squared terms and cross terms
 
@@ -68,9 +122,9 @@ class ResponseSurface(SurrogateModel):
             X_offset[:, :n - i] = einsum('i,ij->ij', x[:, i], x[:, i:])
             X_offset = X_offset[:, n - i:]
 
-        # Determine response surface equation coefficients (betas) using least
-        # squares
-        self.betas, rs, r, s = lstsq(X, y)
+        self._qr_r = qr(vstack((self._qr_r, hstack((X, y)))), mode='r')
+        betas, rs, r, s = lstsq(self._qr_r[:, :nterms], self._qr_r[:, nterms:])
+        self.betas = betas.reshape((nterms, ) + self._y_shape)
 
     def predict(self, x):
         """
@@ -1,9 +1,39 @@
 """
 Class definition for SurrogateModel, the base class for all surrogate models.
 """
+import hashlib
+
+import numpy as np
+
+from openmdao import __version__
 from openmdao.utils.options_dictionary import OptionsDictionary
 
 
+def _hash_update(h, obj):
+    """
+    Update a hash with a value that may contain arrays and nested containers.
+
+    Parameters
+    ----------
+    h : hashlib hash object
+        The hash to update.
+    obj : object
+        The value. Arrays are hashed by their dtype, shape and data, and other objects that aren't
+        containers by their repr.
+    """
+    if isinstance(obj, np.ndarray):
+        h.update(f'ndarray{obj.dtype}{obj.shape}'.encode())
+        h.update(np.ascontiguousarray(obj).tobytes())
+    elif isinstance(obj, (list, tuple)):
+        h.update(f'{type(obj).__name__}{len(obj)}'.encode())
+        for item in obj:
+            _hash_update(h, item)
+    elif isinstance(obj, dict):
+        _hash_update(h, sorted(obj.items()))
+    else:
+        h.update(repr(obj).encode())
+
+
 class SurrogateModel(object):
     """
     Base class for surrogate models.
@@ -44,6 +74,19 @@ class SurrogateModel(object):
         """
         self.trained = True
 
+    def update(self, x, y):
+        """
+        Add training points to the trained model, without retraining it from scratch.
+
+        Parameters
+        ----------
+        x : array-like
+            Input locations of the new training points.
+        y : array-like
+            Model responses at the new training points.
+        """
+        pass
+
     def predict(self, x):
         """
         Calculate a predicted value of the response based on the current trained model.
@@ -80,12 +123,62 @@ class SurrogateModel(object):
         """
         pass
 
+    def vectorized_linearize(self, x):
+        """
+        Calculate the jacobians of the interpolant at the requested points.
+
+        Parameters
+        ----------
+        x : array-like
+            Vectorized point(s) at which the surrogate Jacobian is evaluated.
+        """
+        pass
+
     def _declare_options(self):
         """
         Declare options before kwargs are processed in the init method.
         """
         pass
 
+    def _training_settings(self):
+        """
+        Return the settings that affect the trained state of the surrogate.
+
+        Returns
+        -------
+        dict
+            Settings keyed by name.
+        """
+        return dict(self.options.items())
+
+    def _cache_key(self, train_method, x, y):
+        """
+        Compute a key that identifies the state of the surrogate after training on the given data.
+
+        Parameters
+        ----------
+        train_method : str
+            Name of the method used for training.
+        x : array-like or list of array-like
+            Training input locations.
+        y : array-like or list of array-like
+            Model responses at given inputs.
+
+        Returns
+        -------
+        str
+            Hash of the OpenMDAO version, the type and settings of the surrogate, and the training
+            data.
+        """
+        h = hashlib.sha256()
+        cls = type(self)
+        _hash_update(h, (__version__, cls.__module__, cls.__qualname__, train_method))
+        _hash_update(h, self._training_settings())
+        _hash_update(h, [np.asarray(a) for a in x] if isinstance(x, list) else np.asarray(x))
+        _hash_update(h, [np.asarray(a) for a in y] if isinstance(y, list) else np.asarray(y))
+
+        return h.hexdigest()
+
 
 class MultiFiSurrogateModel(SurrogateModel):
     """
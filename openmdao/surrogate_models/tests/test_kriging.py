@@ -148,5 +148,162 @@ class TestKrigingSurrogate(unittest.TestCase):
         jac = surrogate.linearize(np.array([[0.5, 0.5]]))
         assert_near_equal(jac, np.array([[1, 1], [1, -1], [1, 2]]), 5e-4)
 
+    def test_vectorized_predict(self):
+        surrogate = KrigingSurrogate(eval_rmse=True)
+
+        x = np.array([[a, b] for a, b in itertools.product(np.linspace(-5, 10, 5),
+                                                           np.linspace(0, 15, 5))])
+        y = np.array([[branin(x_i), np.sin(x_i[0])] for x_i in x])
+
+        surrogate.train(x, y)
+
+        x_new = np.array([[0.5, 2.], [3.3, 7.1], [-4.2, 12.], [9.5, 0.3]])
+        mu, sigma = surrogate.vectorized_predict(x_new)
+
+        self.assertEqual(mu.shape, (4, 2))
+        self.assertEqual(sigma.shape, (4, 2))
+
+        for i, x0 in enumerate(x_new):
+            mu0, sigma0 = surrogate.predict(x0)
+            assert_near_equal(mu[i], mu0[0], 1e-12)
+            assert_near_equal(sigma[i], sigma0[0], 1e-10)
+
+    def test_vectorized_linearize(self):
+        surrogate = KrigingSurrogate()
+
+        x = np.array([[a, b] for a, b in itertools.product(np.linspace(0, 1, 6), repeat=2)])
+        y = np.array([[np.sin(a) * b, a ** 2 - b, a + 2 * b] for a, b in x])
+
+        surrogate.train(x, y)
+
+        x_new = np.array([[0.25, 0.5], [0.7, 0.1], [0.45, 0.9]])
+        jac = surrogate.vectorized_linearize(x_new)
+
+        self.assertEqual(jac.shape, (3, 3, 2))
+
+        h = 1e-7
+        for i, x0 in enumerate(x_new):
+            assert_near_equal(jac[i], surrogate.linearize(x0), 1e-12)
+
+            fd = np.empty((3, 2))
+            for j in range(2):
+                dx = np.zeros(2)
+                dx[j] = h
+                fd[:, j] = (surrogate.predict(x0 + dx)[0] - surrogate.predict(x0 - dx)[0]) / (2 * h)
+            assert_near_equal(jac[i], fd, 1e-5)
+
+    def test_cholesky_training(self):
+        surrogate = KrigingSurrogate(training_method='cholesky', eval_rmse=True)
+
+        x = np.array([[a, b] for a, b in itertools.product(np.linspace(-5, 10, 6),
+                                                           np.linspace(0, 15, 6))])
+        y = np.array([[branin(x_i)] for x_i in x])
+
+        surrogate.train(x, y)
+
+        self.assertIsNotNone(surrogate.L)
+        self.assertIsNone(surrogate.U)
+
+        mu, sigma = surrogate.vectorized_predict(x)
+        assert_near_equal(mu, y, 1e-5)
+        self.assertLess(np.max(sigma), 1e-2)
+
+        # Away from the training points, the prediction is close to the one from the default
+        # SVD based training.
+        svd_surrogate = KrigingSurrogate()
+        svd_surrogate.train(x, y)
+
+        assert_near_equal(surrogate.predict([5., 5.])[0], svd_surrogate.predict([5., 5.]), 1e-2)
+
+    def test_cholesky_likelihood_gradient(self):
+        surrogate = KrigingSurrogate(training_method='cholesky')
+
+        x = np.array([[a, b] for a, b in itertools.product(np.linspace(0, 1, 5), repeat=2)])
+        y = np.array([[np.sin(3 * a) + b ** 2, a * b] for a, b in x])
+
+        surrogate.train(x, y)
+
+        log_thetas = np.log([0.3, 2.])
+        _, grad = surrogate._neg_reduced_likelihood(log_thetas)
+
+        h = 1e-6
+        fd = np.empty(2)
+        for i in range(2):
+            step = np.zeros(2)
+            step[i] = h
+            fd[i] = (surrogate._neg_reduced_likelihood(log_thetas + step)[0] -
+                     surrogate._neg_reduced_likelihood(log_thetas - step)[0]) / (2 * h)
+
+        assert_near_equal(grad, fd, 1e-6)
+
+    def test_multistart(self):
+        x = np.array([[a, b] for a, b in itertools.product(np.linspace(0, 1, 5), repeat=2)])
+        y = np.array([[np.sin(3 * a) + b ** 2] for a, b in x])
+
+        serial = KrigingSurrogate(training_method='cholesky', num_starts=3, seed=11)
+        serial.train(x, y)
+
+        parallel = KrigingSurrogate(training_method='cholesky', num_starts=3, num_procs=2,
+                                    seed=11)
+        parallel.train(x, y)
+
+        assert_near_equal(parallel.thetas, serial.thetas, 1e-12)
+
+        # The best start is at least as good as the default start alone.
+        single = KrigingSurrogate(training_method='cholesky')
+        single.train(x, y)
+
+        self.assertLessEqual(serial._neg_reduced_likelihood(np.log(serial.thetas))[0],
+                             single._neg_reduced_likelihood(np.log(single.thetas))[0] + 1e-12)
+
+    def test_update(self):
+        x = np.array([[a, b] for a, b in itertools.product(np.linspace(0, 1, 5), repeat=2)])
+        y = np.array([[np.sin(3 * a) + b ** 2, a * b] for a, b in x])
+        x_new = np.array([[0.1, 0.35], [0.6, 0.9], [0.85, 0.15]])
+        y_new = np.array([[np.sin(3 * a) + b ** 2, a * b] for a, b in x_new])
+
+        for method in ['svd', 'cholesky']:
+            surrogate = KrigingSurrogate(training_method=method, eval_rmse=True, drift_tol=None,
+                                         nugget=1e-6)
+            surrogate.train(x, y)
+            thetas = surrogate.thetas.copy()
+
+            surrogate.update(x_new, y_new)
+
+            # The hyperparameters are reused, and the updated model matches one factored from
+            # scratch with them.
+            assert_near_equal(surrogate.thetas, thetas, 1e-15)
+            self.assertEqual(surrogate.n_samples, 28)
+
+            _, params = surrogate._calculate_reduced_likelihood_params()
+            assert_near_equal(surrogate.alpha, params['alpha'], 1e-8)
+            assert_near_equal(surrogate.sigma2, params['sigma2'], 1e-8)
+            if method == 'cholesky':
+                assert_near_equal(surrogate.L, params['L'], 1e-10)
+
+            mu, sigma = surrogate.vectorized_predict(x_new)
+            assert_near_equal(mu, y_new, 1e-3)
+            self.assertLess(np.max(sigma), 1e-2)
+
+    def test_update_drift(self):
+        x = np.array([[a, b] for a, b in itertools.product(np.linspace(0, 1, 5), repeat=2)])
+        y = np.array([[a + b] for a, b in x])
+
+        surrogate = KrigingSurrogate(training_method='cholesky')
+        surrogate.train(x, y)
+        thetas = surrogate.thetas.copy()
+
+        # Points consistent with the model keep the hyperparameters.
+        x_new = np.array([[0.1, 0.35], [0.6, 0.9]])
+        surrogate.update(x_new, x_new.sum(axis=1, keepdims=True))
+        assert_near_equal(surrogate.thetas, thetas, 1e-15)
+
+        # Points that the model can't predict cause retraining.
+        x_new = np.array([[0.3, 0.4], [0.7, 0.2], [0.45, 0.55]])
+        surrogate.update(x_new, np.sin(40. * x_new[:, :1]))
+        self.assertFalse(np.allclose(surrogate.thetas, thetas))
+        self.assertEqual(surrogate.n_samples, 30)
+
+
 if __name__ == "__main__":
     unittest.main()
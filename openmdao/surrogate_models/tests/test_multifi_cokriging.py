@@ -1,9 +1,22 @@
+import multiprocessing
 import unittest
 
 import numpy as np
+from scipy.spatial.distance import pdist, squareform
 
 from openmdao.api import MultiFiCoKrigingSurrogate
+from openmdao.surrogate_models.multifi_cokriging import MultiFiCoKriging, l1_cross_distances
 from openmdao.utils.assert_utils import assert_near_equal
+from openmdao.utils.mpi import MPI
+
+
+def _three_fidelity_data():
+    rng = np.random.RandomState(11)
+    x = [rng.rand(40, 2)]
+    x.append(x[0][-20:])
+    x.append(x[0][-8:])
+    y = [np.sin(3. * xi[:, 0]) * (1. + 0.2 * lvl) + xi[:, 1] ** lvl for lvl, xi in enumerate(x)]
+    return x, y
 
 
 class CoKrigingSurrogateTest(unittest.TestCase):
@@ -308,5 +321,67 @@ class CoKrigingSurrogateTest(unittest.TestCase):
         self.assertEqual(str(cm.exception), expected)
 
 
+class MultiFiCoKrigingTest(unittest.TestCase):
+
+    def test_distances(self):
+        rng = np.random.RandomState(0)
+        x = rng.rand(7, 3)
+        y = rng.rand(4, 3)
+
+        D = l1_cross_distances(x)
+        for i in range(3):
+            assert_near_equal(D[:, i], pdist(x[:, i:i + 1], 'cityblock'), 1e-15)
+
+        D = l1_cross_distances(x, y)
+        self.assertEqual(D.shape, (28, 3))
+        assert_near_equal(D[5], np.abs(x[1] - y[1]), 1e-15)
+
+    def test_build_R(self):
+        x, y = _three_fidelity_data()
+        model = MultiFiCoKriging(theta=[np.array([0.3, 2.]), 0.5, np.array([1., 4.])])
+        model.fit(x, y)
+
+        for lvl, xi in enumerate(model.X):
+            theta = model.theta[lvl].ravel()
+            expected = squareform(np.exp(-pdist(xi, 'sqeuclidean', w=np.broadcast_to(theta, 2))))
+            expected += np.eye(len(xi)) * (1. + 10. * np.finfo(float).eps)
+
+            assert_near_equal(model._build_R(lvl, theta), expected, 1e-14)
+
+    @unittest.skipUnless(MPI is None and 'fork' in multiprocessing.get_all_start_methods(),
+                         "Parallel levels require fork and no MPI.")
+    def test_parallel_levels(self):
+        x, y = _three_fidelity_data()
+
+        serial = MultiFiCoKriging(theta0=np.array([0.5, 0.5]))
+        serial.fit([xi.copy() for xi in x], [yi.copy() for yi in y])
+
+        parallel = MultiFiCoKriging(theta0=np.array([0.5, 0.5]), num_procs=3)
+        parallel.fit([xi.copy() for xi in x], [yi.copy() for yi in y])
+
+        self.assertEqual(parallel._nfev, serial._nfev)
+        assert_near_equal(parallel.rlf_value, serial.rlf_value, 1e-12)
+        for lvl in range(3):
+            assert_near_equal(parallel.theta[lvl], serial.theta[lvl], 1e-12)
+
+        x_new = np.array([[0.2, 0.7], [0.9, 0.1]])
+        assert_near_equal(parallel.predict(x_new), serial.predict(x_new), 1e-12)
+
+    def test_vectorized_predict(self):
+        x, y = _three_fidelity_data()
+        cokrig = MultiFiCoKrigingSurrogate()
+        cokrig.train_multifi(x[::-1], y[::-1])
+
+        x_new = np.array([[0.2, 0.7], [0.9, 0.1], [0.5, 0.5]])
+        mu, sigma = cokrig.vectorized_predict(x_new)
+
+        self.assertEqual(mu.shape, (3, 1))
+        self.assertEqual(sigma.shape, (3, 1))
+        for i, x0 in enumerate(x_new):
+            mu0, sigma0 = cokrig.predict(x0)
+            assert_near_equal(mu[i], mu0[0], 1e-6)
+            assert_near_equal(sigma[i], sigma0[0], 1e-6)
+
+
 if __name__ == "__main__":
     unittest.main()
@@ -15,6 +15,65 @@ class TestNearestNeighbor(unittest.TestCase):
                        "['linear', 'weighted', 'rbf']."
         self.assertEqual(expected_msg, str(cm.exception))
 
+    def test_update(self):
+        x = np.array([[a, b] for a in np.linspace(0., 1., 6) for b in np.linspace(0., 2., 5)])
+        y = np.array([[np.sin(3 * a) + b, a * b] for a, b in x])
+        test_x = np.array([[0.15, 0.45], [0.55, 1.25], [0.9, 1.9], [1.3, -0.2]])
+
+        # The first points don't span the full range, so the normalization changes.
+        first = (x[:, 0] < 0.7) & (x[:, 1] < 1.5)
+
+        for interpolant_type in ['linear', 'weighted', 'rbf']:
+            surrogate = NearestNeighbor(interpolant_type=interpolant_type)
+            surrogate.train(x[first], y[first])
+            surrogate.predict(test_x[0])
+            surrogate.update(x[~first], y[~first])
+
+            expected = NearestNeighbor(interpolant_type=interpolant_type)
+            expected.train(np.vstack((x[first], x[~first])), np.vstack((y[first], y[~first])))
+
+            for x0 in test_x:
+                assert_near_equal(surrogate.predict(x0), expected.predict(x0), 1e-10)
+                assert_near_equal(surrogate.linearize(x0), expected.linearize(x0), 1e-10)
+
+    def test_vectorized(self):
+        x = np.array([[a, b] for a in np.linspace(0., 1., 6) for b in np.linspace(0., 2., 5)])
+        y = np.array([[np.sin(3 * a) + b, a * b] for a, b in x])
+        test_x = np.array([[0.15, 0.3], [0.55, 1.7], [0.9, 0.9]])
+
+        for interpolant_type in ('linear', 'weighted', 'rbf'):
+            surrogate = NearestNeighbor(interpolant_type=interpolant_type, num_workers=-1)
+            surrogate.train(x, y)
+
+            mu = surrogate.vectorized_predict(test_x)
+            jac = surrogate.vectorized_linearize(test_x)
+
+            self.assertEqual(mu.shape, (3, 2))
+            self.assertEqual(jac.shape, (3, 2, 2))
+
+            for x0, mu0, jac0 in zip(test_x, mu, jac):
+                assert_near_equal(surrogate.predict(x0.copy()), [mu0], 1e-12)
+                assert_near_equal(surrogate.linearize(x0.copy()), jac0, 1e-12)
+
+    def test_neighbor_cache(self):
+        x = np.linspace(0., 1., 11)[:, np.newaxis]
+        surrogate = NearestNeighbor(interpolant_type='rbf', num_neighbors=3, cache_size=2)
+        surrogate.train(x, x**2)
+        interpolant = surrogate.interpolant
+
+        surrogate.predict(np.array([[0.25]]))
+        surrogate.predict(np.array([[0.45]]))
+        surrogate.linearize(np.array([[0.25]]))
+        surrogate.predict(np.array([[0.65]]))
+
+        # The least recently used search was dropped.
+        cached = [np.frombuffer(key[2])[0] for key in interpolant._neighbor_cache]
+        self.assertEqual(cached, [0.25, 0.65])
+
+        # Adding training points clears the cache.
+        surrogate.update(np.array([[1.2]]), np.array([[1.44]]))
+        self.assertEqual(len(interpolant._neighbor_cache), 0)
+
 
 class TestLinearInterpolator1D(unittest.TestCase):
     def setUp(self):
@@ -136,6 +136,44 @@ class TestResponseSurfaceSurrogate(unittest.TestCase):
         jac = surrogate.linearize(array([[0.5, 0.5]]))
         assert_near_equal(jac, array([[1, 1], [1, -1]]), 1e-5)
 
+    def test_update(self):
+        x = array([[a, b] for a, b in itertools.product(linspace(-1, 1, 4), repeat=2)])
+        y = array([[branin(case), a * b] for case, (a, b) in zip(x, x)])
+
+        surrogate = ResponseSurface()
+        surrogate.train(x[:3], y[:3])
+        surrogate.update(x[3:9], y[3:9])
+        surrogate.update(x[9:], y[9:])
+
+        expected = ResponseSurface()
+        expected.train(x, y)
+
+        self.assertEqual(surrogate.m, 16)
+        assert_near_equal(surrogate.betas, expected.betas, 1e-10)
+
+    def test_1d_y(self):
+        x = array([[0.0], [2.0], [3.0], [4.0], [6.0]])
+        y = array([branin_1d(case) for case in x])
+
+        surrogate = ResponseSurface()
+        surrogate.train(x, y)
+
+        # A 1-D y gives 1-D coefficients and scalar predictions.
+        self.assertEqual(surrogate.betas.shape, (3, ))
+        assert_near_equal(surrogate.predict(array([pi])), 1.73114, 1e-4)
+
+        expected = ResponseSurface()
+        expected.train(x, y.reshape((-1, 1)))
+        assert_near_equal(surrogate.betas, expected.betas[:, 0], 1e-10)
+
+        # So do updates with 1-D responses.
+        surrogate = ResponseSurface()
+        surrogate.train(x[:2], y[:2])
+        surrogate.update(x[2:], y[2:])
+
+        self.assertEqual(surrogate.m, 5)
+        assert_near_equal(surrogate.betas, expected.betas[:, 0], 1e-10)
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -1,16 +1,18 @@
 """
-Utilities for submitting function evaluations under MPI.
+Utilities for submitting function evaluations under MPI or in forked processes.
 """
 import os
+import multiprocessing
+import queue
 import traceback
 from itertools import chain, islice
 
-from openmdao.utils.mpi import debug
+from openmdao.utils.mpi import MPI, debug
 
 trace = os.environ.get('OPENMDAO_TRACE')
 
 
-def concurrent_eval_lb(func, cases, comm, broadcast=False):
+def concurrent_eval_lb(func, cases, comm, broadcast=False, model_mpi=None, callback=None):
     """
     Evaluate function on multiple processors with load balancing.
 
@@ -18,6 +20,14 @@ def concurrent_eval_lb(func, cases, comm, broadcast=False):
     rank (0) sending a new case to each worker rank as soon as it
     has finished its last case.
 
+    If the function runs in parallel, each group of ranks that runs one case is a worker, and
+    the master sends every case to all ranks in the group. The other ranks in the master's group
+    only run cases if there are no other groups. Results are returned in the order in which the
+    cases finished.
+
+    Cases are only taken from the cases iterator when there is a worker to run them, so a
+    generator can create each case based on the results that have been received so far.
+
     Parameters
     ----------
     func : function
@@ -32,23 +42,38 @@ def concurrent_eval_lb(func, cases, comm, broadcast=False):
         If True, the results will be broadcast out to the worker procs so
         that the return value of concurrent_eval_lb will be the full result
         list in every process.
+    model_mpi : None or tuple
+        If the function in func runs in parallel, then this will be a tuple containing the total
+        number of cases to evaluate concurrently, and the color of the cases to evaluate on this
+        rank. Ranks are assumed to be assigned to colors as rank % size.
+    callback : function or None
+        If not None, this is called on rank 0 with the return value and the traceback of each
+        case as soon as the case has finished, before the next case is taken from cases.
 
     Returns
     -------
     object
         Return from function.
     """
-    if comm is not None:
+    if comm is not None and comm.size > 1:
+        if model_mpi is not None:
+            size, color = model_mpi
+        else:
+            size, color = comm.size, comm.rank
+
         if comm.rank == 0:  # master rank
             if trace:
                 debug('Running Master Rank')
-            results = _concurrent_eval_lb_master(cases, comm)
+            groups = [list(range(c, comm.size, size)) for c in range(size)]
+            results = _concurrent_eval_lb_master(cases, comm, func, groups[1:], groups[0][1:],
+                                                 callback)
             if trace:
                 debug('Master Rank Complete')
         else:
             if trace:
                 debug('Running Worker Rank %d' % comm.rank)
-            results = _concurrent_eval_lb_worker(func, comm)
+            # Only the lowest rank in each group reports back to the master.
+            results = _concurrent_eval_lb_worker(func, comm, reply=comm.rank < size)
             if trace:
                 debug('Running Worker Rank %d Complete' % comm.rank)
 
@@ -57,23 +82,16 @@ def concurrent_eval_lb(func, cases, comm, broadcast=False):
 
     else:  # serial execution
         results = []
-        for args, kwargs in cases:
-            try:
-                if kwargs:
-                    retval = func(*args, **kwargs)
-                else:
-                    retval = func(*args)
-            except Exception:
-                err = traceback.format_exc()
-                retval = None
-            else:
-                err = None
-            results.append((retval, err))
+        for case in cases:
+            results.append(_eval_case(func, case))
+            if callback is not None:
+                callback(*results[-1])
 
     return results
 
 
-def _concurrent_eval_lb_master(cases, comm):
+def _concurrent_eval_lb_master(cases, comm, func=None, groups=None, master_group=(),
+                               callback=None):
     """
     Coordinate worker processes.
 
@@ -88,6 +106,16 @@ def _concurrent_eval_lb_master(cases, comm):
     comm : MPI communicator or None
         The MPI communicator that is shared between the master and workers.
         If None, the function will be executed serially.
+    func : function or None
+        The function to execute on the master when there are no worker groups.
+    groups : list of list of int or None
+        Ranks in each worker group, lowest rank first. If None, every rank except the master is
+        a worker.
+    master_group : collection of int
+        Ranks other than the master that run cases together with the master.
+    callback : function or None
+        If not None, this is called with the return value and the traceback of each case as soon
+        as the case has finished.
 
     Returns
     -------
@@ -99,10 +127,24 @@ def _concurrent_eval_lb_master(cases, comm):
 
     results = []
 
+    if groups is None:
+        groups = [[rank] for rank in range(1, comm.size)]
+
     case_iter = iter(cases)
 
+    # With no workers, the master's group runs all of the cases.
+    if not groups:
+        for case in case_iter:
+            for rank in master_group:
+                comm.send(case, rank, tag=1)
+            results.append(_eval_case(func, case))
+            if callback is not None:
+                callback(*results[-1])
+
+    members = {group[0]: group for group in groups}
+
     # seed the workers
-    for i in range(1, comm.size):
+    for i, group in members.items():
         try:
             case = next(case_iter)
         except StopIteration:
@@ -110,7 +152,8 @@ def _concurrent_eval_lb_master(cases, comm):
 
         if trace:
             debug('Master sending case', i)
-        comm.send(case, i, tag=1)
+        for rank in group:
+            comm.send(case, rank, tag=1)
         if trace:
             debug('Master sent case', i)
         sent += 1
@@ -125,11 +168,8 @@ def _concurrent_eval_lb_master(cases, comm):
 
             # store results
             results.append((retval, err))
-
-            # don't stop until we hear back from every worker process
-            # we sent a case to
-            if received == sent:
-                break
+            if callback is not None:
+                callback(retval, err)
 
             try:
                 case = next(case_iter)
@@ -137,9 +177,15 @@ def _concurrent_eval_lb_master(cases, comm):
                 pass
             else:
                 # send new case to the last worker that finished
-                comm.send(case, worker, tag=1)
+                for rank in members[worker]:
+                    comm.send(case, rank, tag=1)
                 sent += 1
 
+            # don't stop until we hear back from every worker process
+            # we sent a case to
+            if received == sent:
+                break
+
     # tell all workers to stop
     for rank in range(1, comm.size):
         comm.send((None, None), rank, tag=1)
@@ -147,7 +193,7 @@ def _concurrent_eval_lb_master(cases, comm):
     return results
 
 
-def _concurrent_eval_lb_worker(func, comm):
+def _concurrent_eval_lb_worker(func, comm, reply=True):
     while True:
         # wait on a case from the master
         if trace:
@@ -159,19 +205,43 @@ def _concurrent_eval_lb_worker(func, comm):
         if args is None:  # we're done
             break
 
-        try:
-            if kwargs:
-                retval = func(*args, **kwargs)
-            else:
-                retval = func(*args)
-        except Exception:
-            err = traceback.format_exc()
-            retval = None
-        else:
-            err = None
+        retval, err = _eval_case(func, (args, kwargs))
 
         # tell the master we're done with that case
-        comm.send((comm.rank, retval, err), 0, tag=2)
+        if reply:
+            comm.send((comm.rank, retval, err), 0, tag=2)
+
+
+def _eval_case(func, case):
+    """
+    Evaluate a single case, trapping any exception.
+
+    Parameters
+    ----------
+    func : function
+        The function to execute.
+    case : tuple
+        Function args of the form (args, kwargs), where kwargs is allowed to be None.
+
+    Returns
+    -------
+    tuple
+        Return value of the function (or None if it failed) and the traceback of the
+        exception (or None if it succeeded).
+    """
+    args, kwargs = case
+    try:
+        if kwargs:
+            retval = func(*args, **kwargs)
+        else:
+            retval = func(*args)
+    except Exception:
+        err = traceback.format_exc()
+        retval = None
+    else:
+        err = None
+
+    return retval, err
 
 
 def concurrent_eval(func, cases, comm, allgather=False, model_mpi=None):
@@ -217,18 +287,7 @@ def concurrent_eval(func, cases, comm, allgather=False, model_mpi=None):
             it = islice(cases, rank, None, comm.size)
 
     for args, kwargs in it:
-        try:
-            if kwargs:
-                retval = func(*args, **kwargs)
-            else:
-                retval = func(*args)
-        except Exception:
-            err = traceback.format_exc()
-            retval = None
-        else:
-            err = None
-
-        results.append((retval, err))
+        results.append(_eval_case(func, (args, kwargs)))
 
     if comm is not None:
         if allgather:
@@ -252,3 +311,129 @@ def concurrent_eval(func, cases, comm, allgather=False, model_mpi=None):
                 results = None
 
     return results
+
+
+def fork_available():
+    """
+    Return True if function evaluations can be run in forked processes.
+
+    Forking a process that has initialized MPI isn't safe, so this is False under MPI.
+
+    Returns
+    -------
+    bool
+        True if forked processes can be used.
+    """
+    return MPI is None and 'fork' in multiprocessing.get_all_start_methods()
+
+
+def fork_imap(func, items, nprocs, initializer=None):
+    """
+    Evaluate a function on each item in forked worker processes, as the results are needed.
+
+    The workers are forked when the first result is requested, so they inherit the state of this
+    process at that point, including func itself. Items are taken from the iterator only when
+    there is room for them in the queue of the workers, so a generator of items is never
+    expanded all at once. If nprocs is less than 2 or fork_available() is False, the items are
+    evaluated in this process instead.
+
+    Parameters
+    ----------
+    func : function
+        The function to evaluate. It is called with a single item.
+    items : iter
+        Items to evaluate. They must be picklable.
+    nprocs : int
+        Number of worker processes.
+    initializer : function or None
+        If not None, this is called with the rank of each forked worker before it evaluates any
+        items. It isn't called when the items are evaluated in this process.
+
+    Yields
+    ------
+    int
+        Index of the item in items.
+    object
+        Return value of the function (or None if it failed).
+    str or None
+        Traceback of the exception (or None if it succeeded).
+    """
+    if nprocs < 2 or not fork_available():
+        for i, item in enumerate(items):
+            yield (i, ) + _eval_case(func, ((item, ), None))
+        return
+
+    ctx = multiprocessing.get_context('fork')
+    tasks = ctx.Queue()
+    results = ctx.Queue()
+
+    def _worker(rank):
+        if initializer is not None:
+            initializer(rank)
+        for i, item in iter(tasks.get, None):
+            results.put((i, ) + _eval_case(func, ((item, ), None)))
+
+    procs = [ctx.Process(target=_worker, args=(rank, )) for rank in range(nprocs)]
+    for proc in procs:
+        proc.daemon = True
+        proc.start()
+
+    case_iter = enumerate(items)
+
+    try:
+        # keep two items queued for each worker so that none of them wait for the next one
+        pending = 0
+        for case in islice(case_iter, 2 * nprocs):
+            tasks.put(case)
+            pending += 1
+
+        while pending > 0:
+            try:
+                result = results.get(timeout=1.0)
+            except queue.Empty:
+                if any(proc.exitcode not in (None, 0) for proc in procs):
+                    raise RuntimeError("A forked worker process exited unexpectedly.")
+                continue
+
+            pending -= 1
+            case = next(case_iter, None)
+            if case is not None:
+                tasks.put(case)
+                pending += 1
+
+            yield result
+    finally:
+        for proc in procs:
+            tasks.put(None)
+        for proc in procs:
+            proc.join(timeout=1.0)
+            if proc.is_alive():
+                proc.terminate()
+
+
+def fork_map(func, items, nprocs):
+    """
+    Evaluate a function on each item in forked worker processes.
+
+    Parameters
+    ----------
+    func : function
+        The function to evaluate. It is called with a single item.
+    items : iter
+        Items to evaluate. They must be picklable.
+    nprocs : int
+        Maximum number of worker processes. See fork_imap.
+
+    Returns
+    -------
+    list
+        Return value of the function (or None if it failed) and the traceback of the exception
+        (or None if it succeeded) for each item, in the order of items.
+    """
+    items = list(items)
+    results = [None] * len(items)
+
+    for i, retval, err in fork_imap(func, items, min(nprocs, len(items))):
+        results[i] = (retval, err)
+
+    return results
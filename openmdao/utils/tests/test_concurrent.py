@@ -0,0 +1,67 @@
+import os
+import unittest
+
+from openmdao.utils.concurrent import fork_available, fork_imap, fork_map
+
+
+def _square(x):
+    if x < 0:
+        raise ValueError('negative')
+    return x * x, os.getpid()
+
+
+class TestForkMap(unittest.TestCase):
+
+    def test_serial(self):
+        results = fork_map(_square, [1, 2, -3, 4], 1)
+
+        self.assertEqual([retval for retval, _ in results], [(1, os.getpid()), (4, os.getpid()),
+                                                             None, (16, os.getpid())])
+        self.assertEqual([err is None for _, err in results], [True, True, False, True])
+        self.assertIn('ValueError: negative', results[2][1])
+
+    @unittest.skipUnless(fork_available(), "fork is not available.")
+    def test_forked(self):
+        results = fork_map(_square, range(-1, 9), 3)
+
+        self.assertEqual(results[0][0], None)
+        self.assertIn('ValueError: negative', results[0][1])
+        self.assertEqual([retval[0] for retval, _ in results[1:]], [x * x for x in range(9)])
+
+        # The items were run in other processes.
+        pids = {retval[1] for retval, _ in results[1:]}
+        self.assertNotIn(os.getpid(), pids)
+
+    @unittest.skipUnless(fork_available(), "fork is not available.")
+    def test_imap_generator(self):
+        ranks = []
+
+        def initializer(rank):
+            ranks.append(rank)
+
+        def items():
+            for x in range(20):
+                yield x
+
+        results = sorted(fork_imap(lambda x: ranks[0] * 100 + x, items(), 2,
+                                   initializer=initializer))
+
+        self.assertEqual([i for i, _, _ in results], list(range(20)))
+        for i, retval, err in results:
+            self.assertEqual(retval % 100, i)
+            self.assertIn(retval // 100, (0, 1))
+            self.assertIsNone(err)
+
+        # The initializer only ran in the workers.
+        self.assertEqual(ranks, [])
+
+    @unittest.skipUnless(fork_available(), "fork is not available.")
+    def test_worker_exit(self):
+        with self.assertRaises(RuntimeError) as cm:
+            fork_map(os._exit, [1, 2], 2)
+
+        self.assertEqual(str(cm.exception), "A forked worker process exited unexpectedly.")
+
+
+if __name__ == '__main__':
+    unittest.main()